@@ -5,53 +5,21 @@ path = 'c:/AntiGravity_Repo/Thesis-2-Quantum-Inspired/my-app/app/LandingPages/Li
 with open(path, 'r', encoding='utf-8') as f:
     text = f.read()
 
-# Fix the Admin Create Makeup Modal
-text = text.replace(
-'''                </div>
-                </div>
-    )
-}
-
-{/* ── Admin Create Makeup Modal ── */ }
-{
-    creatingMakeup && (''',
-'''                </div>
-            )}
-
-            {/* ── Admin Create Makeup Modal ── */}
-            {creatingMakeup && ('''
+# Fix the modal headers (Admin Create Makeup, Makeup Review, Absence Review) in one pass
+MODAL_HEADER_PATTERN = re.compile(
+    r"(?:                </div>\n                </div>|        </div>)\n"
+    r"    \)\n\}\n\n"
+    r"\{/\* ── (.+?) Modal ── \*/ \}\n"
+    r"\{\n    (\w+) && \("
 )
-
-# Fix Makeup Review Modal
-text = text.replace(
-'''        </div>
-    )
-}
-
-{/* ── Makeup Review Modal ── */ }
-{
-    reviewingMakeup && (''',
-'''                </div>
-            )}
-
-            {/* ── Makeup Review Modal ── */}
-            {reviewingMakeup && ('''
-)
-
-# Fix Absence Review Modal
-text = text.replace(
-'''        </div>
-    )
-}
-
-{/* ── Absence Review Modal ── */ }
-{
-    reviewingAbsence && (''',
-'''                </div>
-            )}
-
-            {/* ── Absence Review Modal ── */}
-            {reviewingAbsence && ('''
+text = MODAL_HEADER_PATTERN.sub(
+    lambda m: (
+        "                </div>\n"
+        "            )}\n\n"
+        f"            {{/* ── {m.group(1)} Modal ── */}}\n"
+        f"            {{{m.group(2)} && ("
+    ),
+    text
 )
 
 # Fix the trailing div
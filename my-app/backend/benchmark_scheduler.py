@@ -8,8 +8,15 @@ import copy
 import json
 import statistics
 import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
 
 from scheduler_v2 import run_enhanced_scheduler
 
@@ -63,6 +70,15 @@ def _run_once(payload: Dict[str, Any], iterations: int, trials: int) -> Dict[str
     }
 
 
+def _run_profiles(payload: Dict[str, Any], iteration_grid: List[int], trials: int, workers: int) -> List[Dict[str, Any]]:
+    """Run independent iteration profiles, one worker process each when workers > 1."""
+    if workers <= 1 or len(iteration_grid) <= 1:
+        return [_run_once(payload, iterations, trials) for iterations in iteration_grid]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(iteration_grid))) as executor:
+        return list(executor.map(_run_once, repeat(payload), iteration_grid, repeat(trials)))
+
+
 def _print_profile(name: str, row: Dict[str, Any]) -> None:
     print(f"\n[{name}]")
     print(f"  iterations_requested: {row['iterations_requested']}")
@@ -84,20 +100,64 @@ def _print_profile(name: str, row: Dict[str, Any]) -> None:
     print(f"  block_swaps: {row['block_swaps']}")
 
 
+def _write_report(summary: Dict[str, Any], output: Optional[str]) -> None:
+    if not output:
+        return
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        output_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    print(f"\nSaved benchmark report to: {output_path}")
+
+
+def _run_sweep(
+    payload_path: Path, payload: Dict[str, Any], grid: str, trials: int, workers: int, output: Optional[str]
+) -> None:
+    """Run every iteration profile in one invocation so the payload and imports are loaded once."""
+    iteration_grid = [int(value) for value in grid.split(",") if value.strip()]
+    profiles = _run_profiles(payload, iteration_grid, trials, workers)
+
+    print("\n=== Scheduler Benchmark Sweep ===")
+    for row in profiles:
+        _print_profile(f"iterations={row['iterations_requested']}", row)
+
+    _write_report({"payload": str(payload_path), "sweep": profiles}, output)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Benchmark scheduler_v2 on one payload with two iteration profiles")
     parser.add_argument("--payload", required=True, help="Path to benchmark payload JSON")
     parser.add_argument("--baseline-iterations", type=int, default=1500, help="Baseline max_iterations")
     parser.add_argument("--optimized-iterations", type=int, default=6000, help="Optimized max_iterations")
     parser.add_argument("--trials", type=int, default=2, help="Trials per profile")
+    parser.add_argument(
+        "--sweep-iterations",
+        help="Comma-separated max_iterations grid (e.g. 500,1500,6000); runs every profile instead of baseline/optimized",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Run profiles in parallel worker processes (wall times then include CPU contention)",
+    )
     parser.add_argument("--output", help="Optional path to write JSON report")
     args = parser.parse_args()
 
     payload_path = Path(args.payload)
-    payload = json.loads(payload_path.read_text(encoding="utf-8"))
+    if orjson is not None:
+        payload = orjson.loads(payload_path.read_bytes())
+    else:
+        payload = json.loads(payload_path.read_text(encoding="utf-8"))
+
+    if args.sweep_iterations:
+        _run_sweep(payload_path, payload, args.sweep_iterations, args.trials, args.workers, args.output)
+        return
 
-    baseline = _run_once(payload, args.baseline_iterations, args.trials)
-    optimized = _run_once(payload, args.optimized_iterations, args.trials)
+    baseline, optimized = _run_profiles(
+        payload, [args.baseline_iterations, args.optimized_iterations], args.trials, args.workers
+    )
 
     summary = {
         "payload": str(payload_path),
@@ -120,11 +180,7 @@ def main() -> None:
     for key, value in summary["delta"].items():
         print(f"  {key}: {value}")
 
-    if args.output:
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-        print(f"\nSaved benchmark report to: {output_path}")
+    _write_report(summary, args.output)
 
 
 if __name__ == "__main__":
@@ -5,9 +5,36 @@ import os
 import sys
 import re
 import asyncio
-from supabase import create_client, Client
+import functools
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+import httpx
+from supabase import create_client, Client, AsyncClient
+from postgrest import APIError
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
+from postgrest.types import ReturnMethod
 from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Set
+
+try:
+    import asyncpg
+except ImportError:  # Direct SQL is optional; PostgREST is used without it
+    asyncpg = None
+
+try:
+    from supabase.lib.client_options import AsyncClientOptions, SyncClientOptions
+except ImportError:  # Older supabase-py: clients keep their own httpx sessions
+    AsyncClientOptions = SyncClientOptions = None
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:  # httpx falls back to HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 
@@ -15,16 +42,49 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
+# Shared connection pool for PostgREST traffic: keep-alive sockets are reused
+# across queries (no TLS handshake per call) and HTTP/2 multiplexes concurrent ones
+SUPABASE_HTTP_LIMITS = httpx.Limits(
+    max_connections=max(1, int(os.getenv("SUPABASE_HTTP_MAX_CONNECTIONS", "50") or 50)),
+    max_keepalive_connections=max(1, int(os.getenv("SUPABASE_HTTP_MAX_KEEPALIVE", "20") or 20)),
+    keepalive_expiry=300
+)
+
+
+def _pooled_client_kwargs(options_cls, httpx_client_cls) -> Dict[str, Any]:
+    """
+    Client constructor kwargs carrying a shared pooled httpx client. Empty when
+    this supabase-py release cannot accept one (no options class or no
+    httpx_client field), so the client keeps its default session.
+    """
+    if options_cls is None or "httpx_client" not in getattr(options_cls, "__dataclass_fields__", {}):
+        logger.info("supabase-py does not accept httpx_client; using its default HTTP session")
+        return {}
+    return {"options": options_cls(httpx_client=httpx_client_cls(
+        http2=HTTP2_AVAILABLE, limits=SUPABASE_HTTP_LIMITS, timeout=DEFAULT_POSTGREST_CLIENT_TIMEOUT
+    ))}
+
+
 # Gracefully handle missing environment variables
 if not SUPABASE_URL or not SUPABASE_KEY:
-    print("⚠️  WARNING: Missing Supabase environment variables!")
-    print("   Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
-    print("   The server will start but database operations will fail.")
+    logger.warning(
+        "⚠️  WARNING: Missing Supabase environment variables!\n"
+        "   Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY\n"
+        "   The server will start but database operations will fail."
+    )
     # Create a dummy client that will fail gracefully on operations
     supabase = None
+    supabase_async = None
 else:
-    print(f"🔑 Connected to Supabase: {SUPABASE_URL}")
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    logger.info("🔑 Connected to Supabase: %s", SUPABASE_URL)
+    supabase: Client = create_client(
+        SUPABASE_URL, SUPABASE_KEY, **_pooled_client_kwargs(SyncClientOptions, httpx.Client)
+    )
+    # Async client (httpx.AsyncClient under PostgREST) used by the helpers below,
+    # so concurrent requests and asyncio.gather calls overlap their round-trips
+    supabase_async: AsyncClient = AsyncClient(
+        SUPABASE_URL, SUPABASE_KEY, **_pooled_client_kwargs(AsyncClientOptions, httpx.AsyncClient)
+    )
 
 
 def get_supabase_client() -> Client:
@@ -34,17 +94,306 @@ def get_supabase_client() -> Client:
     return supabase
 
 
-def _db() -> Client:
+def get_async_supabase_client() -> AsyncClient:
+    """Return the async Supabase client instance"""
+    if supabase_async is None:
+        raise ValueError("Supabase client not initialized. Check environment variables.")
+    return supabase_async
+
+
+async def warm_async_supabase_client():
+    """Open a pooled connection (TLS/HTTP2 handshake) before the first request needs one"""
+    if supabase_async is None:
+        return
+    try:
+        await supabase_async.table("rooms").select("id", head=True).limit(1).execute()
+    except Exception as e:
+        logger.warning("⚠️ Supabase warm-up failed: %s", e)
+
+
+async def close_async_supabase_client():
+    """Close the async client's pooled PostgREST connections"""
+    if supabase_async is not None:
+        await supabase_async.postgrest.aclose()
+
+
+# Optional direct Postgres connection (e.g. the Supavisor pooler URL) for hot-path
+# reads; skips PostgREST's per-request overhead when configured
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
+SUPABASE_DB_POOL_MIN_SIZE = max(1, int(os.getenv("SUPABASE_DB_POOL_MIN_SIZE", "1") or 1))
+SUPABASE_DB_POOL_MAX_SIZE = max(SUPABASE_DB_POOL_MIN_SIZE, int(os.getenv("SUPABASE_DB_POOL_MAX_SIZE", "10") or 10))
+_pg_pool = None
+_pg_pool_lock = asyncio.Lock()
+
+
+async def _get_pg_pool():
+    """Return the asyncpg pool, or None when SUPABASE_DB_URL/asyncpg are unavailable"""
+    global _pg_pool
+    if asyncpg is None or not SUPABASE_DB_URL:
+        return None
+    if _pg_pool is None:
+        async with _pg_pool_lock:
+            if _pg_pool is None:
+                _pg_pool = await asyncpg.create_pool(
+                    dsn=SUPABASE_DB_URL,
+                    min_size=SUPABASE_DB_POOL_MIN_SIZE,
+                    max_size=SUPABASE_DB_POOL_MAX_SIZE,
+                    # Supavisor transaction mode cannot keep prepared statements
+                    statement_cache_size=0,
+                    max_inactive_connection_lifetime=300
+                )
+    return _pg_pool
+
+
+async def close_pg_pool():
+    """Close the asyncpg pool if it was opened"""
+    global _pg_pool
+    if _pg_pool is not None:
+        await _pg_pool.close()
+        _pg_pool = None
+
+
+def get_connection_pool_stats() -> Dict[str, Any]:
+    """Configured limits and current usage of the PostgREST HTTP pool and the asyncpg pool"""
+    http_pool: Dict[str, Any] = {
+        "http2": HTTP2_AVAILABLE,
+        "max_connections": SUPABASE_HTTP_LIMITS.max_connections,
+        "max_keepalive_connections": SUPABASE_HTTP_LIMITS.max_keepalive_connections,
+    }
+    if supabase_async is not None:
+        # httpcore's pool behind the shared httpx.AsyncClient (best effort: internal attribute)
+        session = getattr(supabase_async.postgrest, "session", None)
+        transport_pool = getattr(getattr(session, "_transport", None), "_pool", None)
+        connections = getattr(transport_pool, "connections", None)
+        if connections is not None:
+            http_pool["open_connections"] = len(connections)
+            http_pool["idle_connections"] = sum(1 for c in connections if c.is_idle())
+
+    stats: Dict[str, Any] = {"http": http_pool, "sql": None}
+    if _pg_pool is not None:
+        stats["sql"] = {
+            "size": _pg_pool.get_size(),
+            "idle": _pg_pool.get_idle_size(),
+            "min_size": _pg_pool.get_min_size(),
+            "max_size": _pg_pool.get_max_size(),
+        }
+    return stats
+
+
+async def _fetch_allocations_sql(schedule_id: int) -> Optional[List[Dict]]:
+    """
+    Read a schedule's room_allocations over the asyncpg pool. Rows are built
+    with jsonb_agg so they have the same JSON shape PostgREST returns.
+    Returns None when direct SQL is not configured.
+    """
+    pool = await _get_pg_pool()
+    if pool is None:
+        return None
+    rows = await pool.fetchval(
+        "SELECT coalesce(jsonb_agg(t), '[]'::jsonb)::text FROM room_allocations t WHERE schedule_id = $1",
+        int(schedule_id)
+    )
+    return json.loads(rows)
+
+
+def _db() -> AsyncClient:
     """Internal helper to get database client with null check"""
-    return get_supabase_client()
+    return get_async_supabase_client()
 
 
 async def _execute(query):
-    """Execute a Supabase query in a worker thread to avoid blocking the event loop."""
-    return await asyncio.to_thread(query.execute)
+    """Execute a query built from the async client."""
+    return await query.execute()
+
+
+# Rows per INSERT request; keeps PostgREST payloads well under request-size limits
+INSERT_CHUNK_SIZE = max(1, int(os.getenv("SUPABASE_INSERT_CHUNK_SIZE", "500") or 500))
+# INSERT requests in flight per bulk call (SUPABASE_INSERT_CONCURRENCY)
+INSERT_CONCURRENCY = max(1, int(os.getenv("SUPABASE_INSERT_CONCURRENCY", "2") or 2))
+
+
+async def _insert_rows(table: str, rows: List[Dict]) -> List[Dict]:
+    """
+    Insert rows in INSERT_CHUNK_SIZE batches. The first batch runs alone so a
+    schema error (unknown column) fails before anything else is written; the
+    remaining batches run at most INSERT_CONCURRENCY at a time. Returned rows
+    keep input order.
+
+    Not atomic: batches commit separately. When one fails, the rows already
+    written by the others are deleted by id (best effort) before re-raising.
+    """
+    if not rows:
+        return []
+    if len(rows) <= INSERT_CHUNK_SIZE:
+        response = await _execute(_db().table(table).insert(rows))
+        return response.data or []
+
+    chunks = [rows[i:i + INSERT_CHUNK_SIZE] for i in range(0, len(rows), INSERT_CHUNK_SIZE)]
+    first = await _execute(_db().table(table).insert(chunks[0]))
+
+    semaphore = asyncio.Semaphore(INSERT_CONCURRENCY)
+
+    async def insert_chunk(chunk: List[Dict]):
+        async with semaphore:
+            return await _execute(_db().table(table).insert(chunk))
+
+    # return_exceptions lets every in-flight batch settle, so the rollback sees all writes
+    rest = await asyncio.gather(*[insert_chunk(chunk) for chunk in chunks[1:]], return_exceptions=True)
+
+    inserted = list(first.data or [])
+    failure: Optional[BaseException] = None
+    for response in rest:
+        if isinstance(response, BaseException):
+            failure = failure or response
+        else:
+            inserted.extend(response.data or [])
+    if failure is not None:
+        await _delete_inserted_rows(table, inserted)
+        raise failure
+    return inserted
+
+
+async def _delete_inserted_rows(table: str, rows: List[Dict]) -> None:
+    """Roll back a partially applied bulk insert by deleting its rows by id"""
+    ids = [row["id"] for row in rows if row.get("id") is not None]
+    try:
+        for i in range(0, len(ids), INSERT_CHUNK_SIZE):
+            await _execute(_db().table(table).delete().in_("id", ids[i:i + INSERT_CHUNK_SIZE]))
+    except Exception as e:
+        logger.error("❌ Could not roll back %d partial %s rows: %s", len(ids), table, e)
+    else:
+        logger.warning("⚠️ Bulk insert into %s failed; removed %d partially written rows", table, len(ids))
+
+
+async def _insert_one(table: str, row: Dict) -> Dict:
+    """
+    Insert one row and return it. An insert that comes back without a row
+    raises APIError instead of yielding {}
+    """
+    response = await _execute(_db().table(table).insert(row, returning=ReturnMethod.representation))
+    if not response.data:
+        raise APIError({"message": f"Insert into {table} returned no row", "code": "PGRST116"})
+    return response.data[0]
+
+
+# Reference tables change at human speed, not per request. TTLs in seconds; 0 disables
+REFERENCE_CACHE_TTL_SECONDS = max(0, int(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "60") or 0))
+TIME_SLOT_CACHE_TTL_SECONDS = max(0, int(os.getenv("TIME_SLOT_CACHE_TTL_SECONDS", "600") or 0))
+# Hits older than this fraction of their TTL are refreshed in the background
+REFERENCE_CACHE_REFRESH_AHEAD = 0.8
+_ttl_cached_functions: List[Any] = []
+_background_refreshes: Set[asyncio.Task] = set()
+
+
+def _ttl_cache(ttl_seconds: int, maxsize: int = 32):
+    """
+    Cache an async row fetcher per argument set for ttl_seconds (0 disables).
+    Concurrent misses share one fetch, entries past REFERENCE_CACHE_REFRESH_AHEAD
+    of their TTL are refetched in the background, and callers get their own row
+    copies. Clear with func.cache_clear() or clear_cache(), or drop one argument
+    set with func.cache_invalidate(*args); a fetch in flight for an invalidated
+    argument set is not stored, while fetches for other sets are unaffected.
+    func.cache_info() reports how many entries and fill locks are held.
+    """
+    def decorator(func):
+        entries: Dict[Tuple, Tuple[float, List[Dict]]] = {}  # key -> (fetched_at, rows)
+        # key -> [lock, callers using it]; dropped when the last caller leaves
+        locks: Dict[Tuple, List[Any]] = {}
+        # key -> flags of in-flight fetches; invalidation marks them stale so a
+        # fetch that started before a write doesn't re-fill its old rows
+        pending: Dict[Tuple, List[Dict[str, bool]]] = {}
+        refreshing: Set[Tuple] = set()
+
+        async def fetch(key: Tuple, args, kwargs) -> List[Dict]:
+            flag = {"stale": False}
+            pending.setdefault(key, []).append(flag)
+            try:
+                rows = await func(*args, **kwargs)
+            finally:
+                flags = pending[key]
+                flags.remove(flag)
+                if not flags:
+                    del pending[key]
+            if not flag["stale"]:
+                if key not in entries and len(entries) >= maxsize:
+                    entries.pop(next(iter(entries)))
+                entries[key] = (time.monotonic(), rows)
+            return rows
+
+        async def refresh(key: Tuple, args, kwargs) -> None:
+            try:
+                await fetch(key, args, kwargs)
+            except Exception as e:
+                logger.warning("⚠️ Background refresh of %s failed: %s", func.__name__, e)
+            finally:
+                refreshing.discard(key)
+
+        async def fill(key: Tuple, args, kwargs) -> Tuple[float, List[Dict]]:
+            lock_entry = locks.setdefault(key, [asyncio.Lock(), 0])
+            lock_entry[1] += 1
+            try:
+                async with lock_entry[0]:
+                    # Another caller may have filled the entry while we waited
+                    cached = entries.get(key)
+                    if cached is None or time.monotonic() - cached[0] >= ttl_seconds:
+                        cached = (time.monotonic(), await fetch(key, args, kwargs))
+                    return cached
+            finally:
+                lock_entry[1] -= 1
+                if lock_entry[1] == 0:
+                    locks.pop(key, None)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if ttl_seconds <= 0:
+                return await func(*args, **kwargs)
+
+            key = (args, tuple(sorted(kwargs.items())))
+            cached = entries.get(key)
+            if cached is None or time.monotonic() - cached[0] >= ttl_seconds:
+                cached = await fill(key, args, kwargs)
+            elif time.monotonic() - cached[0] >= ttl_seconds * REFERENCE_CACHE_REFRESH_AHEAD and key not in refreshing:
+                refreshing.add(key)
+                task = asyncio.create_task(refresh(key, args, kwargs))
+                _background_refreshes.add(task)
+                task.add_done_callback(_background_refreshes.discard)
+            return [dict(row) for row in cached[1]]
+
+        def cache_clear() -> None:
+            for flags in pending.values():
+                for flag in flags:
+                    flag["stale"] = True
+            entries.clear()
+
+        def cache_invalidate(*args, **kwargs) -> None:
+            key = (args, tuple(sorted(kwargs.items())))
+            for flag in pending.get(key, ()):
+                flag["stale"] = True
+            entries.pop(key, None)
+
+        def cache_info() -> Dict[str, int]:
+            return {"entries": len(entries), "locks": len(locks), "pending": len(pending)}
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        wrapper.cache_invalidate = cache_invalidate
+        _ttl_cached_functions.append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def clear_cache() -> None:
+    """Drop every cached read (rooms, teachers, time slots, schedules)"""
+    for cached_func in _ttl_cached_functions:
+        cached_func.cache_clear()
 
 
 # ==================== Room Operations ====================
+# Columns the room list endpoint returns (its RoomResponse model drops the rest)
+ROOM_LIST_COLUMNS = "id, room_code, room_name, building, campus, capacity, room_type, floor, is_accessible"
+
+@_ttl_cache(REFERENCE_CACHE_TTL_SECONDS)
 async def get_all_rooms(campus: Optional[str] = None, building: Optional[str] = None) -> List[Dict]:
     """Fetch all rooms, optionally filtered by campus/building"""
     query = _db().table("rooms").select("*")
@@ -58,13 +407,21 @@ async def get_all_rooms(campus: Optional[str] = None, building: Optional[str] =
     return response.data or []
 
 
+async def get_room_by_id(room_id: int) -> Optional[Dict]:
+    """Fetch one room by primary key"""
+    response = await _execute(_db().table("rooms").select("*").eq("id", room_id).limit(1))
+    return response.data[0] if response.data else None
+
+
 async def get_available_rooms(
     room_type: Optional[str] = None,
     min_capacity: int = 0,
-    campus: Optional[str] = None
+    campus: Optional[str] = None,
+    columns: str = "*",
+    building: Optional[str] = None
 ) -> List[Dict]:
-    """Get available rooms filtered by type and capacity"""
-    query = _db().table("rooms").select("*").eq("is_available", True)
+    """Get available rooms filtered by type, capacity, campus and building"""
+    query = _db().table("rooms").select(columns).eq("is_available", True)
     
     if room_type:
         query = query.eq("room_type", room_type)
@@ -72,6 +429,8 @@ async def get_available_rooms(
         query = query.gte("capacity", min_capacity)
     if campus:
         query = query.eq("campus", campus)
+    if building:
+        query = query.eq("building", building)
     
     response = await _execute(query)
     return response.data or []
@@ -79,14 +438,16 @@ async def get_available_rooms(
 
 async def create_room(room_data: Dict) -> Dict:
     """Create a new room"""
-    response = await _execute(_db().table("rooms").insert(room_data))
-    return response.data[0] if response.data else {}
+    created = await _insert_one("rooms", room_data)
+    get_all_rooms.cache_clear()
+    return created
 
 
 async def bulk_create_rooms(rooms: List[Dict]) -> List[Dict]:
     """Bulk create rooms"""
-    response = await _execute(_db().table("rooms").insert(rooms))
-    return response.data or []
+    inserted = await _insert_rows("rooms", rooms)
+    get_all_rooms.cache_clear()
+    return inserted
 
 
 # ==================== Course Operations ====================
@@ -103,44 +464,135 @@ async def get_all_courses(department: Optional[str] = None) -> List[Dict]:
 
 async def create_course(course_data: Dict) -> Dict:
     """Create a new course"""
-    response = await _execute(_db().table("courses").insert(course_data))
-    return response.data[0] if response.data else {}
+    return await _insert_one("courses", course_data)
 
 
 # ==================== Section Operations ====================
-async def get_all_sections(department: Optional[str] = None) -> List[Dict]:
+SECTION_COLUMNS = "*, courses(*), teachers(*)"
+# Opt-in trimmed section list (?fields=summary): course identity only, no teacher rows
+SECTION_LIST_COLUMNS = "*, courses(course_code, course_name, department, college)"
+# The schedulers only read department/college from the course embed; teacher
+# details come from faculty_profiles, so the teachers embed is not fetched.
+# Room feature requirements ride along on the course instead of a second query
+SECTION_SCHEDULING_COLUMNS = "*, courses(department, college)"
+SECTION_SCHEDULING_COLUMNS_WITH_REQUIREMENTS = (
+    "*, courses(department, college, subject_room_requirements(is_mandatory, notes, feature_tags(tag_name)))"
+)
+_requirements_embed_available = True
+
+
+async def get_all_sections(
+    department: Optional[str] = None,
+    columns: str = SECTION_COLUMNS,
+    course_code: Optional[str] = None
+) -> List[Dict]:
     """Fetch all sections without requiring semester/academic year"""
-    query = _db().table("sections").select("*, courses(*), teachers(*)")
+    query = _db().table("sections").select(columns)
     
     if department:
         query = query.eq("department", department)
+    if course_code:
+        query = query.eq("course_code", course_code)
     
     # Optimize for large datasets: limit result size, order by recent
     response = await _execute(query.limit(5000).order("created_at", desc=True))
     return response.data or []
 
 
+# Features a legacy (no LEC/LAB notes) requirement also grants to lecture rooms
+BASIC_LECTURE_FEATURES = frozenset({
+    'TV_Display', 'Projector', 'Whiteboard', 'Sound_System', 'Air_Conditioning',
+    'Accessibility', 'Podium', 'Smart_TV', 'Monitor'
+})
+
+
+def _apply_room_requirements(sections: List[Dict], requirements: List[Dict]) -> None:
+    """
+    Attach required_features / lec_required_features / lab_required_features to
+    sections from subject_room_requirements rows (with feature_tags(tag_name)).
+    The course_room_features view applies the same rules in SQL; keep them in sync
+    """
+    course_reqs = {} # course_id -> { 'all': [], 'lec': [], 'lab': [] }
+    
+    for r in requirements:
+        c_id = r.get("course_id")
+        tag = r.get("feature_tags")
+        if not tag: continue
+        tag_name = tag.get("tag_name")
+        if not tag_name: continue
+        
+        notes = (r.get("notes") or "").upper()
+        
+        reqs = course_reqs.setdefault(c_id, {'all': [], 'lec': [], 'lab': []})
+        reqs['all'].append(tag_name)
+        
+        if notes == 'LEC':
+            reqs['lec'].append(tag_name)
+        elif notes == 'BOTH':
+            reqs['lec'].append(tag_name)
+            reqs['lab'].append(tag_name)
+        elif notes == 'LAB': 
+            reqs['lab'].append(tag_name)
+        else: # Legacy / No notes (Treat as General/Shared with heuristic)
+            reqs['lab'].append(tag_name)
+            # For legacy data, auto-assign basic features to lecture
+            if tag_name in BASIC_LECTURE_FEATURES:
+                reqs['lec'].append(tag_name)
+            
+    # Augment sections
+    for section in sections:
+        c_id = section.get("course_id")
+        if c_id in course_reqs:
+            reqs = course_reqs[c_id]
+            section['required_features'] = reqs['all']
+            section['lec_required_features'] = reqs['lec']
+            section['lab_required_features'] = reqs['lab']
+
+
 async def get_sections_for_scheduling(
     semester: str,
     academic_year: str,
     department: Optional[str] = None
 ) -> List[Dict]:
     """Get all sections that need scheduling, enriched with course requirements"""
-    query = _db().table("sections").select(
-        "*, courses(*), teachers(*)"
-    ).eq("semester", semester).eq("academic_year", academic_year)
-    
-    if department:
-        query = query.eq("department", department)
-    
-    response = await _execute(query)
+    def sections_query(columns: str):
+        query = _db().table("sections").select(columns).eq("semester", semester).eq("academic_year", academic_year)
+        if department:
+            query = query.eq("department", department)
+        return query
+
+    global _requirements_embed_available
+    if _requirements_embed_available:
+        try:
+            response = await _execute(sections_query(SECTION_SCHEDULING_COLUMNS_WITH_REQUIREMENTS))
+        except Exception as exc:
+            if "Could not find a relationship" not in str(exc):
+                raise
+            # Relationship not exposed by this schema: fetch requirements separately
+            _requirements_embed_available = False
+        else:
+            sections = response.data or []
+            # One requirement list per course, taken from the first section that embeds it
+            requirements_by_course: Dict[Any, List[Dict]] = {}
+            for section in sections:
+                course = section.get("courses") or {}
+                requirements = course.pop("subject_room_requirements", None) or []
+                course_id = section.get("course_id")
+                if course_id is not None and course_id not in requirements_by_course:
+                    requirements_by_course[course_id] = [dict(r, course_id=course_id) for r in requirements]
+            _apply_room_requirements(
+                sections, [r for requirements in requirements_by_course.values() for r in requirements]
+            )
+            return sections
+
+    response = await _execute(sections_query(SECTION_SCHEDULING_COLUMNS))
     sections = response.data or []
     
     if not sections:
         return []
 
     # Get unique course IDs
-    course_ids = list(set([s.get("course_id") for s in sections if s.get("course_id")]))
+    course_ids = list(dict.fromkeys(s.get("course_id") for s in sections if s.get("course_id")))
     
     if not course_ids:
         return sections
@@ -153,49 +605,9 @@ async def get_sections_for_scheduling(
         ).in_("course_id", course_ids)
         
         req_response = await _execute(req_query)
-        requirements = req_response.data or []
-        
-        # Process requirements
-        course_reqs = {} # course_id -> { 'all': [], 'lec': [], 'lab': [] }
-        
-        for r in requirements:
-            c_id = r.get("course_id")
-            tag = r.get("feature_tags")
-            if not tag: continue
-            tag_name = tag.get("tag_name")
-            if not tag_name: continue
-            
-            notes = (r.get("notes") or "").upper()
-            
-            if c_id not in course_reqs:
-                course_reqs[c_id] = {'all': [], 'lec': [], 'lab': []}
-                
-            course_reqs[c_id]['all'].append(tag_name)
-            
-            if notes == 'LEC':
-                course_reqs[c_id]['lec'].append(tag_name)
-            elif notes == 'BOTH':
-                course_reqs[c_id]['lec'].append(tag_name)
-                course_reqs[c_id]['lab'].append(tag_name)
-            elif notes == 'LAB': 
-                course_reqs[c_id]['lab'].append(tag_name)
-            else: # Legacy / No notes (Treat as General/Shared with heuristic)
-                course_reqs[c_id]['lab'].append(tag_name)
-                # For legacy data, auto-assign basic features to lecture
-                if tag_name in {'TV_Display', 'Projector', 'Whiteboard', 'Sound_System', 'Air_Conditioning', 'Accessibility', 'Podium', 'Smart_TV', 'Monitor'}:
-                     course_reqs[c_id]['lec'].append(tag_name)
-                
-        # Augment sections
-        for section in sections:
-            c_id = section.get("course_id")
-            if c_id in course_reqs:
-                reqs = course_reqs[c_id]
-                section['required_features'] = reqs['all']
-                section['lec_required_features'] = reqs['lec']
-                section['lab_required_features'] = reqs['lab']
-                
+        _apply_room_requirements(sections, req_response.data or [])
     except Exception as e:
-        print(f"⚠️ Error fetching requirements: {e}")
+        logger.warning("⚠️ Error fetching requirements: %s", e)
         # Continue without requirements rather than failing completely
             
     return sections
@@ -203,17 +615,16 @@ async def get_sections_for_scheduling(
 
 async def create_section(section_data: Dict) -> Dict:
     """Create a new section"""
-    response = await _execute(_db().table("sections").insert(section_data))
-    return response.data[0] if response.data else {}
+    return await _insert_one("sections", section_data)
 
 
 async def bulk_create_sections(sections: List[Dict]) -> List[Dict]:
     """Bulk create sections"""
-    response = await _execute(_db().table("sections").insert(sections))
-    return response.data or []
+    return await _insert_rows("sections", sections)
 
 
 # ==================== Teacher Operations ====================
+@_ttl_cache(REFERENCE_CACHE_TTL_SECONDS)
 async def get_all_teachers(department: Optional[str] = None) -> List[Dict]:
     """Fetch all teachers from faculty_profiles"""
     # Use 'faculty_profiles' table (renamed/new schema)
@@ -223,13 +634,14 @@ async def get_all_teachers(department: Optional[str] = None) -> List[Dict]:
         query = query.eq("department", department)
     
     response = await _execute(query)
-    data = response.data or []
-    
-    # Map 'full_name' to 'name' for compatibility
+    return _with_teacher_names(response.data or [])
+
+
+def _with_teacher_names(data: List[Dict]) -> List[Dict]:
+    """Map faculty_profiles 'full_name' to 'name' for compatibility"""
     for t in data:
         if 'full_name' in t and 'name' not in t:
             t['name'] = t['full_name']
-            
     return data
 
 
@@ -245,17 +657,20 @@ async def get_teacher_availability(teacher_id: Any) -> Dict:
 
 async def create_teacher(teacher_data: Dict) -> Dict:
     """Create a new teacher in faculty_profiles"""
-    response = await _execute(_db().table("faculty_profiles").insert(teacher_data))
-    return response.data[0] if response.data else {}
+    created = await _insert_one("faculty_profiles", teacher_data)
+    get_all_teachers.cache_clear()
+    return created
 
 
 async def bulk_create_teachers(teachers: List[Dict]) -> List[Dict]:
     """Bulk create teachers in faculty_profiles"""
-    response = await _execute(_db().table("faculty_profiles").insert(teachers))
-    return response.data or []
+    inserted = await _insert_rows("faculty_profiles", teachers)
+    get_all_teachers.cache_clear()
+    return inserted
 
 
 # ==================== Time Slot Operations ====================
+@_ttl_cache(TIME_SLOT_CACHE_TTL_SECONDS)
 async def get_time_slots() -> List[Dict]:
     """Get all time slots"""
     response = await _execute(_db().table("time_slots").select("*").order("start_time"))
@@ -279,6 +694,7 @@ async def create_default_time_slots() -> List[Dict]:
     ]
     
     response = await _execute(_db().table("time_slots").insert(default_slots))
+    get_time_slots.cache_clear()
     return response.data or []
 
 
@@ -286,46 +702,73 @@ async def create_default_time_slots() -> List[Dict]:
 # ==================== Schedule Operations (Legacy - Now uses generated_schedules) ====================
 async def save_schedule_summary(summary_data: Dict) -> Dict:
     """Save schedule summary - DEPRECATED: Use create_generated_schedule instead"""
-    response = await _execute(_db().table("generated_schedules").insert(summary_data))
-    return response.data[0] if response.data else {}
+    return await _insert_one("generated_schedules", summary_data)
 
 
 async def save_schedule_entries(entries: List[Dict]) -> List[Dict]:
     """Save schedule entries/batches - DEPRECATED: Use save_room_allocations instead"""
-    if not entries:
-        return []
-    response = await _execute(_db().table("room_allocations").insert(entries))
-    return response.data or []
+    inserted = await _insert_rows("room_allocations", entries)
+    schedule_ids = {e.get("schedule_id") for e in entries}
+    _invalidate_conflict_index(schedule_ids)
+    _invalidate_schedule_reads(schedule_ids)
+    return inserted
 
 
 async def get_schedule_entries(schedule_id: int) -> List[Dict]:
-    """Get all entries for a schedule"""
+    """Get all entries for a schedule - DEPRECATED: Use get_room_allocations_by_schedule instead"""
+    return await get_room_allocations_by_schedule(schedule_id)
+
+
+async def get_all_schedules() -> List[Dict]:
+    """Get all schedules - DEPRECATED: Use get_generated_schedules instead"""
+    return await get_generated_schedules()
+
+
+# Schedule reads polled by the UI; keyed by str(schedule_id) and dropped by the
+# writes below. Per-process: each worker keeps its own copy for up to the TTL.
+# The frontend also writes generated_schedules and room_allocations through
+# Supabase directly (ArchiveModal, RoomViewer2D), which bypasses that
+# invalidation: a nonzero TTL lets GET /api/schedules/{id} serve rows that
+# stale for up to that long. Both caches are off by default
+SCHEDULE_CACHE_TTL_SECONDS = max(0, int(os.getenv("SCHEDULE_CACHE_TTL_SECONDS", "0") or 0))
+SCHEDULE_ALLOCATION_CACHE_TTL_SECONDS = max(0, int(os.getenv("SCHEDULE_ALLOCATION_CACHE_TTL_SECONDS", "0") or 0))
+
+
+@_ttl_cache(SCHEDULE_CACHE_TTL_SECONDS, maxsize=1024)
+async def _schedule_rows(schedule_key: str) -> List[Dict]:
     response = await _execute(
-        _db().table("room_allocations").select("*").eq("schedule_id", schedule_id)
+        _db().table("generated_schedules").select("*").eq("id", schedule_key)
     )
     return response.data or []
 
 
-async def get_all_schedules() -> List[Dict]:
-    """Get all schedules - Now uses generated_schedules table"""
+@_ttl_cache(SCHEDULE_ALLOCATION_CACHE_TTL_SECONDS, maxsize=64)
+async def _schedule_allocation_rows(schedule_key: str) -> List[Dict]:
+    rows = await _fetch_allocations_sql(schedule_key)
+    if rows is not None:
+        return rows
     response = await _execute(
-        _db().table("generated_schedules").select("*").order("created_at", desc=True)
+        _db().table("room_allocations").select("*").eq("schedule_id", schedule_key)
     )
     return response.data or []
 
 
+def _invalidate_schedule_reads(schedule_ids) -> None:
+    """Drop cached schedule records and allocations for the given schedule ids."""
+    for schedule_id in schedule_ids:
+        _schedule_rows.cache_invalidate(str(schedule_id))
+        _schedule_allocation_rows.cache_invalidate(str(schedule_id))
+
+
 async def get_schedule_by_id(schedule_id: int) -> Optional[Dict]:
     """Get a specific schedule by ID - Now uses generated_schedules table"""
-    response = await _execute(
-        _db().table("generated_schedules").select("*").eq("id", schedule_id)
-    )
-    return response.data[0] if response.data else None
+    rows = await _schedule_rows(str(schedule_id))
+    return rows[0] if rows else None
 
 
 async def create_schedule_record(schedule_data: Dict) -> Dict:
     """Create a new schedule record - Now uses generated_schedules table"""
-    response = await _execute(_db().table("generated_schedules").insert(schedule_data))
-    return response.data[0] if response.data else {}
+    return await _insert_one("generated_schedules", schedule_data)
 
 
 async def update_schedule_status(schedule_id: int, status: str, message: str = "") -> Dict:
@@ -336,19 +779,95 @@ async def update_schedule_status(schedule_id: int, status: str, message: str = "
     response = await _execute(
         _db().table("generated_schedules").update(update_data).eq("id", schedule_id)
     )
+    _invalidate_schedule_reads([schedule_id])
     return response.data[0] if response.data else {}
 
 
 async def delete_schedule(schedule_id: int) -> bool:
     """Delete a schedule and its entries - Now uses generated_schedules and room_allocations"""
-    # Delete allocations first (foreign key)
-    await _execute(_db().table("room_allocations").delete().eq("schedule_id", schedule_id))
-    # Delete schedule
-    await _execute(_db().table("generated_schedules").delete().eq("id", schedule_id))
+    # One round-trip, both deletes in a single transaction
+    deleted = await _rpc_rows("delete_schedule_atomic", {"p_schedule_id": schedule_id})
+    if deleted is None:
+        # Delete allocations first (foreign key)
+        await _execute(_db().table("room_allocations").delete().eq("schedule_id", schedule_id))
+        # Delete schedule
+        await _execute(_db().table("generated_schedules").delete().eq("id", schedule_id))
+    _invalidate_conflict_index([schedule_id])
+    _invalidate_schedule_reads([schedule_id])
     return True
 
 
 # ==================== Conflict Detection ====================
+# Per-schedule occupancy index: (room_id, day) and (teacher_id, day) -> allocation
+# rows, built from one fetch of the schedule's allocations so conflict checks are
+# dict lookups. Writes made through this module drop the affected schedules, but
+# frontend writes do not, so a cached index can miss conflicts for up to
+# CONFLICT_INDEX_TTL_SECONDS. Off by default: each check builds a fresh index
+CONFLICT_INDEX_TTL_SECONDS = max(0, int(os.getenv("CONFLICT_INDEX_TTL_SECONDS", "0") or 0))
+_conflict_indexes: Dict[str, Tuple[float, Dict[str, Dict[Tuple[str, str], List[Dict]]]]] = {}
+
+
+def _invalidate_conflict_index(schedule_ids) -> None:
+    """Drop cached conflict indexes for the given schedule ids."""
+    for schedule_id in schedule_ids:
+        _conflict_indexes.pop(str(schedule_id), None)
+
+
+async def _get_conflict_index(schedule_id: int) -> Dict[str, Dict[Tuple[str, str], List[Dict]]]:
+    """Return the room/teacher occupancy index for a schedule, building it on a miss."""
+    key = str(schedule_id)
+    now = time.monotonic()
+    cached = _conflict_indexes.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    # Ids compared as strings: callers may pass "12" where the column returns 12
+    by_room: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+    by_teacher: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+    for row in await get_schedule_entries(schedule_id):
+        day = row.get("schedule_day")
+        by_room[(str(row.get("room_id")), day)].append(row)
+        if row.get("teacher_id"):
+            by_teacher[(str(row.get("teacher_id")), day)].append(row)
+
+    index = {"room": by_room, "teacher": by_teacher}
+    if CONFLICT_INDEX_TTL_SECONDS > 0:
+        _conflict_indexes[key] = (now + CONFLICT_INDEX_TTL_SECONDS, index)
+    return index
+
+
+async def check_room_conflicts_batch(
+    candidates: List[Tuple[int, str, int]],
+    schedule_id: int
+) -> List[Dict]:
+    """
+    Batched room check for many (room_id, day_of_week, time_slot_id) candidates
+    against the schedule's conflict index. Returns the existing allocations
+    that clash with any candidate's room and day.
+    """
+    if not candidates:
+        return []
+    wanted = dict.fromkeys((str(room_id), day) for room_id, day, _ in candidates)
+    by_room = (await _get_conflict_index(schedule_id))["room"]
+    return [row for key in wanted for row in by_room.get(key, ())]
+
+
+async def check_teacher_conflicts_batch(
+    candidates: List[Tuple[int, str, int]],
+    schedule_id: int
+) -> List[Dict]:
+    """
+    Batched teacher check for many (teacher_id, day_of_week, time_slot_id)
+    candidates against the schedule's conflict index. Candidates without a
+    teacher are ignored.
+    """
+    wanted = dict.fromkeys((str(teacher_id), day) for teacher_id, day, _ in candidates if teacher_id)
+    if not wanted:
+        return []
+    by_teacher = (await _get_conflict_index(schedule_id))["teacher"]
+    return [row for key in wanted for row in by_teacher.get(key, ())]
+
+
 async def check_room_conflicts(
     room_id: int,
     day_of_week: str,
@@ -356,14 +875,7 @@ async def check_room_conflicts(
     schedule_id: int
 ) -> List[Dict]:
     """Check if room is already booked at this time - Now uses room_allocations"""
-    response = await _execute(
-        _db().table("room_allocations")
-        .select("*")
-        .eq("room_id", room_id)
-        .eq("schedule_day", day_of_week)
-        .eq("schedule_id", schedule_id)
-    )
-    return response.data or []
+    return await check_room_conflicts_batch([(room_id, day_of_week, time_slot_id)], schedule_id)
 
 
 async def check_teacher_conflicts(
@@ -373,39 +885,139 @@ async def check_teacher_conflicts(
     schedule_id: int
 ) -> List[Dict]:
     """Check if teacher is already scheduled at this time - Now uses room_allocations"""
-    if not teacher_id:
-        return []  # No teacher assigned
+    return await check_teacher_conflicts_batch([(teacher_id, day_of_week, time_slot_id)], schedule_id)
+
+
+async def check_conflicts_batch(
+    schedule_id: int,
+    candidates: List[Tuple[Any, str, int, Any]]
+) -> Set[Tuple[Any, str, int, Any]]:
+    """
+    Combined room + teacher check for (room_id, day_of_week, time_slot_id,
+    teacher_id) candidates in one index lookup. Returns the subset of
+    candidates whose room or teacher is already booked that day.
+    """
+    if not candidates:
+        return set()
+    index = await _get_conflict_index(schedule_id)
+    by_room, by_teacher = index["room"], index["teacher"]
+    return {
+        candidate for candidate in candidates
+        if (str(candidate[0]), candidate[1]) in by_room
+        or (candidate[3] and (str(candidate[3]), candidate[1]) in by_teacher)
+    }
+
+
+# ==================== Analytics ====================
+SCHEDULE_DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+
+# RPCs from the backend migrations (analytics aggregates, atomic delete) that are
+# not deployed in this database; callers fall back to their PostgREST path
+_missing_rpcs: Set[str] = set()
+
+
+async def _rpc_rows(name: str, params: Dict) -> Optional[Any]:
+    """Call a Postgres function via PostgREST; None if the function is not deployed"""
+    if name in _missing_rpcs:
+        return None
+    try:
+        response = await _execute(_db().rpc(name, params))
+    except Exception as exc:
+        if "Could not find the function" not in str(exc):
+            raise
+        _missing_rpcs.add(name)
+        logger.warning("⚠️ RPC %s not found; using the fallback path (apply the pending Supabase migrations)", name)
+        return None
+    return response.data or []
+
+
+async def _room_usage(schedule_id: int) -> Dict[str, int]:
+    """Used slots per room id (as string) for a schedule, grouped in SQL when possible"""
+    rows = await _rpc_rows("room_utilization", {"p_schedule_id": schedule_id})
+    if rows is not None:
+        return {row["room_id"]: row["used_slots"] for row in rows}
+    # Only the grouping column crosses the wire, not full allocation rows
     response = await _execute(
-        _db().table("room_allocations")
-        .select("*")
-        .eq("schedule_id", schedule_id)
-        .eq("schedule_day", day_of_week)
-        .eq("teacher_id", teacher_id)
+        _db().table("room_allocations").select("room_id").eq("schedule_id", schedule_id)
     )
-    return response.data or []
+    return Counter(str(e["room_id"]) for e in response.data or [])
+
+
+# "HH:MM - HH:MM" as stored in room_allocations.schedule_time
+SCHEDULE_TIME_RANGE_PATTERN = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*$")
+DEFAULT_ENTRY_MINUTES = 90  # Used when an entry has no parseable time range
+
+
+def _entry_minutes(entry: Dict) -> int:
+    """Length of a schedule entry in minutes, from its time range"""
+    match = SCHEDULE_TIME_RANGE_PATTERN.match(entry.get("schedule_time") or "")
+    if not match:
+        return DEFAULT_ENTRY_MINUTES
+    start_h, start_m, end_h, end_m = map(int, match.groups())
+    return max(0, (end_h * 60 + end_m) - (start_h * 60 + start_m))
+
+
+async def _teacher_usage(schedule_id: int) -> Dict[str, Tuple[int, int, int, List[str]]]:
+    """
+    (entry count, total minutes, distinct sections, days in first-seen order) per
+    teacher id (as string) for a schedule, grouped in SQL when possible
+    """
+    rows = await _rpc_rows("teacher_workload", {"p_schedule_id": schedule_id})
+    if rows is not None:
+        return {
+            row["teacher_id"]: (
+                row["entry_count"],
+                # Older deployments of the function don't return minutes yet
+                row.get("total_minutes", row["entry_count"] * DEFAULT_ENTRY_MINUTES),
+                row["sections_count"],
+                row["days_working"] or []
+            )
+            for row in rows
+        }
+
+    # Group entries per teacher in one pass instead of one scan per teacher
+    entry_count: Dict[str, int] = Counter()
+    total_minutes: Dict[str, int] = Counter()
+    days_by_teacher: Dict[str, Dict[str, None]] = defaultdict(dict)  # dict keys keep first-seen order
+    sections_by_teacher: Dict[str, set] = defaultdict(set)
+    for e in await get_schedule_entries(schedule_id):
+        teacher_id = str(e.get("teacher_id"))
+        entry_count[teacher_id] += 1
+        total_minutes[teacher_id] += _entry_minutes(e)
+        day = e.get("day_of_week") or e.get("schedule_day")
+        if day:
+            days_by_teacher[teacher_id][day] = None
+        if e.get("section_id") is not None:
+            sections_by_teacher[teacher_id].add(e.get("section_id"))
+    return {
+        teacher_id: (
+            count, total_minutes[teacher_id], len(sections_by_teacher[teacher_id]), list(days_by_teacher[teacher_id])
+        )
+        for teacher_id, count in entry_count.items()
+    }
 
 
-# ==================== Analytics ====================
 async def get_room_utilization(schedule_id: int) -> List[Dict]:
     """Calculate room utilization for a schedule"""
-    entries = await get_schedule_entries(schedule_id)
-    rooms = await get_all_rooms()
+    # Independent queries: fetch concurrently
+    used_by_room, rooms, time_slots = await asyncio.gather(
+        _room_usage(schedule_id), get_all_rooms(), get_time_slots()
+    )
     
     # Calculate total possible slots (rooms * days * time_slots)
-    time_slots = await get_time_slots()
-    days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
-    total_slots_per_room = len(time_slots) * len(days)
+    total_slots_per_room = len(time_slots) * len(SCHEDULE_DAYS)
+    percent_per_slot = 100 / total_slots_per_room if total_slots_per_room > 0 else 0
     
     utilization = []
     for room in rooms:
-        used_slots = len([e for e in entries if e["room_id"] == room["id"]])
+        used_slots = used_by_room.get(str(room["id"]), 0)
         utilization.append({
             "room_id": room["id"],
             "room_code": room["room_code"],
             "room_name": room["room_name"],
             "total_slots": total_slots_per_room,
             "used_slots": used_slots,
-            "utilization_percentage": round((used_slots / total_slots_per_room) * 100, 2) if total_slots_per_room > 0 else 0
+            "utilization_percentage": round(used_slots * percent_per_slot, 2) if total_slots_per_room > 0 else 0
         })
     
     return utilization
@@ -413,39 +1025,65 @@ async def get_room_utilization(schedule_id: int) -> List[Dict]:
 
 async def get_teacher_workload(schedule_id: int) -> List[Dict]:
     """Calculate teacher workload for a schedule"""
-    entries = await get_schedule_entries(schedule_id)
-    teachers = await get_all_teachers()
+    usage, teachers = await asyncio.gather(_teacher_usage(schedule_id), get_all_teachers())
     
     workload = []
     for teacher in teachers:
-        teacher_entries = [e for e in entries if e.get("teacher_id") == teacher.get("id")]
-        days_working = list(
-            set(
-                [
-                    (e.get("day_of_week") or e.get("schedule_day"))
-                    for e in teacher_entries
-                    if (e.get("day_of_week") or e.get("schedule_day"))
-                ]
-            )
-        )
-        
+        teacher_id = teacher.get("id")
+        _, minutes, sections_count, days_working = usage.get(str(teacher_id), (0, 0, 0, []))
         workload.append({
-            "teacher_id": teacher.get("id"),
+            "teacher_id": teacher_id,
             "teacher_name": teacher.get("name") or teacher.get("full_name") or "",
-            "total_hours": len(teacher_entries) * 1.5,  # Assuming 90 min per slot
-            "sections_count": len(set([e.get("section_id") for e in teacher_entries if e.get("section_id") is not None])),
+            "total_hours": round(minutes / 60, 2),
+            "sections_count": sections_count,
             "days_working": days_working
         })
     
     return workload
 
 
+# ==================== Scheduler Snapshot ====================
+
+async def get_scheduler_snapshot(
+    semester: str,
+    academic_year: str,
+    department: Optional[str] = None
+) -> Dict[str, List[Dict]]:
+    """
+    Sections (with room feature buckets), rooms, teachers and time slots for a
+    generation run in one round-trip via the scheduler_snapshot RPC; falls back
+    to the individual fetches, run concurrently, when it is not deployed
+    """
+    snapshot = await _rpc_rows("scheduler_snapshot", {
+        "p_semester": semester, "p_academic_year": academic_year, "p_department": department
+    })
+    if snapshot is not None:
+        sections = snapshot.get("sections") or []
+        if "requirements" in snapshot:
+            # Older scheduler_snapshot: raw requirement rows instead of the
+            # course_room_features buckets already merged into each section
+            _apply_room_requirements(sections, snapshot["requirements"] or [])
+        return {
+            "sections": sections,
+            "rooms": snapshot.get("rooms") or [],
+            "teachers": _with_teacher_names(snapshot.get("teachers") or []),
+            "time_slots": snapshot.get("time_slots") or [],
+        }
+
+    sections, rooms, teachers, time_slots = await asyncio.gather(
+        get_sections_for_scheduling(semester, academic_year, department),
+        get_all_rooms(),
+        get_all_teachers(),
+        get_time_slots()
+    )
+    return {"sections": sections, "rooms": rooms, "teachers": teachers, "time_slots": time_slots}
+
+
 # ==================== Generated Schedules & Room Allocations ====================
 
 async def create_generated_schedule(schedule_data: Dict) -> Dict:
     """Create a new generated schedule record"""
-    response = await _execute(_db().table("generated_schedules").insert(schedule_data))
-    return response.data[0] if response.data else {}
+    return await _insert_one("generated_schedules", schedule_data)
 
 
 async def update_generated_schedule(schedule_id: int, update_data: Dict) -> Dict:
@@ -453,6 +1091,7 @@ async def update_generated_schedule(schedule_id: int, update_data: Dict) -> Dict
     response = await _execute(
         _db().table("generated_schedules").update(update_data).eq("id", schedule_id)
     )
+    _invalidate_schedule_reads([schedule_id])
     return response.data[0] if response.data else {}
 
 
@@ -463,22 +1102,25 @@ async def save_room_allocations(allocations: List[Dict]) -> List[Dict]:
 
     # Handle schema drift gracefully (e.g., environments that have not yet added
     # optional analytics columns like day_of_week/section_id/teacher_id).
-    payload = [dict(item) for item in allocations]
+    # Dropping a column builds new row dicts, so the caller's rows are never mutated
+    # and the first attempt can send them as they are
+    payload = list(allocations)
     removed_columns: List[str] = []
 
     for _ in range(12):
         try:
-            response = await _execute(_db().table("room_allocations").insert(payload))
+            inserted = await _insert_rows("room_allocations", payload)
+            schedule_ids = {item.get("schedule_id") for item in payload}
+            _invalidate_conflict_index(schedule_ids)
+            _invalidate_schedule_reads(schedule_ids)
             if removed_columns:
-                print(
-                    "⚠️ room_allocations insert fallback removed unknown columns: "
-                    f"{', '.join(removed_columns)}"
-                )
-                print(
+                logger.warning(
+                    "⚠️ room_allocations insert fallback removed unknown columns: %s\n"
                     "   ↳ Recommended fix: apply Supabase migration "
-                    "202604060001_add_room_allocations_analytics_columns.sql"
+                    "202604060001_add_room_allocations_analytics_columns.sql",
+                    ", ".join(removed_columns)
                 )
-            return response.data or []
+            return inserted
         except Exception as exc:
             message = str(exc)
             match = re.search(r"Could not find the '([^']+)' column", message)
@@ -508,33 +1150,53 @@ async def get_generated_schedules() -> List[Dict]:
 
 async def get_generated_schedule_by_id(schedule_id: int) -> Optional[Dict]:
     """Get a specific generated schedule by ID with its allocations"""
-    schedule_response = await _execute(
-        _db().table("generated_schedules").select("*").eq("id", schedule_id)
+    # Both reads only depend on schedule_id, so issue them together
+    schedule_rows, allocations = await asyncio.gather(
+        _schedule_rows(str(schedule_id)), _schedule_allocation_rows(str(schedule_id))
     )
     
-    if not schedule_response.data:
+    if not schedule_rows:
         return None
     
-    schedule = schedule_response.data[0]
-    
-    # Get room allocations for this schedule
-    allocations_response = await _execute(
-        _db().table("room_allocations").select("*").eq("schedule_id", schedule_id)
-    )
-    
-    schedule["allocations"] = allocations_response.data or []
+    schedule = schedule_rows[0]
+    schedule["allocations"] = allocations
     return schedule
 
 
 async def delete_generated_schedule(schedule_id: int) -> bool:
     """Delete a generated schedule and its allocations (cascade delete handles allocations)"""
     await _execute(_db().table("generated_schedules").delete().eq("id", schedule_id))
+    _invalidate_conflict_index([schedule_id])
+    _invalidate_schedule_reads([schedule_id])
     return True
 
 
 async def get_room_allocations_by_schedule(schedule_id: int) -> List[Dict]:
     """Get all room allocations for a schedule"""
-    response = await _execute(
-        _db().table("room_allocations").select("*").eq("schedule_id", schedule_id)
-    )
+    return await _schedule_allocation_rows(str(schedule_id))
+
+
+async def get_schedule_entries_filtered(
+    schedule_id: int,
+    *,
+    room_id: Optional[int] = None,
+    teacher_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+    day: Optional[str] = None
+) -> List[Dict]:
+    """Get a schedule's room allocations filtered in the query, so only matching rows are sent"""
+    query = _db().table("room_allocations").select("*").eq("schedule_id", schedule_id)
+    if room_id is not None:
+        query = query.eq("room_id", room_id)
+    if teacher_id is not None:
+        query = query.eq("teacher_id", teacher_id)
+    if section_id is not None:
+        query = query.eq("section_id", section_id)
+    if day is not None:
+        # Day names are letters only; anything else would be read as a pattern
+        if not day.isalpha():
+            return []
+        # ilike without wildcards is a case-insensitive equality test
+        query = query.ilike("schedule_day", day)
+    response = await _execute(query)
     return response.data or []
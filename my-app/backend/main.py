@@ -7,39 +7,117 @@ This API provides endpoints for:
 - Viewing and analyzing scheduling results
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any, Union, Deque
 from datetime import datetime
-from collections import deque
+from collections import Counter, deque
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 import asyncio
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import multiprocessing
 import time
+import traceback
 import uuid
 import uvicorn
 import os
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+# Load environment variables
+load_dotenv()
+
+# Backend modules log through `logging` (LOG_LEVEL=WARNING hides info messages);
+# the bare format keeps their console output looking like the API's own prints
+logging.basicConfig(
+    level=getattr(logging, (os.getenv("LOG_LEVEL") or "INFO").upper(), logging.INFO),
+    format="%(message)s"
+)
+
 from models import (
     Room, Course, Section, Teacher, TimeSlot, 
     ScheduleEntry, GenerateScheduleRequest, ScheduleResult,
     RoomType, DayOfWeek
 )
 from database import (
-    get_supabase_client, get_all_rooms, get_sections_for_scheduling, get_all_sections,
-    get_all_teachers, get_time_slots, save_schedule_entries, get_available_rooms,
+    get_supabase_client, get_all_rooms, get_all_sections,
+    get_all_teachers, get_time_slots, save_schedule_entries, get_available_rooms, get_room_by_id,
     check_room_conflicts, check_teacher_conflicts, get_room_utilization,
     get_schedule_by_id, delete_schedule, get_all_schedules,
     create_generated_schedule, update_generated_schedule, save_room_allocations,
     get_generated_schedules, get_generated_schedule_by_id, delete_generated_schedule,
-    get_room_allocations_by_schedule
+    get_room_allocations_by_schedule, get_schedule_entries_filtered, get_scheduler_snapshot, get_connection_pool_stats,
+    ROOM_LIST_COLUMNS, SECTION_COLUMNS, SECTION_LIST_COLUMNS,
+    warm_async_supabase_client, close_async_supabase_client, close_pg_pool
 )
 from scheduler import run_scheduler
 # Import enhanced v2 scheduler with 30-min slots and validation
 from scheduler_v2 import run_enhanced_scheduler, generate_30min_slots, generate_time_slots, validate_scheduling_data
 
-# Load environment variables
-load_dotenv()
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (much faster on large allocation lists)."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Reference data (rooms, teachers, time slots) rarely changes: browsers may reuse a
+# response this long, then revalidate it with If-None-Match against the ETag
+REFERENCE_HTTP_MAX_AGE_SECONDS = max(0, int(os.getenv("REFERENCE_HTTP_MAX_AGE_SECONDS", "60") or 0))
+
+
+def _not_modified(request: Request, response: Response, data: Any) -> Optional[Response]:
+    """Tag a GET response with ETag/Cache-Control; return a 304 if the client's copy is current."""
+    if orjson is not None:
+        body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(data, sort_keys=True, default=str).encode()
+    headers = {
+        "ETag": f'"{hashlib.sha1(body).hexdigest()}"',
+        "Cache-Control": f"private, max-age={REFERENCE_HTTP_MAX_AGE_SECONDS}, stale-while-revalidate=300",
+    }
+    client_tags = {
+        tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")
+    }
+    if headers["ETag"] in client_tags or "*" in client_tags:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the scheduler worker and DB connection on boot; stop them on shutdown."""
+    # Blocking supabase-py calls (health check, RL persistence) go through
+    # asyncio.to_thread; size its executor so they don't queue behind each other.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=IO_THREAD_WORKERS, thread_name_prefix="io")
+    )
+    # Submitting a no-op spawns the worker now, so its initializer (scheduler
+    # imports) runs before the first generate request instead of during it.
+    _get_scheduler_process_pool().submit(os.getpid)
+    # Connect the async Supabase client in the background so boot isn't held up
+    warmup = asyncio.create_task(warm_async_supabase_client())
+    yield
+    warmup.cancel()
+    _shutdown_scheduler_process_pool()
+    await close_async_supabase_client()
+    await close_pg_pool()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -47,7 +125,9 @@ app = FastAPI(
     description="Quantum-Inspired Optimization for Class Room Scheduling",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 
@@ -64,6 +144,18 @@ schedule_generation_active_job: Optional[str] = None
 schedule_generation_condition = asyncio.Condition()
 SCHEDULE_QUEUE_MAX_WAIT_SECONDS = max(30, int(os.getenv("SCHEDULE_QUEUE_MAX_WAIT_SECONDS", "600")))
 SCHEDULE_QUEUE_MAX_LENGTH = max(0, int(os.getenv("SCHEDULE_QUEUE_MAX_LENGTH", "0") or 0))
+SCHEDULE_QUEUE_STREAM_HEARTBEAT_SECONDS = max(5, int(os.getenv("SCHEDULE_QUEUE_STREAM_HEARTBEAT_SECONDS", "15") or 15))
+# Each open stream holds one of uvicorn's --limit-concurrency slots, so streams are
+# closed after this long and EventSource reconnects after the retry delay
+SCHEDULE_QUEUE_STREAM_MAX_SECONDS = max(30, int(os.getenv("SCHEDULE_QUEUE_STREAM_MAX_SECONDS", "180") or 180))
+SCHEDULE_QUEUE_STREAM_RETRY_MS = max(1000, int(os.getenv("SCHEDULE_QUEUE_STREAM_RETRY_MS", "5000") or 5000))
+# Background generation jobs (?background=true), kept for polling until their results expire.
+# Job state lives in this process's memory, so a poll routed to another worker would
+# 404: background mode is refused when WEB_CONCURRENCY (uvicorn's worker count) > 1
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1") or 1))
+SCHEDULE_JOB_RESULT_TTL_SECONDS = max(60, int(os.getenv("SCHEDULE_JOB_RESULT_TTL_SECONDS", "3600") or 3600))
+schedule_generation_jobs: Dict[str, Dict[str, Any]] = {}
+schedule_generation_job_expiry: Dict[str, float] = {}  # job_id -> monotonic expiry, set when finished
 
 
 def _is_free_tier_resource_profile_enabled() -> bool:
@@ -89,6 +181,7 @@ async def _acquire_schedule_generation_slot(job_id: str) -> Dict[str, Any]:
 
         initial_position = len(schedule_generation_queue) + (1 if schedule_generation_active_job else 0) + 1
         schedule_generation_queue.append(job_id)
+        schedule_generation_condition.notify_all()
         deadline = queued_at + SCHEDULE_QUEUE_MAX_WAIT_SECONDS
 
         try:
@@ -115,6 +208,7 @@ async def _acquire_schedule_generation_slot(job_id: str) -> Dict[str, Any]:
 
         schedule_generation_queue.popleft()
         schedule_generation_active_job = job_id
+        schedule_generation_condition.notify_all()
 
         return {
             "job_id": job_id,
@@ -125,6 +219,14 @@ async def _acquire_schedule_generation_slot(job_id: str) -> Dict[str, Any]:
         }
 
 
+def _prune_generation_jobs() -> None:
+    """Forget finished background jobs whose results have expired."""
+    now = time.monotonic()
+    for job_id in [j for j, expires_at in schedule_generation_job_expiry.items() if expires_at <= now]:
+        del schedule_generation_job_expiry[job_id]
+        schedule_generation_jobs.pop(job_id, None)
+
+
 async def _release_schedule_generation_slot(job_id: str):
     """Release the active slot and wake the next queued request."""
     global schedule_generation_active_job
@@ -140,6 +242,49 @@ async def _release_schedule_generation_slot(job_id: str):
                 pass
         schedule_generation_condition.notify_all()
 
+
+# ========================
+# Scheduler Process Pool
+# ========================
+
+# The annealers are pure-Python CPU loops; running them in a worker process keeps
+# the event loop (and every other endpoint) responsive instead of sharing the GIL.
+SCHEDULER_PROCESS_WORKERS = max(1, int(os.getenv("SCHEDULER_PROCESS_WORKERS", "1") or 1))
+scheduler_process_pool: Optional[ProcessPoolExecutor] = None
+# Threads for blocking I/O offloaded with asyncio.to_thread
+IO_THREAD_WORKERS = max(1, int(os.getenv("IO_THREAD_WORKERS", "32") or 32))
+
+
+def _get_scheduler_process_pool() -> ProcessPoolExecutor:
+    """Create the scheduler worker pool on first use."""
+    global scheduler_process_pool
+
+    if scheduler_process_pool is None:
+        scheduler_process_pool = ProcessPoolExecutor(
+            max_workers=SCHEDULER_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            # Import the (large) v2 scheduler once per worker instead of on its first job.
+            # Passed by name so the worker never has to import this API module.
+            initializer=importlib.import_module,
+            initargs=(run_enhanced_scheduler.__module__,),
+        )
+    return scheduler_process_pool
+
+
+def _shutdown_scheduler_process_pool() -> None:
+    """Stop the worker pool without waiting on an in-flight schedule."""
+    global scheduler_process_pool
+
+    if scheduler_process_pool is not None:
+        scheduler_process_pool.shutdown(wait=False, cancel_futures=True)
+        scheduler_process_pool = None
+
+
+async def _run_scheduler_in_process(func, **kwargs) -> Dict[str, Any]:
+    """Run a scheduler entry point in the worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_scheduler_process_pool(), functools.partial(func, **kwargs))
+
 # Build allowed origins list for CORS
 def get_allowed_origins():
     """Get list of allowed origins including Vercel preview URLs"""
@@ -166,8 +311,11 @@ app.add_middleware(
     allow_origins=get_allowed_origins(),
     allow_origin_regex=r"https://.*\.vercel\.app",  # Allow all Vercel preview URLs
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists instead of "*": only what the frontend actually sends, and
+    # preflight responses are cached so browsers skip the extra OPTIONS round-trip.
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Accept", "Authorization"],
+    max_age=max(0, int(os.getenv("CORS_MAX_AGE_SECONDS", "3600") or 0)),
 )
 
 
@@ -191,8 +339,8 @@ async def health_check():
     """Detailed health check"""
     try:
         client = get_supabase_client()
-        # Simple query to verify DB connection (sync client, no await needed)
-        await asyncio.to_thread(client.table("rooms").select("id").limit(1).execute)
+        # HEAD request: verifies the DB connection without transferring rows
+        await asyncio.to_thread(client.table("rooms").select("id", head=True).limit(1).execute)
         db_status = "connected"
     except Exception as e:
         db_status = "error"
@@ -201,22 +349,86 @@ async def health_check():
         "status": "healthy" if db_status == "connected" else "degraded",
         "database": db_status,
         "configured": bool(os.getenv("SUPABASE_URL")) and bool(os.getenv("SUPABASE_SERVICE_ROLE_KEY")),
+        "pools": get_connection_pool_stats(),
         "timestamp": datetime.utcnow().isoformat()
     }
 
 
+def _schedule_queue_snapshot() -> Dict[str, Any]:
+    """Queue state; caller must hold schedule_generation_condition."""
+    return {
+        "active": schedule_generation_active_job is not None,
+        "waiting_count": len(schedule_generation_queue),
+        "active_job_id": schedule_generation_active_job,
+        "queued_job_ids": list(schedule_generation_queue),
+        "max_wait_seconds": SCHEDULE_QUEUE_MAX_WAIT_SECONDS,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
 @app.get("/api/schedules/generate/queue-status")
 async def get_schedule_generation_queue_status():
     """Get current FIFO queue status for schedule generation requests."""
     async with schedule_generation_condition:
-        return {
-            "active": schedule_generation_active_job is not None,
-            "waiting_count": len(schedule_generation_queue),
-            "active_job_id": schedule_generation_active_job,
-            "queued_job_ids": list(schedule_generation_queue),
-            "max_wait_seconds": SCHEDULE_QUEUE_MAX_WAIT_SECONDS,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        return _schedule_queue_snapshot()
+
+
+@app.get("/api/schedules/generate/queue-status/stream")
+async def stream_schedule_generation_queue_status(request: Request):
+    """
+    Server-Sent Events feed of the queue status.
+    Pushes a snapshot whenever a job joins, starts or leaves the queue, so
+    clients can subscribe once (EventSource) instead of polling queue-status.
+    The stream ends after SCHEDULE_QUEUE_STREAM_MAX_SECONDS; the retry field
+    tells EventSource when to reconnect.
+    """
+    async def event_stream():
+        deadline = time.monotonic() + SCHEDULE_QUEUE_STREAM_MAX_SECONDS
+        yield f"retry: {SCHEDULE_QUEUE_STREAM_RETRY_MS}\n\n"
+        while time.monotonic() < deadline and not await request.is_disconnected():
+            async with schedule_generation_condition:
+                snapshot = _schedule_queue_snapshot()
+            yield f"data: {json.dumps(snapshot)}\n\n"
+
+            async with schedule_generation_condition:
+                try:
+                    await asyncio.wait_for(
+                        schedule_generation_condition.wait(),
+                        timeout=min(SCHEDULE_QUEUE_STREAM_HEARTBEAT_SECONDS, max(0.0, deadline - time.monotonic())),
+                    )
+                except asyncio.TimeoutError:
+                    # Heartbeat: resend the snapshot so proxies keep the connection open
+                    pass
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/schedules/generate/jobs/{job_id}")
+async def get_schedule_generation_job(job_id: str):
+    """
+    Status of a background generation job: queued (with queue_position), running,
+    completed (with result) or failed (with error).
+    """
+    _prune_generation_jobs()
+    job = schedule_generation_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Generation job not found")
+    
+    status = dict(job)
+    if status["status"] == "queued":
+        async with schedule_generation_condition:
+            if schedule_generation_active_job == job_id:
+                status["status"] = "running"
+            elif job_id in schedule_generation_queue:
+                status["queue_position"] = (
+                    list(schedule_generation_queue).index(job_id) + 1
+                    + (1 if schedule_generation_active_job else 0)
+                )
+    return status
 
 
 # ========================
@@ -237,6 +449,8 @@ class RoomResponse(BaseModel):
 
 @app.get("/api/rooms", response_model=List[RoomResponse])
 async def list_rooms(
+    request: Request,
+    response: Response,
     campus: Optional[str] = None,
     building: Optional[str] = None,
     room_type: Optional[str] = None,
@@ -248,14 +462,11 @@ async def list_rooms(
         rooms = await get_available_rooms(
             room_type=room_type,
             min_capacity=min_capacity or 0,
-            campus=campus
+            campus=campus,
+            columns=ROOM_LIST_COLUMNS,
+            building=building
         )
-        
-        # Client-side filtering only if needed
-        if building:
-            rooms = [r for r in rooms if r.get("building") == building]
-        
-        return rooms
+        return _not_modified(request, response, rooms) or rooms
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to retrieve rooms")
 
@@ -264,9 +475,7 @@ async def list_rooms(
 async def get_room(room_id: int):
     """Get a specific room by ID"""
     try:
-        # Fetch all rooms and find by ID (efficient since rooms list is typically small)
-        rooms = await get_all_rooms()
-        room = next((r for r in rooms if r.get("id") == room_id), None)
+        room = await get_room_by_id(room_id)
         if not room:
             raise HTTPException(status_code=404, detail="Room not found")
         return room
@@ -305,18 +514,17 @@ async def get_room_utilization_stats(room_id: int, schedule_id: Optional[int] =
 @app.get("/api/sections")
 async def list_sections(
     department: Optional[str] = None,
-    course_code: Optional[str] = None
+    course_code: Optional[str] = None,
+    fields: Optional[str] = None
 ):
-    """Get all sections with optional filtering"""
+    """Get all sections with optional filtering (?fields=summary for course identity only)"""
     try:
-        # Database-level filtering for department
-        sections = await get_all_sections(department)
-        
-        # Client-side filtering only for course_code (less likely to be indexed)
-        if course_code:
-            sections = [s for s in sections if s.get("course_code") == course_code]
-        
-        return sections
+        # Database-level filtering for department and course code
+        return await get_all_sections(
+            department,
+            columns=SECTION_LIST_COLUMNS if fields == "summary" else SECTION_COLUMNS,
+            course_code=course_code
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to retrieve sections")
 
@@ -326,12 +534,12 @@ async def list_sections(
 # ========================
 
 @app.get("/api/teachers")
-async def list_teachers(department: Optional[str] = None):
+async def list_teachers(request: Request, response: Response, department: Optional[str] = None):
     """Get all teachers with optional filtering"""
     try:
         teachers = await get_all_teachers(department)
         
-        return teachers
+        return _not_modified(request, response, teachers) or teachers
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to retrieve teachers")
 
@@ -341,11 +549,11 @@ async def list_teachers(department: Optional[str] = None):
 # ========================
 
 @app.get("/api/time-slots")
-async def list_time_slots():
+async def list_time_slots(request: Request, response: Response):
     """Get all available time slots"""
     try:
         slots = await get_time_slots()
-        return slots
+        return _not_modified(request, response, slots) or slots
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to retrieve time slots")
 
@@ -465,6 +673,13 @@ class ScheduleGenerationRequest(BaseModel):
     
     # Use enhanced scheduler
     use_enhanced_scheduler: bool = True
+    # Original scheduler only: annealing chains run side by side (0 = one per CPU core).
+    # Opt-in: each chain beyond the first adds a process inside the scheduler worker
+    parallel_chains: Optional[int] = None
+    # Original scheduler only: "geometric" (cooling_rate) or "modified_lam";
+    # lam_restart_iterations > 0 restarts the Lam curve with doubling segments
+    cooling_schedule: str = "geometric"
+    lam_restart_iterations: int = 0
 
     # Resource tuning (optional). Keep quality-first defaults.
     low_resource_mode: bool = False
@@ -540,16 +755,94 @@ class ScheduleGenerationResponse(BaseModel):
     queue_max_wait_seconds: Optional[int] = 0
 
 
+def _build_request_time_slots(request: ScheduleGenerationRequest) -> List[Dict[str, Any]]:
+    """Slot dicts for the request's campus hours and slot duration, skipping the lunch gap."""
+    lunch_start = request.lunch_start if request.lunch_mode != 'none' else None
+    lunch_end = request.lunch_end if request.lunch_mode != 'none' else None
+    return [
+        {
+            'id': s.id,
+            'slot_name': s.slot_name,
+            'start_time': s.start_time,
+            'end_time': s.end_time,
+            'duration_minutes': s.duration_minutes
+        }
+        for s in generate_time_slots(request.start_time, request.end_time, request.slot_duration, lunch_start=lunch_start, lunch_end=lunch_end)
+    ]
+
+
+def _validate_generation_request(request: ScheduleGenerationRequest) -> None:
+    """Reject malformed generation requests before they join the queue."""
+    if not request.schedule_name or not request.schedule_name.strip():
+        raise HTTPException(status_code=400, detail="schedule_name is required")
+    if not request.semester or not request.semester.strip():
+        raise HTTPException(status_code=400, detail="semester is required")
+    if not request.academic_year or not request.academic_year.strip():
+        raise HTTPException(status_code=400, detail="academic_year is required")
+    if request.max_iterations < 100:
+        raise HTTPException(status_code=400, detail="max_iterations must be at least 100")
+    if request.cooling_rate <= 0 or request.cooling_rate >= 1:
+        raise HTTPException(status_code=400, detail="cooling_rate must be between 0 and 1")
+    if request.initial_temperature <= 0:
+        raise HTTPException(status_code=400, detail="initial_temperature must be positive")
+
+
 @app.post("/api/schedules/generate", response_model=ScheduleGenerationResponse)
-async def generate_schedule(request: ScheduleGenerationRequest):
+async def generate_schedule(
+    request: ScheduleGenerationRequest,
+    background_tasks: BackgroundTasks,
+    background: bool = False
+):
     """
     Generate a new class schedule using quantum-inspired annealing.
     
     This endpoint accepts data directly from frontend or fetches from database.
     Supports 30-minute time slot intervals for flexible scheduling.
+    
+    With ?background=true the request is queued and answered at once with 202
+    and a job id; poll GET /api/schedules/generate/jobs/{job_id} for its status
+    and, once completed, the same response body the blocking call returns.
+    Jobs are tracked in process memory, so background mode requires one worker.
     """
+    _validate_generation_request(request)
+    job_id = uuid.uuid4().hex
+    if not background:
+        return await _generate_schedule(request, job_id)
+    if WEB_CONCURRENCY > 1:
+        raise HTTPException(
+            status_code=503,
+            detail="Background generation needs a single server worker (WEB_CONCURRENCY=1)"
+        )
+    
+    _prune_generation_jobs()
+    job = {"job_id": job_id, "status": "queued", "created_at": datetime.utcnow().isoformat()}
+    schedule_generation_jobs[job_id] = job
+    background_tasks.add_task(_run_generation_job, job_id, request)
+    return JSONResponse(
+        status_code=202,
+        content={**job, "status_url": f"/api/schedules/generate/jobs/{job_id}"}
+    )
+
+
+async def _run_generation_job(job_id: str, request: ScheduleGenerationRequest) -> None:
+    """Run a background generation job and keep its outcome for polling."""
+    job = schedule_generation_jobs[job_id]
+    try:
+        result = await _generate_schedule(request, job_id)
+        job.update(status="completed", result=result.model_dump())
+    except HTTPException as e:
+        job.update(status="failed", error={"status_code": e.status_code, "detail": e.detail})
+    except asyncio.CancelledError:
+        job.update(status="failed", error={"status_code": 503, "detail": "Server shut down before the job finished"})
+        raise
+    finally:
+        job["finished_at"] = datetime.utcnow().isoformat()
+        schedule_generation_job_expiry[job_id] = time.monotonic() + SCHEDULE_JOB_RESULT_TTL_SECONDS
+
+
+async def _generate_schedule(request: ScheduleGenerationRequest, queue_job_id: str) -> ScheduleGenerationResponse:
+    """Queue, run and save one schedule generation; the body behind generate_schedule."""
     try:
-        queue_job_id: Optional[str] = None
         queue_info: Dict[str, Any] = {
             "job_id": None,
             "initial_position": None,
@@ -559,22 +852,7 @@ async def generate_schedule(request: ScheduleGenerationRequest):
         }
         queue_slot_acquired = False
 
-        # Input validation
-        if not request.schedule_name or not request.schedule_name.strip():
-            raise HTTPException(status_code=400, detail="schedule_name is required")
-        if not request.semester or not request.semester.strip():
-            raise HTTPException(status_code=400, detail="semester is required")
-        if not request.academic_year or not request.academic_year.strip():
-            raise HTTPException(status_code=400, detail="academic_year is required")
-        if request.max_iterations < 100:
-            raise HTTPException(status_code=400, detail="max_iterations must be at least 100")
-        if request.cooling_rate <= 0 or request.cooling_rate >= 1:
-            raise HTTPException(status_code=400, detail="cooling_rate must be between 0 and 1")
-        if request.initial_temperature <= 0:
-            raise HTTPException(status_code=400, detail="initial_temperature must be positive")
-
         # Queue all schedule generation calls (user/admin) in FIFO order.
-        queue_job_id = uuid.uuid4().hex
         queue_info = await _acquire_schedule_generation_slot(queue_job_id)
         queue_slot_acquired = True
         print(
@@ -592,6 +870,7 @@ async def generate_schedule(request: ScheduleGenerationRequest):
         print(f"⏰ Slot Duration: {request.slot_duration} minutes")
         print(f"🏫 Campus Hours: {request.start_time} - {request.end_time}")
         
+        all_teachers: Optional[List[Dict]] = None  # Already loaded when the snapshot is used
         # Use direct data from frontend if provided, otherwise fetch from database
         if request.sections_data and request.rooms_data:
             print("📦 Using data provided directly from frontend")
@@ -599,21 +878,10 @@ async def generate_schedule(request: ScheduleGenerationRequest):
             rooms = [r.model_dump() for r in request.rooms_data]
             
             # Generate time slots using frontend's slot duration (skip lunch gap)
-            lunch_start_str = request.lunch_start if request.lunch_mode != 'none' else None
-            lunch_end_str = request.lunch_end if request.lunch_mode != 'none' else None
             if request.use_enhanced_scheduler:
                 # Use frontend's slot_duration (e.g., 90 minutes)
-                time_slots = [
-                    {
-                        'id': s.id,
-                        'slot_name': s.slot_name,
-                        'start_time': s.start_time,
-                        'end_time': s.end_time,
-                        'duration_minutes': s.duration_minutes
-                    }
-                    for s in generate_time_slots(request.start_time, request.end_time, request.slot_duration, lunch_start=lunch_start_str, lunch_end=lunch_end_str)
-                ]
-                print(f"⏰ Generated {len(time_slots)} time slots of {request.slot_duration} minutes ({request.start_time} - {request.end_time}, lunch gap: {lunch_start_str}-{lunch_end_str})")
+                time_slots = _build_request_time_slots(request)
+                print(f"⏰ Generated {len(time_slots)} time slots of {request.slot_duration} minutes ({request.start_time} - {request.end_time}, lunch: {request.lunch_mode} {request.lunch_start}-{request.lunch_end})")
             elif request.time_slots:
                 time_slots = [t.model_dump() for t in request.time_slots]
                 print(f"⏰ Using {len(time_slots)} custom time slots from frontend")
@@ -622,24 +890,16 @@ async def generate_schedule(request: ScheduleGenerationRequest):
                 print(f"⏰ Using {len(time_slots)} time slots from database")
         else:
             print("🔍 Fetching data from database")
-            all_sections = await get_sections_for_scheduling(request.semester, request.academic_year)
-            all_rooms = await get_all_rooms()
+            # Sections, rooms, teachers and time slots in one round-trip
+            snapshot = await get_scheduler_snapshot(request.semester, request.academic_year)
+            all_sections = snapshot["sections"]
+            all_rooms = snapshot["rooms"]
+            all_teachers = snapshot["teachers"]
             
-            lunch_start_str2 = request.lunch_start if request.lunch_mode != 'none' else None
-            lunch_end_str2 = request.lunch_end if request.lunch_mode != 'none' else None
             if request.use_enhanced_scheduler:
-                time_slots = [
-                    {
-                        'id': s.id,
-                        'slot_name': s.slot_name,
-                        'start_time': s.start_time,
-                        'end_time': s.end_time,
-                        'duration_minutes': s.duration_minutes
-                    }
-                    for s in generate_time_slots(request.start_time, request.end_time, request.slot_duration, lunch_start=lunch_start_str2, lunch_end=lunch_end_str2)
-                ]
+                time_slots = _build_request_time_slots(request)
             else:
-                time_slots = await get_time_slots()
+                time_slots = snapshot["time_slots"]
             
             # Filter sections if specific IDs provided
             if request.section_ids:
@@ -692,12 +952,22 @@ async def generate_schedule(request: ScheduleGenerationRequest):
             "combine_split_lectures": request.combine_split_lectures,
             "allow_g1_g2_split_sessions": request.allow_g1_g2_split_sessions,
             "enforce_g1_g2_equal_hours": request.enforce_g1_g2_equal_hours,
-            "faculty_types": request.faculty_types,
+            # Plain dicts so the config pickles into the scheduler worker process
+            "faculty_types": (
+                {ftype: rules.model_dump() for ftype, rules in request.faculty_types.items()}
+                if request.faculty_types else None
+            ),
             # Runtime resource tuning
             "low_resource_mode": request.low_resource_mode,
             "auto_low_resource_mode": request.auto_low_resource_mode,
             "cpu_yield_every_iterations": request.cpu_yield_every_iterations,
             "cpu_yield_ms": request.cpu_yield_ms,
+            "cooling_schedule": request.cooling_schedule,
+            "lam_restart_iterations": request.lam_restart_iterations,
+            "parallel_chains": (
+                request.parallel_chains if request.parallel_chains is not None
+                else os.getenv("SCHEDULER_PARALLEL_CHAINS", "1")
+            ),
             # Soft Penalties
             "SOFT_ROOM_TYPE_MISMATCH": request.SOFT_ROOM_TYPE_MISMATCH,
             "SOFT_ROOM_TYPE_MAJOR_MISMATCH": request.SOFT_ROOM_TYPE_MAJOR_MISMATCH,
@@ -757,6 +1027,9 @@ async def generate_schedule(request: ScheduleGenerationRequest):
             # Reduce expensive full re-optimizations on free tier.
             adaptive_passes = int(os.getenv("SCHEDULER_ADAPTIVE_RETRY_PASSES", "1"))
             config["adaptive_retry_passes"] = max(0, adaptive_passes)
+
+            # One annealing chain at a time on a shared small instance.
+            config["parallel_chains"] = 1
         
         print("🎯 Running Enhanced Quantum-Inspired Annealing Algorithm...")
         print(f"   Max Iterations: {config['max_iterations']}")
@@ -770,12 +1043,13 @@ async def generate_schedule(request: ScheduleGenerationRequest):
             print(f"   🌐 Online Days: {', '.join(request.online_days)}")
         
         # Fetch teacher profiles for constraints (VSL, shifts, etc.)
-        print("👤 Fetching teacher profiles for constraints...")
-        all_teachers = await get_all_teachers()
+        if all_teachers is None:
+            print("👤 Fetching teacher profiles for constraints...")
+            all_teachers = await get_all_teachers()
         
         # Run the enhanced scheduler with 30-minute slots and BulSU QSA
         if request.use_enhanced_scheduler:
-            result = await asyncio.to_thread(
+            result = await _run_scheduler_in_process(
                 run_enhanced_scheduler,
                 sections_data=sections,
                 rooms_data=rooms,
@@ -796,7 +1070,7 @@ async def generate_schedule(request: ScheduleGenerationRequest):
             result["conflicts"] = []  # Enhanced scheduler handles conflicts internally
         else:
             # Fallback to original scheduler
-            result = await asyncio.to_thread(
+            result = await _run_scheduler_in_process(
                 run_scheduler,
                 sections_data=sections,
                 rooms_data=rooms,
@@ -873,8 +1147,9 @@ async def generate_schedule(request: ScheduleGenerationRequest):
             # Save all allocations without merging LAB/LEC
             # The frontend will handle combining them for display
             print(f"✅ Prepared {len(all_allocations)} room allocation entries")
-            saved_allocations = await save_room_allocations(all_allocations)
-            print(f"✅ Saved {len(saved_allocations)} room allocations to database")
+            # Only the count is used; don't hold the returned rows until the response is built
+            saved_count = len(await save_room_allocations(all_allocations))
+            print(f"✅ Saved {saved_count} room allocations to database")
         
         print("=" * 60)
         print("🎉 SCHEDULE GENERATION COMPLETED")
@@ -914,7 +1189,6 @@ async def generate_schedule(request: ScheduleGenerationRequest):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         error_msg = str(e) if str(e) else repr(e)
         error_type = type(e).__name__
         print("=" * 60)
@@ -925,7 +1199,7 @@ async def generate_schedule(request: ScheduleGenerationRequest):
         print("=" * 60)
         raise HTTPException(status_code=500, detail=f"Schedule generation failed: {error_type}: {error_msg}")
     finally:
-        if queue_slot_acquired and queue_job_id:
+        if queue_slot_acquired:
             await _release_schedule_generation_slot(queue_job_id)
 
 
@@ -1023,13 +1297,13 @@ async def remove_generated_schedule(schedule_id: int):
 async def get_room_schedule(schedule_id: int, room_id: int):
     """Get schedule entries for a specific room"""
     try:
-        schedule = await get_schedule_by_id(schedule_id)
+        schedule, room_entries = await asyncio.gather(
+            get_schedule_by_id(schedule_id),
+            get_schedule_entries_filtered(schedule_id, room_id=room_id)
+        )
         if not schedule:
             raise HTTPException(status_code=404, detail="Schedule not found")
         
-        entries = schedule.get("entries", [])
-        room_entries = [e for e in entries if e.get("room_id") == room_id]
-        
         return {
             "room_id": room_id,
             "schedule_id": schedule_id,
@@ -1045,13 +1319,13 @@ async def get_room_schedule(schedule_id: int, room_id: int):
 async def get_teacher_schedule(schedule_id: int, teacher_id: int):
     """Get schedule entries for a specific teacher"""
     try:
-        schedule = await get_schedule_by_id(schedule_id)
+        schedule, teacher_entries = await asyncio.gather(
+            get_schedule_by_id(schedule_id),
+            get_schedule_entries_filtered(schedule_id, teacher_id=teacher_id)
+        )
         if not schedule:
             raise HTTPException(status_code=404, detail="Schedule not found")
         
-        entries = schedule.get("entries", [])
-        teacher_entries = [e for e in entries if e.get("teacher_id") == teacher_id]
-        
         return {
             "teacher_id": teacher_id,
             "schedule_id": schedule_id,
@@ -1067,13 +1341,13 @@ async def get_teacher_schedule(schedule_id: int, teacher_id: int):
 async def get_section_schedule(schedule_id: int, section_id: int):
     """Get schedule entries for a specific section"""
     try:
-        schedule = await get_schedule_by_id(schedule_id)
+        schedule, section_entries = await asyncio.gather(
+            get_schedule_by_id(schedule_id),
+            get_schedule_entries_filtered(schedule_id, section_id=section_id)
+        )
         if not schedule:
             raise HTTPException(status_code=404, detail="Schedule not found")
         
-        entries = schedule.get("entries", [])
-        section_entries = [e for e in entries if e.get("section_id") == section_id]
-        
         return {
             "section_id": section_id,
             "schedule_id": schedule_id,
@@ -1089,13 +1363,13 @@ async def get_section_schedule(schedule_id: int, section_id: int):
 async def get_day_schedule(schedule_id: int, day: str):
     """Get schedule entries for a specific day"""
     try:
-        schedule = await get_schedule_by_id(schedule_id)
+        schedule, day_entries = await asyncio.gather(
+            get_schedule_by_id(schedule_id),
+            get_schedule_entries_filtered(schedule_id, day=day)
+        )
         if not schedule:
             raise HTTPException(status_code=404, detail="Schedule not found")
         
-        entries = schedule.get("entries", [])
-        day_entries = [e for e in entries if e.get("day_of_week", "").lower() == day.lower()]
-        
         return {
             "day": day,
             "schedule_id": schedule_id,
@@ -1168,7 +1442,6 @@ async def check_conflicts(schedule_id: int):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail="Conflict check failed")
 
@@ -1200,48 +1473,37 @@ async def get_analytics_room_utilization(schedule_id: Optional[int] = None):
         raise HTTPException(status_code=500, detail="Failed to retrieve analytics")
 
 
+# Capacity distribution buckets: small < 30, medium 30-59, large 60-99, extra_large 100+
+CAPACITY_BUCKET_BOUNDS = (30, 60, 100)
+CAPACITY_BUCKET_NAMES = ("small", "medium", "large", "extra_large")
+
+
 @app.get("/api/analytics/summary")
 async def get_analytics_summary(schedule_id: Optional[int] = None):
     """Get overall scheduling analytics summary"""
     try:
-        rooms = await get_all_rooms()
-        sections = await get_all_sections()
-        teachers = await get_all_teachers()
+        rooms, sections, teachers = await asyncio.gather(
+            get_all_rooms(),
+            get_all_sections(columns="id"),  # Only counted
+            get_all_teachers()
+        )
+        
+        # One counting pass per category; capacities bucket by bisecting the bounds
+        capacity_buckets = Counter(
+            bisect_right(CAPACITY_BUCKET_BOUNDS, room.get("capacity") or 0) for room in rooms
+        )
         
         summary = {
             "total_rooms": len(rooms),
             "total_sections": len(sections),
             "total_teachers": len(teachers),
-            "rooms_by_type": {},
-            "rooms_by_building": {},
+            "rooms_by_type": dict(Counter(room.get("room_type", "unknown") for room in rooms)),
+            "rooms_by_building": dict(Counter(room.get("building", "unknown") for room in rooms)),
             "capacity_distribution": {
-                "small": 0,  # < 30
-                "medium": 0,  # 30-60
-                "large": 0,  # 60-100
-                "extra_large": 0  # > 100
+                name: capacity_buckets[i] for i, name in enumerate(CAPACITY_BUCKET_NAMES)
             }
         }
         
-        for room in rooms:
-            # Count by type
-            room_type = room.get("room_type", "unknown")
-            summary["rooms_by_type"][room_type] = summary["rooms_by_type"].get(room_type, 0) + 1
-            
-            # Count by building
-            building = room.get("building", "unknown")
-            summary["rooms_by_building"][building] = summary["rooms_by_building"].get(building, 0) + 1
-            
-            # Capacity distribution
-            capacity = room.get("capacity", 0)
-            if capacity < 30:
-                summary["capacity_distribution"]["small"] += 1
-            elif capacity < 60:
-                summary["capacity_distribution"]["medium"] += 1
-            elif capacity < 100:
-                summary["capacity_distribution"]["large"] += 1
-            else:
-                summary["capacity_distribution"]["extra_large"] += 1
-        
         return summary
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1252,9 +1514,15 @@ async def get_analytics_summary(schedule_id: Optional[int] = None):
 # ========================
 
 if __name__ == "__main__":
+    # Production-style defaults; set UVICORN_RELOAD=1 for the auto-reloading dev server.
+    # The schedule queue and background job store live in-process, so one worker
+    # serves every poll; with WEB_CONCURRENCY > 1 background generation is refused.
+    reload_enabled = (os.getenv("UVICORN_RELOAD") or "").strip().lower() in {"1", "true", "yes"}
     uvicorn.run(
         "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        reload=reload_enabled,
+        workers=None if reload_enabled else WEB_CONCURRENCY,
+        timeout_keep_alive=5,
     )
@@ -5,6 +5,7 @@ Handles saving and loading the RL agent's Q-table and training history
 to Supabase so learning survives server restarts.
 """
 
+import asyncio
 import json
 from typing import Dict, Optional, Any
 from datetime import datetime
@@ -14,6 +15,11 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+async def _exec(query):
+    """Run a blocking supabase-py query in a worker thread so the event loop keeps serving."""
+    return await asyncio.to_thread(query.execute)
+
+
 class RLStatePersistence:
     """Manages RL agent state persistence to Supabase."""
 
@@ -63,7 +69,7 @@ class RLStatePersistence:
             stats = rl_engine.get_training_stats()
 
             # Upsert (insert or update)
-            response = self.supabase.table("rl_agent_state").upsert(
+            response = await _exec(self.supabase.table("rl_agent_state").upsert(
                 {
                     "agent_id": self.agent_id,
                     "q_table": q_table_json,
@@ -73,7 +79,7 @@ class RLStatePersistence:
                     "best_reward": float(stats.get("best_reward", 0)),
                     "updated_at": datetime.utcnow().isoformat(),
                 }
-            ).execute()
+            ))
 
             logger.info(f"Saved RL agent state: {len(rl_engine.agent.q_table)} states")
             return True
@@ -89,9 +95,9 @@ class RLStatePersistence:
             return False
 
         try:
-            response = self.supabase.table("rl_agent_state").select(
+            response = await _exec(self.supabase.table("rl_agent_state").select(
                 "q_table,training_history,episodes_trained,avg_reward,best_reward"
-            ).eq("agent_id", self.agent_id).execute()
+            ).eq("agent_id", self.agent_id))
 
             if not response.data or len(response.data) == 0:
                 logger.info("No saved RL state found, starting fresh")
@@ -125,9 +131,9 @@ class RLStatePersistence:
             return None
 
         try:
-            response = self.supabase.table("rl_agent_state").select(
+            response = await _exec(self.supabase.table("rl_agent_state").select(
                 "episodes_trained,avg_reward,best_reward,updated_at"
-            ).eq("agent_id", self.agent_id).execute()
+            ).eq("agent_id", self.agent_id))
 
             if response.data and len(response.data) > 0:
                 return response.data[0]
@@ -143,9 +149,9 @@ class RLStatePersistence:
             return False
 
         try:
-            self.supabase.table("rl_agent_state").delete().eq(
+            await _exec(self.supabase.table("rl_agent_state").delete().eq(
                 "agent_id", self.agent_id
-            ).execute()
+            ))
 
             logger.info("Deleted RL agent state from Supabase")
             return True
@@ -7,7 +7,7 @@ from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass, field
 import random
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
 import numpy as np
 from datetime import datetime
 
@@ -93,9 +93,9 @@ class QLearningAgent:
         # Q-table: state_hash -> {action_hash: q_value}
         self.q_table = defaultdict(lambda: defaultdict(float))
 
-        # Experience replay buffer
-        self.experience_buffer = []
+        # Experience replay buffer (bounded; oldest experiences fall off the front)
         self.max_buffer_size = 1000
+        self.experience_buffer = deque(maxlen=self.max_buffer_size)
 
     def state_to_hash(self, state: Dict) -> str:
         """Convert state to hashable representation."""
@@ -113,10 +113,11 @@ class QLearningAgent:
         if random.random() < self.exploration_rate:
             return random.choice(available_actions)
 
-        state_hash = self.state_to_hash(state)
+        # Read with .get so scoring candidates doesn't insert empty Q-table entries
+        q_values = self.q_table.get(self.state_to_hash(state), {})
         best_action = max(
             available_actions,
-            key=lambda a: self.q_table[state_hash][self.action_to_hash(a)],
+            key=lambda a: q_values.get(self.action_to_hash(a), 0.0),
             default=random.choice(available_actions)
         )
         return best_action if best_action else random.choice(available_actions)
@@ -130,7 +131,7 @@ class QLearningAgent:
 
         # Find max Q-value for next state
         max_next_q = max(
-            self.q_table[next_state_hash].values(),
+            self.q_table.get(next_state_hash, {}).values(),
             default=0.0
         ) if not done else 0.0
 
@@ -156,10 +157,6 @@ class QLearningAgent:
             'done': done
         })
 
-        # Keep buffer size manageable
-        if len(self.experience_buffer) > self.max_buffer_size:
-            self.experience_buffer.pop(0)
-
     def replay(self, batch_size: int = 32):
         """Experience replay to improve learning."""
         if len(self.experience_buffer) < batch_size:
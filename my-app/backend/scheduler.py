@@ -14,7 +14,61 @@ from enum import Enum
 import random
 import time
 import math
+import os
+import logging
+import multiprocessing
 from collections import defaultdict
+from array import array
+from itertools import product
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+# exp(-20) ~ 2e-9: uphill moves beyond this delta/T ratio are never accepted in practice
+METROPOLIS_MAX_EXPONENT = 20.0
+
+# Multi-start coordination: every SHARED_BEST_CHECK_INTERVAL iterations a chain
+# publishes its best energy, and abandons its run once it has gone
+# SHARED_BEST_STAGNATION iterations without improving while sitting more than
+# SHARED_BEST_ABANDON_MARGIN x |best| above the best energy any chain has reached
+SHARED_BEST_CHECK_INTERVAL = 500
+SHARED_BEST_STAGNATION = 2000
+SHARED_BEST_ABANDON_MARGIN = 0.5
+
+
+def chain_is_hopeless(current_cost: float, global_best: float) -> bool:
+    """
+    True when a chain's energy trails the shared best by more than
+    SHARED_BEST_ABANDON_MARGIN of its magnitude. Measured as a difference so
+    zero or negative energies (bonuses outweighing penalties) work too.
+    """
+    return current_cost - global_best > SHARED_BEST_ABANDON_MARGIN * max(1.0, abs(global_best))
+
+
+def metropolis_accept(delta: float, temperature: float) -> bool:
+    """
+    Metropolis acceptance test. Downhill moves are accepted and moves whose
+    delta/T exceeds METROPOLIS_MAX_EXPONENT are rejected without calling exp.
+    """
+    if delta <= 0:
+        return True
+    ratio = delta / temperature
+    if ratio > METROPOLIS_MAX_EXPONENT:
+        return False
+    return random.random() < math.exp(-ratio)
+
+
+def choice_excluding(options: List, pos: Optional[int]):
+    """
+    random.choice over options without the item at index pos, without building
+    the filtered list. Draws the same random number as choosing from that list.
+    """
+    if pos is None:
+        return random.choice(options)
+    i = random.randrange(len(options) - 1)
+    return options[i + 1] if i >= pos else options[i]
 
 
 class ConstraintType(Enum):
@@ -22,7 +76,7 @@ class ConstraintType(Enum):
     SOFT = "soft"  # Should be optimized (preferences)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleSlot:
     """Represents a single scheduling slot"""
     section_id: int
@@ -112,6 +166,8 @@ class OptimizationStats:
     quantum_tunnels: int = 0
     time_elapsed_ms: int = 0
     temperature_schedule: List[float] = field(default_factory=list)
+    energy_history: List[float] = field(default_factory=list)  # Best cost, sampled like temperature_schedule
+    acceptance_history: List[float] = field(default_factory=list)  # Modified Lam running acceptance rate, same sampling
 
 
 class QuantumInspiredScheduler:
@@ -141,13 +197,39 @@ class QuantumInspiredScheduler:
         if time_slots:
             self.slot_duration = time_slots[0].duration_minutes if time_slots[0].duration_minutes > 0 else 90
         
-        # Pre-compute compatible rooms for each section
+        # Pre-compute compatible rooms for each section, plus room_id -> index maps
+        # (swap-move membership tests and neighbour moves that exclude the current room)
         self.compatible_rooms = self._compute_compatible_rooms()
+        self.compatible_room_pos: Dict[int, Dict[int, int]] = {
+            section_id: {room_id: i for i, room_id in enumerate(room_ids)}
+            for section_id, room_ids in self.compatible_rooms.items()
+        }
         
         # Current schedule state
         self.schedule: Dict[Tuple[int, str, int], ScheduleSlot] = {}  # (room_id, day, slot_id) -> ScheduleSlot
         self.section_assignments: Dict[int, List[Tuple[int, str, int]]] = defaultdict(list)  # section_id -> [(room_id, day, slot_id)]
-        
+
+        # Bit-packed teacher occupancy: one bit per time slot of a day, so a
+        # teacher's whole day fits in a single int. Conflict checks become a
+        # mask test and daily hours a popcount instead of a schedule scan.
+        self.slot_bits: Dict[int, int] = {slot_id: 1 << i for i, slot_id in enumerate(self.time_slots)}
+        self.teacher_day_masks: Dict[Tuple[int, str], int] = defaultdict(int)  # (teacher_id, day) -> slot bitmask
+        self.teacher_slot_refs: Dict[Tuple[int, str, int], int] = defaultdict(int)  # (teacher_id, day, slot_id) -> entries
+
+        # Running cost terms kept in step with the schedule, so a move's cost is
+        # a couple of O(1) updates instead of a full rescan of every slot
+        self.teacher_day_counts: Dict[Tuple[int, str], int] = defaultdict(int)  # (teacher_id, day) -> scheduled slots
+        self.slot_cost_total = 0.0  # Sum of _slot_cost over all scheduled slots
+        self.teacher_overload_cost = 0.0  # Sum of daily overload penalties over all teachers
+
+        # Indexable mirror of schedule keys so the optimizer can pick a random
+        # slot in O(1) instead of materializing list(self.schedule) every step
+        self.schedule_keys: List[Tuple[int, str, int]] = []
+        self.schedule_key_pos: Dict[Tuple[int, str, int], int] = {}
+        self.time_slot_ids: List[int] = list(self.time_slots.keys())
+        self.time_slot_pos: Dict[int, int] = {slot_id: i for i, slot_id in enumerate(self.time_slot_ids)}
+        self.day_pos: Dict[str, int] = {day: i for i, day in enumerate(self.DAYS)}
+
         # Split session tracking
         self.split_sessions: Dict[int, List[SplitSession]] = {}  # section_id -> list of split sessions
         
@@ -244,36 +326,34 @@ class QuantumInspiredScheduler:
         """Pre-compute which rooms are compatible with each section"""
         compatible = {}
         
+        # Rooms ordered by capacity once, so each section only walks the rooms
+        # large enough for it (bisect) instead of every room
+        room_order = {room_id: i for i, room_id in enumerate(self.rooms)}
+        rooms_by_capacity = sorted(self.rooms.values(), key=lambda r: r.capacity)
+        capacities = [room.capacity for room in rooms_by_capacity]
+        
+        def rooms_with_capacity(min_capacity: int, requires_lab: bool) -> List[int]:
+            return [
+                room.id for room in rooms_by_capacity[bisect_left(capacities, min_capacity):]
+                # Check room type compatibility - only enforce for labs
+                if not requires_lab or room.room_type in ("laboratory", "computer_lab", "lab")
+            ]
+        
         for section in self.sections.values():
-            compatible_rooms = []
+            # Check capacity - room must fit all students
             min_capacity = int(section.student_count * self.constraints.min_room_capacity_buffer)
-            
-            for room in self.rooms.values():
-                # Check capacity - room must fit all students
-                if room.capacity < min_capacity:
-                    continue
-                    
-                # Check room type compatibility - only enforce for labs
-                if section.requires_lab and room.room_type not in ["laboratory", "computer_lab", "lab"]:
-                    continue
-                
-                compatible_rooms.append(room.id)
+            compatible_rooms = rooms_with_capacity(min_capacity, section.requires_lab)
             
             # If no rooms found with strict capacity, try with relaxed capacity (90%)
             if not compatible_rooms:
-                relaxed_capacity = int(section.student_count * 0.9)
-                for room in self.rooms.values():
-                    if room.capacity >= relaxed_capacity:
-                        if section.requires_lab and room.room_type not in ["laboratory", "computer_lab", "lab"]:
-                            continue
-                        compatible_rooms.append(room.id)
+                compatible_rooms = rooms_with_capacity(int(section.student_count * 0.9), section.requires_lab)
             
             # If still no rooms, use any room (last resort)
             if not compatible_rooms:
                 compatible_rooms = [room.id for room in self.rooms.values()]
             
-            # Sort rooms by capacity (prefer rooms closer to student count)
-            compatible_rooms.sort(key=lambda r: abs(self.rooms[r].capacity - section.student_count))
+            # Sort rooms by capacity (prefer rooms closer to student count); ties keep input order
+            compatible_rooms.sort(key=lambda r: (abs(self.rooms[r].capacity - section.student_count), room_order[r]))
             compatible[section.id] = compatible_rooms
             
         return compatible
@@ -282,78 +362,132 @@ class QuantumInspiredScheduler:
         """Check if a slot is available"""
         return (room_id, day, slot_id) not in self.schedule
     
+    def _slot_cost(self, slot: ScheduleSlot) -> float:
+        """Cost contributed by one scheduled slot (room fit and accessibility)"""
+        section = self.sections[slot.section_id]
+        room = self.rooms[slot.room_id]
+        cost = 0.0
+        
+        if section.required_room_type and room.room_type != section.required_room_type:
+            cost += 50  # Soft penalty for room type mismatch
+        
+        # Penalty for excessive room capacity (wasteful)
+        capacity_ratio = room.capacity / section.student_count
+        if capacity_ratio > 2.0:
+            cost += 20 * (capacity_ratio - 2.0)
+        
+        # Reward for accessibility placement (PWD)
+        if self.constraints.prioritize_accessibility and room.is_accessible:
+            cost -= 10  # Bonus for using accessible rooms
+        
+        return cost
+    
+    def _teacher_overload_penalty(self, hours: int) -> float:
+        """Penalty for one teacher-day holding this many slots"""
+        excess = hours - self.constraints.max_teacher_hours_per_day
+        return 100 * excess if excess > 0 else 0.0
+    
+    def _adjust_teacher_day(self, teacher_id: int, day: str, change: int):
+        """Update a teacher-day slot count and the overload term with it"""
+        day_key = (teacher_id, day)
+        hours = self.teacher_day_counts[day_key]
+        self.teacher_overload_cost += (
+            self._teacher_overload_penalty(hours + change) - self._teacher_overload_penalty(hours)
+        )
+        self.teacher_day_counts[day_key] = hours + change
+    
+    def _place(self, key: Tuple[int, str, int], slot: ScheduleSlot):
+        """Put a slot into the schedule and mark its teacher busy"""
+        self.schedule[key] = slot
+        if key not in self.schedule_key_pos:
+            self.schedule_key_pos[key] = len(self.schedule_keys)
+            self.schedule_keys.append(key)
+        self.slot_cost_total += self._slot_cost(slot)
+        self._adjust_teacher_day(slot.teacher_id, key[1], 1)
+        teacher_id = slot.teacher_id
+        if teacher_id:
+            ref_key = (teacher_id, key[1], key[2])
+            self.teacher_slot_refs[ref_key] += 1
+            if self.teacher_slot_refs[ref_key] == 1:
+                self.teacher_day_masks[(teacher_id, key[1])] |= self.slot_bits.get(key[2], 0)
+
+    def _unplace(self, key: Tuple[int, str, int]) -> ScheduleSlot:
+        """Remove a slot from the schedule and free its teacher"""
+        slot = self.schedule.pop(key)
+        # Swap-remove from the key list: move the last key into the freed position
+        pos = self.schedule_key_pos.pop(key)
+        last_key = self.schedule_keys.pop()
+        if last_key != key:
+            self.schedule_keys[pos] = last_key
+            self.schedule_key_pos[last_key] = pos
+        self.slot_cost_total -= self._slot_cost(slot)
+        self._adjust_teacher_day(slot.teacher_id, key[1], -1)
+        teacher_id = slot.teacher_id
+        if teacher_id:
+            ref_key = (teacher_id, key[1], key[2])
+            self.teacher_slot_refs[ref_key] -= 1
+            if self.teacher_slot_refs[ref_key] <= 0:
+                del self.teacher_slot_refs[ref_key]
+                self.teacher_day_masks[(teacher_id, key[1])] &= ~self.slot_bits.get(key[2], 0)
+        return slot
+
+    def _reset_indexes(self):
+        """Clear teacher bitmasks and running cost terms"""
+        self.teacher_day_masks.clear()
+        self.teacher_slot_refs.clear()
+        self.teacher_day_counts.clear()
+        self.schedule_keys.clear()
+        self.schedule_key_pos.clear()
+        self.slot_cost_total = 0.0
+        self.teacher_overload_cost = 0.0
+    
+    def _rebuild_indexes(self):
+        """Recompute teacher bitmasks and cost terms after the schedule dict is replaced wholesale"""
+        self._reset_indexes()
+        schedule = self.schedule
+        self.schedule = {}
+        for key, slot in schedule.items():
+            self._place(key, slot)
+
     def _check_teacher_conflict(self, teacher_id: int, day: str, slot_id: int) -> bool:
         """Check if teacher is already scheduled at this time"""
         if not teacher_id or teacher_id == 0:
             return False  # No teacher assigned, no conflict possible
-        for key, slot in self.schedule.items():
-            if slot.teacher_id == teacher_id and key[1] == day and key[2] == slot_id:
-                return True
-        return False
-    
+        return bool(self.teacher_day_masks.get((teacher_id, day), 0) & self.slot_bits.get(slot_id, 0))
+
     def _get_teacher_daily_hours(self, teacher_id: int, day: str) -> int:
         """Get number of hours teacher is scheduled on a day"""
         if not teacher_id or teacher_id == 0:
             return 0  # No teacher assigned, return 0
-        count = 0
-        for key, slot in self.schedule.items():
-            if slot.teacher_id == teacher_id and key[1] == day:
-                count += 1
-        return count
+        return self.teacher_day_counts.get((teacher_id, day), 0)
     
-    def _calculate_cost(self) -> float:
-        """
-        Calculate the cost of the current schedule.
-        Lower cost = better schedule.
-        """
+    def _unscheduled_cost(self) -> float:
+        """Penalty for sections with fewer slots than they need"""
         cost = 0.0
-        
-        # Penalty for unscheduled sections
         for section_id, section in self.sections.items():
             assigned_slots = len(self.section_assignments.get(section_id, []))
             needed_slots = max(1, section.weekly_hours // self.slot_duration)
             
             if assigned_slots < needed_slots:
                 cost += 1000 * (needed_slots - assigned_slots)  # Heavy penalty
-        
-        # Penalty for room type mismatch
-        for key, slot in self.schedule.items():
-            section = self.sections[slot.section_id]
-            room = self.rooms[slot.room_id]
-            
-            if section.required_room_type and room.room_type != section.required_room_type:
-                cost += 50  # Soft penalty for room type mismatch
-            
-            # Penalty for excessive room capacity (wasteful)
-            capacity_ratio = room.capacity / section.student_count
-            if capacity_ratio > 2.0:
-                cost += 20 * (capacity_ratio - 2.0)
-        
-        # Penalty for teacher workload imbalance
-        teacher_daily_hours = defaultdict(lambda: defaultdict(int))
-        for key, slot in self.schedule.items():
-            day = key[1]
-            teacher_daily_hours[slot.teacher_id][day] += 1
-        
-        for teacher_id, daily_hours in teacher_daily_hours.items():
-            for day, hours in daily_hours.items():
-                if hours > self.constraints.max_teacher_hours_per_day:
-                    cost += 100 * (hours - self.constraints.max_teacher_hours_per_day)
-        
-        # Reward for accessibility placement (PWD)
-        if self.constraints.prioritize_accessibility:
-            for key, slot in self.schedule.items():
-                room = self.rooms[slot.room_id]
-                if room.is_accessible:
-                    cost -= 10  # Bonus for using accessible rooms
-        
         return cost
     
+    def _calculate_cost(self) -> float:
+        """
+        Calculate the cost of the current schedule.
+        Lower cost = better schedule.
+        
+        Room fit, accessibility and teacher overload terms are the running
+        sums kept by _place/_unplace; only the unscheduled term is counted here.
+        """
+        return self._unscheduled_cost() + self.slot_cost_total + self.teacher_overload_cost
+    
     def _generate_initial_solution(self) -> bool:
         """Generate an initial feasible solution using greedy algorithm with split session support"""
         self.schedule.clear()
         self.section_assignments.clear()
         self.split_sessions.clear()
+        self._reset_indexes()
         
         # Sort sections by constraints (more constrained first - fewer compatible rooms)
         sorted_sections = sorted(
@@ -384,34 +518,33 @@ class QuantumInspiredScheduler:
     def _try_schedule_section_normal(self, section: Section, compatible_rooms: List[int], needed_slots: int) -> int:
         """Try to schedule a section without splitting. Returns number of slots assigned."""
         assigned = 0
-        days_to_use = self.DAYS[:6]
-        time_slots_list = list(self.time_slots.keys())
+        # Day/slot grid is fixed for the whole call; build it once
+        day_slot_pairs = list(product(self.DAYS[:6], self.time_slots))
         
         for _ in range(needed_slots):
             best_assignment = None
             best_cost = float('inf')
             
             for room_id in compatible_rooms:
-                for day in days_to_use:
-                    for slot_id in time_slots_list:
-                        if not self._is_slot_available(room_id, day, slot_id):
+                for day, slot_id in day_slot_pairs:
+                    if not self._is_slot_available(room_id, day, slot_id):
+                        continue
+                    
+                    if section.teacher_id and section.teacher_id > 0:
+                        if self._check_teacher_conflict(section.teacher_id, day, slot_id):
                             continue
-                        
-                        if section.teacher_id and section.teacher_id > 0:
-                            if self._check_teacher_conflict(section.teacher_id, day, slot_id):
-                                continue
-                            if self._get_teacher_daily_hours(section.teacher_id, day) >= self.constraints.max_teacher_hours_per_day:
-                                continue
-                        
-                        room = self.rooms[room_id]
-                        local_cost = 0
-                        capacity_ratio = room.capacity / max(1, section.student_count)
-                        if capacity_ratio > 2.0:
-                            local_cost += 5 * (capacity_ratio - 1.0)
-                        
-                        if local_cost < best_cost:
-                            best_cost = local_cost
-                            best_assignment = (room_id, day, slot_id)
+                        if self._get_teacher_daily_hours(section.teacher_id, day) >= self.constraints.max_teacher_hours_per_day:
+                            continue
+                    
+                    room = self.rooms[room_id]
+                    local_cost = 0
+                    capacity_ratio = room.capacity / max(1, section.student_count)
+                    if capacity_ratio > 2.0:
+                        local_cost += 5 * (capacity_ratio - 1.0)
+                    
+                    if local_cost < best_cost:
+                        best_cost = local_cost
+                        best_assignment = (room_id, day, slot_id)
             
             if best_assignment:
                 room_id, day, slot_id = best_assignment
@@ -426,7 +559,7 @@ class QuantumInspiredScheduler:
                     total_sessions=needed_slots,
                     is_split=False
                 )
-                self.schedule[(room_id, day, slot_id)] = slot
+                self._place((room_id, day, slot_id), slot)
                 self.section_assignments[section.id].append((room_id, day, slot_id))
                 assigned += 1
         
@@ -499,7 +632,7 @@ class QuantumInspiredScheduler:
                     total_sessions=needed_slots,
                     is_split=True  # Mark as split session
                 )
-                self.schedule[(room_id, day, slot_id)] = slot
+                self._place((room_id, day, slot_id), slot)
                 self.section_assignments[section.id].append((room_id, day, slot_id))
                 assigned += 1
                 session_num += 1
@@ -555,7 +688,7 @@ class QuantumInspiredScheduler:
                                     total_sessions=needed,
                                     is_split=True  # Mark as split since it's being forced
                                 )
-                                self.schedule[(room_id, day, slot_id)] = slot
+                                self._place((room_id, day, slot_id), slot)
                                 self.section_assignments[section.id].append((room_id, day, slot_id))
                                 assigned += 1
                                 found = True
@@ -576,7 +709,7 @@ class QuantumInspiredScheduler:
             return None, None, None
         
         # Randomly select a scheduled slot to modify
-        keys = list(self.schedule.keys())
+        keys = self.schedule_keys
         old_key = random.choice(keys)
         slot = self.schedule[old_key]
         section = self.sections[slot.section_id]
@@ -588,17 +721,14 @@ class QuantumInspiredScheduler:
             # Try to change to a different compatible room
             compatible = self.compatible_rooms.get(section.id, [])
             if len(compatible) > 1:
-                new_rooms = [r for r in compatible if r != slot.room_id]
-                if new_rooms:
-                    new_room = random.choice(new_rooms)
-                    new_key = (new_room, old_key[1], old_key[2])
-                    if self._is_slot_available(new_room, old_key[1], old_key[2]):
-                        return old_key, new_key, slot
+                new_room = choice_excluding(compatible, self.compatible_room_pos[section.id].get(slot.room_id))
+                new_key = (new_room, old_key[1], old_key[2])
+                if self._is_slot_available(new_room, old_key[1], old_key[2]):
+                    return old_key, new_key, slot
         
         elif modification == "change_day":
             # Try to change to a different day
-            other_days = [d for d in self.DAYS[:6] if d != old_key[1]]
-            new_day = random.choice(other_days)
+            new_day = choice_excluding(self.DAYS, self.day_pos.get(old_key[1]))
             new_key = (old_key[0], new_day, old_key[2])
             if (self._is_slot_available(old_key[0], new_day, old_key[2]) and
                 not self._check_teacher_conflict(slot.teacher_id, new_day, old_key[2])):
@@ -606,9 +736,8 @@ class QuantumInspiredScheduler:
         
         elif modification == "change_time":
             # Try to change to a different time slot
-            other_slots = [s for s in self.time_slots if s != old_key[2]]
-            if other_slots:
-                new_slot = random.choice(other_slots)
+            if len(self.time_slot_ids) > 1:
+                new_slot = choice_excluding(self.time_slot_ids, self.time_slot_pos.get(old_key[2]))
                 new_key = (old_key[0], old_key[1], new_slot)
                 if (self._is_slot_available(old_key[0], old_key[1], new_slot) and
                     not self._check_teacher_conflict(slot.teacher_id, old_key[1], new_slot)):
@@ -616,16 +745,19 @@ class QuantumInspiredScheduler:
         
         elif modification == "swap" and len(keys) > 1:
             # Try to swap with another slot
-            other_keys = [k for k in keys if k != old_key]
-            other_key = random.choice(other_keys)
+            other_key = old_key
+            while other_key == old_key:
+                other_key = random.choice(keys)
             other_slot = self.schedule[other_key]
             
             # Check if swap is valid
             other_section = self.sections[other_slot.section_id]
+            if other_section.id == section.id:
+                return None, None, None  # Swapping two slots of one section changes nothing
             
             # Both sections should be compatible with swapped rooms
-            if (old_key[0] in self.compatible_rooms.get(other_section.id, []) and
-                other_key[0] in self.compatible_rooms.get(section.id, [])):
+            if (old_key[0] in self.compatible_room_pos.get(other_section.id, ()) and
+                other_key[0] in self.compatible_room_pos.get(section.id, ())):
                 # Check teacher conflicts after swap
                 if (not self._check_teacher_conflict(slot.teacher_id, other_key[1], other_key[2]) and
                     not self._check_teacher_conflict(other_slot.teacher_id, old_key[1], old_key[2])):
@@ -647,13 +779,12 @@ class QuantumInspiredScheduler:
             # Perform a more drastic change
             if len(self.schedule) > 2:
                 # Remove and re-add a random section
-                keys = list(self.schedule.keys())
-                key_to_remove = random.choice(keys)
+                key_to_remove = random.choice(self.schedule_keys)
                 slot = self.schedule[key_to_remove]
                 section = self.sections[slot.section_id]
                 
                 # Remove safely
-                del self.schedule[key_to_remove]
+                self._unplace(key_to_remove)
                 if key_to_remove in self.section_assignments.get(section.id, []):
                     self.section_assignments[section.id].remove(key_to_remove)
                 
@@ -662,8 +793,8 @@ class QuantumInspiredScheduler:
                 attempts = 0
                 while attempts < 20:
                     room_id = random.choice(compatible) if compatible else list(self.rooms.keys())[0]
-                    day = random.choice(self.DAYS[:6])
-                    slot_id = random.choice(list(self.time_slots.keys()))
+                    day = random.choice(self.DAYS)
+                    slot_id = random.choice(self.time_slot_ids)
                     
                     if (self._is_slot_available(room_id, day, slot_id) and
                         not self._check_teacher_conflict(slot.teacher_id, day, slot_id)):
@@ -676,23 +807,39 @@ class QuantumInspiredScheduler:
                             teacher_id=section.teacher_id,
                             is_lab=section.requires_lab
                         )
-                        self.schedule[new_key] = new_slot
+                        self._place(new_key, new_slot)
                         self.section_assignments[section.id].append(new_key)
                         self.stats.quantum_tunnels += 1
                         return True
                     attempts += 1
                 
                 # Failed to re-add, restore original
-                self.schedule[key_to_remove] = slot
+                self._place(key_to_remove, slot)
                 self.section_assignments[section.id].append(key_to_remove)
         
         return False
     
+    @staticmethod
+    def _lam_target_acceptance(progress: float) -> float:
+        """
+        Target acceptance rate of the Modified Lam schedule at a point in the run
+        (0.0 = start, 1.0 = end): fast drop to 44%, hold, then decay to ~0.
+        """
+        if progress < 0.15:
+            return 0.44 + 0.56 * 560 ** (-progress / 0.15)
+        if progress < 0.65:
+            return 0.44
+        return 0.44 * 440 ** (-(progress - 0.65) / 0.35)
+    
     def optimize(
         self,
         max_iterations: int = 1000,
         initial_temperature: float = 100.0,
-        cooling_rate: float = 0.995
+        cooling_rate: float = 0.995,
+        cooling_schedule: str = "geometric",
+        lam_restart_iterations: int = 0,
+        shared_best=None,
+        shared_lock=None
     ) -> Tuple[Dict[Tuple, ScheduleSlot], OptimizationStats]:
         """
         Run the quantum-inspired simulated annealing optimization.
@@ -700,7 +847,16 @@ class QuantumInspiredScheduler:
         Args:
             max_iterations: Maximum number of iterations
             initial_temperature: Starting temperature for annealing
-            cooling_rate: Rate at which temperature decreases
+            cooling_rate: Rate at which temperature decreases (geometric schedule)
+            cooling_schedule: "geometric" (fixed cooling_rate) or "modified_lam"
+                (temperature steered so the acceptance rate tracks Lam's target curve)
+            lam_restart_iterations: Modified Lam only. When > 0 the run restarts from
+                its best solution at initial_temperature after this many iterations,
+                then after segments twice as long each time; every segment follows
+                the full Lam curve. 0 = a single curve over max_iterations
+            shared_best: Optional shared double (multiprocessing Value) holding the
+                best energy across multi-start chains; enables early abandonment
+            shared_lock: Lock guarding updates to shared_best
             
         Returns:
             Tuple of (best_schedule, optimization_stats)
@@ -715,57 +871,88 @@ class QuantumInspiredScheduler:
         
         self.stats.initial_cost = self._calculate_cost()
         current_cost = self.stats.initial_cost
+        # Moves relocate slots without changing per-section slot counts, so the
+        # unscheduled term stays fixed for the whole run
+        unscheduled_cost = self._unscheduled_cost()
         best_cost = current_cost
         best_schedule = dict(self.schedule)
         best_assignments = dict(self.section_assignments)
         
         temperature = initial_temperature
+        use_lam = cooling_schedule == "modified_lam"
+        accept_rate = 0.5  # Running acceptance estimate for the Lam schedule
+        # Current Lam segment [segment_start, segment_end); restarts double its length
+        segment_start = 0
+        segment_end = max_iterations
+        if use_lam and 0 < lam_restart_iterations < max_iterations:
+            segment_end = lam_restart_iterations
+        
+        # Pre-allocated sample buffers (every 100 iterations) keep the loop allocation-free
+        n_hist = max_iterations // 100 + 1
+        temperature_history = array('d', bytes(8 * n_hist))
+        energy_history = array('d', bytes(8 * n_hist))
+        acceptance_history = array('d', bytes(8 * n_hist))
+        hist_i = 0
+        last_improvement = 0
+        iterations_run = max_iterations
         
         for iteration in range(max_iterations):
-            # Try quantum tunneling
-            self._quantum_tunnel(temperature)
+            if use_lam and iteration == segment_end:
+                # Lam restart: resume from the best solution, reheat, run a longer curve
+                self.schedule = dict(best_schedule)
+                self.section_assignments = dict(best_assignments)
+                self._rebuild_indexes()
+                current_cost = best_cost
+                temperature = initial_temperature
+                accept_rate = 0.5
+                segment_length = 2 * (segment_end - segment_start)
+                segment_start = segment_end
+                segment_end = min(max_iterations, segment_start + segment_length)
+            
+            # Try quantum tunneling. A tunnel is kept unconditionally, so fold its
+            # cost change into current_cost instead of into the next move's delta
+            if self._quantum_tunnel(temperature):
+                current_cost = unscheduled_cost + self.slot_cost_total + self.teacher_overload_cost
             
             # Get neighbor solution
             old_key, new_key, slot = self._get_neighbor()
             
             if old_key and new_key and slot:
                 # Apply the change temporarily
-                del self.schedule[old_key]
+                self._unplace(old_key)
+                other_slot = self.schedule.get(new_key)
                 
-                if new_key in self.schedule:
+                if other_slot is not None:
                     # This is a swap
-                    other_slot = self.schedule[new_key]
-                    self.schedule[old_key] = ScheduleSlot(
+                    self._unplace(new_key)
+                    self._place(old_key, ScheduleSlot(
                         section_id=other_slot.section_id,
                         room_id=old_key[0],
                         day_of_week=old_key[1],
                         time_slot_id=old_key[2],
                         teacher_id=other_slot.teacher_id,
                         is_lab=other_slot.is_lab
-                    )
-                    self.schedule[new_key] = ScheduleSlot(
-                        section_id=slot.section_id,
-                        room_id=new_key[0],
-                        day_of_week=new_key[1],
-                        time_slot_id=new_key[2],
-                        teacher_id=slot.teacher_id,
-                        is_lab=slot.is_lab
-                    )
-                else:
-                    self.schedule[new_key] = ScheduleSlot(
-                        section_id=slot.section_id,
-                        room_id=new_key[0],
-                        day_of_week=new_key[1],
-                        time_slot_id=new_key[2],
-                        teacher_id=slot.teacher_id,
-                        is_lab=slot.is_lab
-                    )
+                    ))
+                self._place(new_key, ScheduleSlot(
+                    section_id=slot.section_id,
+                    room_id=new_key[0],
+                    day_of_week=new_key[1],
+                    time_slot_id=new_key[2],
+                    teacher_id=slot.teacher_id,
+                    is_lab=slot.is_lab
+                ))
                 
-                new_cost = self._calculate_cost()
+                new_cost = unscheduled_cost + self.slot_cost_total + self.teacher_overload_cost
                 delta = new_cost - current_cost
                 
                 # Accept or reject based on Metropolis criterion
-                if delta < 0 or random.random() < math.exp(-delta / max(temperature, 0.01)):
+                accepted = metropolis_accept(delta, max(temperature, 0.01))
+                if use_lam and delta > 0:
+                    # Uphill moves only: zero-delta moves are always accepted and
+                    # would put a floor under the rate that no temperature can lower
+                    accept_rate = (499 * accept_rate + (1 if accepted else 0)) / 500
+                
+                if accepted:
                     # Accept the change
                     current_cost = new_cost
                     
@@ -781,25 +968,62 @@ class QuantumInspiredScheduler:
                         best_schedule = dict(self.schedule)
                         best_assignments = dict(self.section_assignments)
                         self.stats.improvements += 1
+                        last_improvement = iteration
                 else:
-                    # Reject the change - restore
-                    if new_key in self.schedule and old_key not in self.schedule:
-                        del self.schedule[new_key]
-                    self.schedule[old_key] = slot
+                    # Reject the change - restore both slots of a swap
+                    self._unplace(new_key)
+                    if other_slot is not None:
+                        self._unplace(old_key)
+                        self._place(new_key, other_slot)
+                    self._place(old_key, slot)
             
             # Cool down
-            temperature *= cooling_rate
+            if use_lam:
+                progress = (iteration - segment_start) / (segment_end - segment_start)
+                if accept_rate > self._lam_target_acceptance(progress):
+                    temperature *= 0.999
+                else:
+                    temperature /= 0.999
+            else:
+                temperature *= cooling_rate
             
             # Track temperature schedule (sample every 100 iterations)
             if iteration % 100 == 0:
-                self.stats.temperature_schedule.append(temperature)
+                temperature_history[hist_i] = temperature
+                energy_history[hist_i] = best_cost
+                acceptance_history[hist_i] = accept_rate
+                hist_i += 1
+            
+            # Share our best with sibling chains and give up on a hopeless run
+            if shared_best is not None and (iteration + 1) % SHARED_BEST_CHECK_INTERVAL == 0:
+                with shared_lock:
+                    if best_cost < shared_best.value:
+                        shared_best.value = best_cost
+                    global_best = shared_best.value
+                if (
+                    iteration - last_improvement > SHARED_BEST_STAGNATION
+                    and chain_is_hopeless(current_cost, global_best)
+                ):
+                    iterations_run = iteration + 1
+                    break
+        
+        if shared_best is not None:
+            with shared_lock:
+                if best_cost < shared_best.value:
+                    shared_best.value = best_cost
+        
+        self.stats.temperature_schedule = temperature_history[:hist_i].tolist()
+        self.stats.energy_history = energy_history[:hist_i].tolist()
+        if use_lam:
+            self.stats.acceptance_history = acceptance_history[:hist_i].tolist()
         
         # Restore best solution
         self.schedule = best_schedule
         self.section_assignments = best_assignments
+        self._rebuild_indexes()
         
         self.stats.final_cost = best_cost
-        self.stats.iterations = max_iterations
+        self.stats.iterations = iterations_run
         self.stats.time_elapsed_ms = int((time.time() - start_time) * 1000)
         
         return self.schedule, self.stats
@@ -900,10 +1124,10 @@ class QuantumInspiredScheduler:
                     # Check if teacher conflict is the issue
                     teacher_conflicts = 0
                     if section.teacher_id and section.teacher_id > 0:
-                        for day in self.DAYS[:6]:
-                            for slot_id in self.time_slots:
-                                if self._check_teacher_conflict(section.teacher_id, day, slot_id):
-                                    teacher_conflicts += 1
+                        teacher_conflicts = sum(
+                            1 for day, slot_id in product(self.DAYS[:6], self.time_slots)
+                            if self._check_teacher_conflict(section.teacher_id, day, slot_id)
+                        )
                     
                     if teacher_conflicts > (total_slots * 0.7):  # Teacher is busy 70%+ of the time
                         reason_code = "TEACHER_OVERLOADED"
@@ -995,6 +1219,105 @@ class QuantumInspiredScheduler:
         return conflicts
 
 
+def _run_annealing_chain(
+    sections: List[Section],
+    rooms: List[Room],
+    time_slots: List[TimeSlot],
+    constraints: SchedulingConstraints,
+    optimize_kwargs: Dict,
+    seed: Optional[int] = None
+) -> Tuple[OptimizationStats, List[Dict], List[Dict], List[Dict]]:
+    """
+    Run one independent annealing chain and return (stats, entries, unscheduled, conflicts).
+    Top-level so multi-start chains can run in worker processes.
+    """
+    if seed is not None:
+        random.seed(seed)
+    scheduler = QuantumInspiredScheduler(sections, rooms, time_slots, constraints)
+    _, stats = scheduler.optimize(**optimize_kwargs)
+    return stats, scheduler.get_schedule_entries(), scheduler.get_unscheduled_sections(), scheduler.get_conflicts()
+
+
+# Dataset installed once per pool worker by _init_chain_worker, so each chain
+# task only pickles its own kwargs and seed instead of the full problem
+_worker_dataset: Optional[Tuple[List[Section], List[Room], List[TimeSlot], SchedulingConstraints]] = None
+
+
+def _init_chain_worker(
+    sections: List[Section],
+    rooms: List[Room],
+    time_slots: List[TimeSlot],
+    constraints: SchedulingConstraints
+) -> None:
+    """Pool initializer: keep the shared problem data in the worker process."""
+    global _worker_dataset
+    _worker_dataset = (sections, rooms, time_slots, constraints)
+
+
+def _run_pooled_chain(
+    optimize_kwargs: Dict,
+    seed: Optional[int] = None
+) -> Tuple[OptimizationStats, List[Dict], List[Dict], List[Dict]]:
+    """Run one annealing chain against the dataset installed by _init_chain_worker."""
+    return _run_annealing_chain(*_worker_dataset, optimize_kwargs, seed)
+
+
+def _run_multi_start(
+    sections: List[Section],
+    rooms: List[Room],
+    time_slots: List[TimeSlot],
+    constraints: SchedulingConstraints,
+    optimize_kwargs: Dict,
+    restarts: int,
+    workers: int,
+    base_seed: int
+) -> Tuple[OptimizationStats, List[Dict], List[Dict], List[Dict]]:
+    """
+    Multi-start annealing: independent chains with their own seeds, keeping the
+    best. Budgets double from chain to chain and the last one gets the full
+    max_iterations, so short chains act as cheap restarts of the long one.
+    Chains share their best energy so a stagnant, clearly-worse chain stops early.
+    Every chain gets the same optimize_kwargs (cooling schedule included) apart
+    from its budget; the returned stats count iterations across all chains.
+    """
+    max_iterations = optimize_kwargs["max_iterations"]
+    chain_kwargs = [
+        {**optimize_kwargs, "max_iterations": max(100, max_iterations >> (restarts - 1 - i))}
+        for i in range(restarts)
+    ]
+    seeds = [base_seed + i for i in range(restarts)]
+
+    if workers > 1:
+        # Spawn behaves the same on Linux, macOS and Windows and never forks a
+        # process that already holds threads (the API server's executor pools)
+        ctx = multiprocessing.get_context("spawn")
+        # Manager proxies can be pickled into worker processes
+        with ctx.Manager() as manager:
+            shared = {"shared_best": manager.Value('d', float('inf')), "shared_lock": manager.Lock()}
+            chain_kwargs = [{**kwargs, **shared} for kwargs in chain_kwargs]
+            with ProcessPoolExecutor(
+                max_workers=min(workers, restarts),
+                mp_context=ctx,
+                initializer=_init_chain_worker,
+                initargs=(sections, rooms, time_slots, constraints)
+            ) as executor:
+                chains = list(executor.map(_run_pooled_chain, chain_kwargs, seeds))
+    else:
+        shared_best = multiprocessing.Value('d', float('inf'))
+        shared = {"shared_best": shared_best, "shared_lock": shared_best.get_lock()}
+        chain_kwargs = [{**kwargs, **shared} for kwargs in chain_kwargs]
+        chains = [
+            _run_annealing_chain(sections, rooms, time_slots, constraints, kwargs, seed)
+            for kwargs, seed in zip(chain_kwargs, seeds)
+        ]
+
+    # Fewest conflicts first, then fewest unscheduled sections, then lowest energy
+    best = min(chains, key=lambda c: (len(c[3]), len(c[2]), c[0].final_cost))
+    # The winner may be a short chain; report the work done by the whole ensemble
+    best[0].iterations = sum(c[0].iterations for c in chains)
+    return best
+
+
 def run_scheduler(
     sections_data: List[Dict],
     rooms_data: List[Dict],
@@ -1083,22 +1406,56 @@ def run_scheduler(
         prioritize_accessibility=config.get("prioritize_accessibility", False)
     )
     
-    # Run scheduler
-    scheduler = QuantumInspiredScheduler(sections, rooms, time_slots, constraints)
+    optimize_kwargs = {
+        "max_iterations": config.get("max_iterations", 1000),
+        "initial_temperature": config.get("initial_temperature", 100.0),
+        "cooling_rate": config.get("cooling_rate", 0.995),
+        "cooling_schedule": config.get("cooling_schedule", "geometric"),
+        "lam_restart_iterations": int(config.get("lam_restart_iterations", 0) or 0)
+    }
     
-    schedule, stats = scheduler.optimize(
-        max_iterations=config.get("max_iterations", 1000),
-        initial_temperature=config.get("initial_temperature", 100.0),
-        cooling_rate=config.get("cooling_rate", 0.995)
-    )
+    # Multi-start: independent chains with different seeds, best one wins
+    restarts = max(1, int(config.get("restarts", 1) or 1))
+    restart_workers = config.get("restart_workers", os.getenv("SCHEDULER_RESTART_WORKERS", "1"))
+    restart_workers = int(restart_workers) if restart_workers not in (None, "") else 1
+    if restart_workers <= 0:  # 0 (or negative) = one worker per CPU core
+        restart_workers = os.cpu_count() or 1
     
-    entries = scheduler.get_schedule_entries()
-    unscheduled = scheduler.get_unscheduled_sections()
-    conflicts = scheduler.get_conflicts()
+    # parallel_chains: run that many chains at once, one per worker (0 = one per CPU core).
+    # Explicit restarts / restart_workers from the caller take precedence
+    parallel_chains = config.get("parallel_chains")
+    if parallel_chains not in (None, ""):
+        parallel_chains = int(parallel_chains)
+        if parallel_chains <= 0:
+            parallel_chains = os.cpu_count() or 1
+        if config.get("restarts") in (None, ""):
+            restarts = parallel_chains
+        if config.get("restart_workers") in (None, ""):
+            restart_workers = parallel_chains
+    logger.info("Annealing chains: %d (%d at a time)", restarts, min(restarts, restart_workers))
+    
+    # Run scheduler
+    if restarts > 1:
+        base_seed = config.get("random_seed")
+        if base_seed is None:
+            base_seed = random.randrange(2 ** 31)
+        stats, entries, unscheduled, conflicts = _run_multi_start(
+            sections, rooms, time_slots, constraints, optimize_kwargs,
+            restarts, restart_workers, int(base_seed)
+        )
+    else:
+        stats, entries, unscheduled, conflicts = _run_annealing_chain(
+            sections, rooms, time_slots, constraints, optimize_kwargs, config.get("random_seed")
+        )
     
-    # Calculate split session statistics
-    split_sessions_count = sum(1 for e in entries if e.get("is_split_session", False))
-    classes_with_splits = len(set(e["section_id"] for e in entries if e.get("is_split_session", False)))
+    # Calculate split session statistics (single pass over the entries)
+    split_sessions_count = 0
+    split_section_ids = set()
+    for e in entries:
+        if e.get("is_split_session", False):
+            split_sessions_count += 1
+            split_section_ids.add(e["section_id"])
+    classes_with_splits = len(split_section_ids)
     
     # If there are conflicts, report them but don't save
     if len(conflicts) > 0:
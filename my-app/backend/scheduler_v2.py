@@ -20,6 +20,7 @@ PERFORMANCE OPTIMIZATIONS (v2.3):
 
 from typing import List, Dict, Tuple, Optional, Set, Any, Union
 from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from enum import Enum
 import copy
 import random
@@ -86,6 +87,7 @@ SOFT_UNEVEN_SECTION_DIST = 250
 OPTIMAL_COST_THRESHOLD = 1000  # Cost below this is considered "good enough"
 MIN_TEMPERATURE = 0.001  # Stop cooling at this temperature
 REHEAT_STAGNATION_THRESHOLD = 200  # Reheat after this many iterations without improvement
+METROPOLIS_MAX_EXPONENT = 20.0  # exp(-20) ~ 2e-9: larger delta/T uphill moves are rejected outright
 
 # LUNCH BREAK MODE
 LUNCH_MODE_STRICT = 'strict'  # No classes during lunch (HARD constraint)
@@ -102,6 +104,25 @@ MAX_SUBJECT_SESSIONS_PER_WEEK = 2  # Max 2 sessions (LEC+LAB) per subject per st
 DAY_INDEX = {"monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6}
 
 
+# Built once at import time; the helpers below run inside the optimizer's hot loops
+DAY_ALIASES = {
+    'mon': 'monday', 'monday': 'monday',
+    'tue': 'tuesday', 'tues': 'tuesday', 'tuesday': 'tuesday',
+    'wed': 'wednesday', 'weds': 'wednesday', 'wednesday': 'wednesday',
+    'thu': 'thursday', 'thur': 'thursday', 'thurs': 'thursday', 'thursday': 'thursday',
+    'fri': 'friday', 'friday': 'friday',
+    'sat': 'saturday', 'saturday': 'saturday',
+    'sun': 'sunday', 'sunday': 'sunday',
+}
+# Room-type keywords that mark a specialized lab (cost function's room-type mismatch check)
+SPECIALIZED_ROOM_TAGS = (
+    'drafting', 'engineering', 'science', 'chemistry', 'physics', 'biology',
+    'speech', 'computer', 'mac', 'cisco', 'medical', 'mining',
+)
+COLLEGE_ABBR_PATTERN = re.compile(r'\(([^)]+)\)\s*$')
+SECTION_CODE_SEPARATOR_PATTERN = re.compile(r'[^A-Z0-9]+')
+
+
 def normalize_day_name(raw: Any) -> str:
     """Normalize day tokens to canonical lowercase full names.
 
@@ -112,16 +133,17 @@ def normalize_day_name(raw: Any) -> str:
     if not token:
         return ''
 
-    aliases = {
-        'mon': 'monday', 'monday': 'monday',
-        'tue': 'tuesday', 'tues': 'tuesday', 'tuesday': 'tuesday',
-        'wed': 'wednesday', 'weds': 'wednesday', 'wednesday': 'wednesday',
-        'thu': 'thursday', 'thur': 'thursday', 'thurs': 'thursday', 'thursday': 'thursday',
-        'fri': 'friday', 'friday': 'friday',
-        'sat': 'saturday', 'saturday': 'saturday',
-        'sun': 'sunday', 'sunday': 'sunday',
-    }
-    return aliases.get(token, token)
+    return DAY_ALIASES.get(token, token)
+
+
+@lru_cache(maxsize=1024)
+def normalize_college_code(value: Optional[str]) -> str:
+    """Uppercase a college label and reduce "College of Science (CS)" to its abbreviation."""
+    raw = str(value or '').strip().upper()
+    if not raw:
+        return ''
+    match = COLLEGE_ABBR_PATTERN.search(raw)
+    return match.group(1).strip().upper() if match else raw
 
 
 def normalize_day_list(days: Optional[List[Any]], *, fallback: Optional[List[str]] = None) -> List[str]:
@@ -145,6 +167,19 @@ def normalize_day_list(days: Optional[List[Any]], *, fallback: Optional[List[str
     return out
 
 
+def metropolis_accept(delta: float, temperature: float) -> bool:
+    """
+    Metropolis acceptance test. Downhill moves are accepted and moves whose
+    delta/T exceeds METROPOLIS_MAX_EXPONENT are rejected without calling exp.
+    """
+    if delta <= 0:
+        return True
+    ratio = delta / temperature
+    if ratio > METROPOLIS_MAX_EXPONENT:
+        return False
+    return random.random() < math.exp(-ratio)
+
+
 # ==================== Data Validation ====================
 
 class ValidationError:
@@ -323,7 +358,7 @@ def validate_scheduling_data(
 
 # ==================== Data Classes ====================
 
-@dataclass
+@dataclass(slots=True)
 class TimeSlot:
     """30-minute time slot with day/night classification"""
     id: int
@@ -569,7 +604,7 @@ class SchedulingConstraints:
     SOFT_FIXED_ALLOCATION_VIOLATION: int = SOFT_FIXED_ALLOCATION_VIOLATION
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleSlot:
     """Represents a scheduled class in a specific room, day, and time slot"""
     section_id: int
@@ -684,6 +719,19 @@ def generate_time_slots(
     Returns:
         List of TimeSlot objects
     """
+    return list(_build_time_slot_grid(start_time, end_time, slot_duration, lunch_start, lunch_end))
+
+
+@lru_cache(maxsize=64)
+def _build_time_slot_grid(
+    start_time: str,
+    end_time: str,
+    slot_duration: int,
+    lunch_start: Optional[str],
+    lunch_end: Optional[str]
+) -> Tuple[TimeSlot, ...]:
+    """Cached slot grid; the same campus hours are requested on every generate call.
+    TimeSlot objects are shared between callers and treated as read-only."""
     slots = []
     start_mins = parse_time_to_minutes(start_time)
     end_mins = parse_time_to_minutes(end_time)
@@ -721,7 +769,7 @@ def generate_time_slots(
         slot_id += 1
         current += slot_duration
     
-    return slots
+    return tuple(slots)
 
 
 # ==================== Main Scheduler Class ====================
@@ -756,6 +804,13 @@ class EnhancedQuantumScheduler:
         # We need self.rooms initialized first to check capacities
         self.rooms = {r.id: r for r in rooms}
 
+        # Lab classification per room, derived from room_type once instead of
+        # re-lowercasing the type string on every compatibility/cost check
+        self.room_is_lab: Dict[int, bool] = {}
+        for room_id, room in self.rooms.items():
+            room_type_lower = room.room_type.lower() if room.room_type else ''
+            self.room_is_lab[room_id] = 'lab' in room_type_lower or 'computer' in room_type_lower
+
         # Pre-compute room "profile" groupings for room packing heuristics.
         # Rooms with the same profile are interchangeable for packing purposes.
         # Profile includes college (primary bucket to respect college filtering)
@@ -777,8 +832,18 @@ class EnhancedQuantumScheduler:
             self.rooms_by_profile_key[key].append(room_id)
         self.constraints = constraints or SchedulingConstraints()
         self.faculty_profiles = {f.id: f for f in (faculty_profiles or [])}  # Index by ID
+        # Per-faculty day rules normalized once instead of on every availability check
+        self.faculty_unavailable_days: Dict[Union[int, str], Set[str]] = {
+            fid: {str(d).strip().lower() for d in (f.unavailable_days or ()) if str(d).strip()}
+            for fid, f in self.faculty_profiles.items()
+        }
+        self.part_time_faculty_ids: Set[Union[int, str]] = {
+            fid for fid, f in self.faculty_profiles.items()
+            if str(f.employment_type or "").lower().replace('-', '').replace(' ', '') == "parttime"
+        }
         self.time_slots = time_slots
         self.time_slots_by_id = {t.id: t for t in time_slots}
+        self.time_slots_by_start = sorted(self.time_slots_by_id.values(), key=lambda t: t.start_minutes)
         self.active_days = normalize_day_list(active_days, fallback=self.DAYS[:6])
         self.online_days = normalize_day_list(online_days)  # NEW: Online days
         
@@ -800,6 +865,16 @@ class EnhancedQuantumScheduler:
         for s in self.sections.values():
             self.sections_by_department[s.department].append(s.id)
         
+        # Sparse conflict indexes: a placement can only collide with sections
+        # sharing its teacher or course/year, so checks visit those ids only
+        # instead of every assigned section.
+        self.sections_by_teacher: Dict[Union[int, str], List[int]] = defaultdict(list)
+        self.sections_by_course_year: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        for s in self.sections.values():
+            if s.teacher_id:
+                self.sections_by_teacher[s.teacher_id].append(s.id)
+            self.sections_by_course_year[(s.course_code, s.year_level)].append(s.id)
+        
         # Current schedule state
         # Key: (room_id, day, slot_id) -> ScheduleSlot
         # For online classes: room_id can be None or 0
@@ -830,6 +905,13 @@ class EnhancedQuantumScheduler:
             base_code = self._get_base_section_code_static(s.section_code)
             self.student_group_sections[base_code].append(s.id)
         
+        # Cohort code (keeps _G1/_G2) -> section ids, paired with the base index
+        # above to resolve student-group overlaps by lookup
+        self.cohort_group_sections: Dict[str, List[int]] = defaultdict(list)
+        for s in self.sections.values():
+            self.cohort_group_sections[self._normalize_section_identity(s.section_code, keep_group=True)].append(s.id)
+        self._student_group_peer_cache: Dict[str, Set[int]] = {}
+        
         # Pre-compute base section code for each section
         self.section_base_codes: Dict[int, str] = {
             s.id: self._get_base_section_code_static(s.section_code) for s in self.sections.values()
@@ -879,6 +961,13 @@ class EnhancedQuantumScheduler:
             if orig_id is not None:
                 original_map[orig_id].append(s)
         
+        # Time slot lookups by start minute / end label (first match wins, as a scan would)
+        slots_by_start_minutes: Dict[int, TimeSlot] = {}
+        slots_by_end_time: Dict[str, TimeSlot] = {}
+        for t in self.time_slots:
+            slots_by_start_minutes.setdefault(t.start_minutes, t)
+            slots_by_end_time.setdefault(t.end_time, t)
+        
         for alloc in fixed_allocations:
             section_id_raw = alloc.get('class_id')
             room_id = alloc.get('room_id')
@@ -928,15 +1017,15 @@ class EnhancedQuantumScheduler:
 
             if not target_sections and section_code_hint:
                 normalized_hint_lookup = section_code_hint.replace('-', '_').replace(' ', '_')
+                # Accept lecture hint by base code (e.g., "BSM CS 1A G1" -> "BSM_CS_1A_LEC")
+                stripped_hint = re.sub(r'(?:_|\b)G[12](?:_|\b)', '_', normalized_hint_lookup)
+                stripped_hint = re.sub(r'_+', '_', stripped_hint).strip('_')
                 for s in self.sections.values():
                     normalized_code = s.section_code.upper().replace('-', '_').replace(' ', '_')
                     if normalized_code == normalized_hint_lookup:
                         target_sections.append(s)
                         continue
 
-                    # Accept lecture hint by base code (e.g., "BSM CS 1A G1" -> "BSM_CS_1A_LEC")
-                    stripped_hint = re.sub(r'(?:_|\b)G[12](?:_|\b)', '_', normalized_hint_lookup)
-                    stripped_hint = re.sub(r'_+', '_', stripped_hint).strip('_')
                     if normalized_code.endswith('_LEC') and normalized_code.startswith(stripped_hint):
                         target_sections.append(s)
             
@@ -950,7 +1039,7 @@ class EnhancedQuantumScheduler:
             
             # Normalize to minutes for robust matching (handles 07:00 vs 7:00 AM vs 07:00 AM)
             target_start_min = parse_time_to_minutes(start_time_str)
-            start_slot = next((t for t in self.time_slots if t.start_minutes == target_start_min), None)
+            start_slot = slots_by_start_minutes.get(target_start_min)
             
             if not start_slot:
                 print(f"   ⚠️ Invalid time slot '{start_time_str}' (min={target_start_min}) for manual allocation")
@@ -1034,7 +1123,7 @@ class EnhancedQuantumScheduler:
             # Calculate duration in slots
             try:
                 end_time_str = parts[1]
-                end_slot = next((t for t in self.time_slots if t.end_time == end_time_str), None)
+                end_slot = slots_by_end_time.get(end_time_str)
                 if end_slot and end_slot.id >= start_slot.id:
                     slot_count = end_slot.id - start_slot.id + 1
                     actual_duration = (end_slot.start_minutes + end_slot.duration_minutes) - start_slot.start_minutes
@@ -1243,18 +1332,11 @@ class EnhancedQuantumScheduler:
         """
         compatible = {}
 
-        def normalize_college(value: Optional[str]) -> str:
-            raw = str(value or '').strip().upper()
-            if not raw:
-                return ''
-            match = re.search(r'\(([^)]+)\)\s*$', raw)
-            return match.group(1).strip().upper() if match else raw
-
         def college_matches(section_college: Optional[str], room_college: Optional[str]) -> bool:
             if not self.constraints.college_room_matching_enabled:
                 return True
-            s_col = normalize_college(section_college)
-            r_col = normalize_college(room_college)
+            s_col = normalize_college_code(section_college)
+            r_col = normalize_college_code(room_college)
             if not s_col or not r_col:
                 return True
             return r_col == 'SHARED' or r_col == s_col
@@ -1280,8 +1362,7 @@ class EnhancedQuantumScheduler:
             
             # First pass: strict matching with feature check and college constraint
             for room in self.rooms.values():
-                room_type_lower = room.room_type.lower() if room.room_type else ''
-                is_lab_room = 'lab' in room_type_lower or 'computer' in room_type_lower
+                is_lab_room = self.room_is_lab[room.id]
                 room_features = room.feature_tags or set()
                 room_college = room.college  # Get room's college
                 
@@ -1328,8 +1409,7 @@ class EnhancedQuantumScheduler:
             # BUT still respect feature requirements and college constraints
             if not compatible_rooms and is_lab_class:
                 for room in self.rooms.values():
-                    room_type_lower = room.room_type.lower() if room.room_type else ''
-                    is_lab_room = 'lab' in room_type_lower or 'computer' in room_type_lower
+                    is_lab_room = self.room_is_lab[room.id]
                     room_features = room.feature_tags or set()
                     # College constraint still applies
                     if not college_matches(section_college, room.college):
@@ -1355,8 +1435,7 @@ class EnhancedQuantumScheduler:
             # Final fallback for lectures: use ALL non-lab rooms from same college (ignore features)
             if not compatible_rooms and not is_lab_class:
                 for room in self.rooms.values():
-                    room_type_lower = room.room_type.lower() if room.room_type else ''
-                    is_lab_room = 'lab' in room_type_lower or 'computer' in room_type_lower
+                    is_lab_room = self.room_is_lab[room.id]
                     # College constraint still applies - only use same college or shared rooms
                     if not college_matches(section_college, room.college):
                         continue
@@ -1388,11 +1467,7 @@ class EnhancedQuantumScheduler:
     
     def _is_lab_room(self, room_id: int) -> bool:
         """Check if a room is a lab room"""
-        room = self.rooms.get(room_id)
-        if not room:
-            return False
-        room_type_lower = room.room_type.lower() if room.room_type else ''
-        return 'lab' in room_type_lower or 'computer' in room_type_lower
+        return self.room_is_lab.get(room_id, False)
     
     def _is_slot_range_available(
         self, 
@@ -1516,14 +1591,12 @@ class EnhancedQuantumScheduler:
         
         # 1. Unavailable Days (Most common teacher constraint)
         day_lower = day.lower()
-        unavailable_normalized = {d.lower() for d in profile.unavailable_days}
-        if day_lower in unavailable_normalized:
+        if day_lower in self.faculty_unavailable_days[teacher_id]:
             return False, f"Faculty {profile.name} is marked unavailable on {day}"
             
         # 2. Employment Type Rules (University Policy)
         # Part-time faculty usually can't teach on Saturdays
-        emp_type_norm = str(profile.employment_type or "").lower().replace('-', '').replace(' ', '')
-        if emp_type_norm == "parttime" and day_lower == "saturday":
+        if day_lower == "saturday" and teacher_id in self.part_time_faculty_ids:
             return False, f"Part-time faculty {profile.name} cannot teach on Saturday"
             
         return True, ""
@@ -1546,17 +1619,14 @@ class EnhancedQuantumScheduler:
         
         new_end = start_slot_id + slot_count
         
-        # Use section_assignments for accurate overlap detection
-        for section_id, assignments in self.section_assignments.items():
+        # Use section_assignments for accurate overlap detection, visiting
+        # only this teacher's sections
+        for section_id in self.sections_by_teacher.get(teacher_id, ()):
             # Skip if it's the same section (for move operations)
             if exclude_section_id and section_id == exclude_section_id:
                 continue
             
-            section = self.sections.get(section_id)
-            if not section or section.teacher_id != teacher_id:
-                continue
-            
-            for _, sched_day, sched_start, sched_count in assignments:
+            for _, sched_day, sched_start, sched_count in self.section_assignments.get(section_id, ()):
                 if sched_day != day:
                     continue
                 
@@ -1583,28 +1653,22 @@ class EnhancedQuantumScheduler:
         """
         new_end = start_slot_id + slot_count
         
-        for other_id, assignments in self.section_assignments.items():
+        # Only sections of the same course and year level (different section)
+        for other_id in self.sections_by_course_year.get((section.course_code, section.year_level), ()):
             # Skip if it's the same section
             if exclude_section_id and other_id == exclude_section_id:
                 continue
-            
-            other_section = self.sections.get(other_id)
-            if not other_section:
+            if other_id == section.id:
                 continue
             
-            # Check if same course and year level (different section)
-            if (other_section.course_code == section.course_code and 
-                other_section.year_level == section.year_level and
-                other_section.id != section.id):
+            for _, sched_day, sched_start, sched_count in self.section_assignments.get(other_id, ()):
+                if sched_day != day:
+                    continue
                 
-                for _, sched_day, sched_start, sched_count in assignments:
-                    if sched_day != day:
-                        continue
-                    
-                    existing_end = sched_start + sched_count
-                    
-                    if start_slot_id < existing_end and sched_start < new_end:
-                        return True
+                existing_end = sched_start + sched_count
+                
+                if start_slot_id < existing_end and sched_start < new_end:
+                    return True
         
         return False
     
@@ -1614,6 +1678,7 @@ class EnhancedQuantumScheduler:
         return EnhancedQuantumScheduler._normalize_section_identity(section_code, keep_group=False)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_section_identity(section_code: str, keep_group: bool) -> str:
         """
         Canonicalize section labels so conflict checks work across formats:
@@ -1624,7 +1689,7 @@ class EnhancedQuantumScheduler:
             return ''
 
         # Normalize separators to tokens for stable comparisons.
-        tokens = re.sub(r'[^A-Z0-9]+', ' ', raw).strip().split()
+        tokens = SECTION_CODE_SEPARATOR_PATTERN.sub(' ', raw).strip().split()
         if not tokens:
             return ''
 
@@ -1668,6 +1733,37 @@ class EnhancedQuantumScheduler:
             (a_base == b_cohort)
         )
 
+    def _student_group_peer_ids(self, section_code: str) -> Set[int]:
+        """
+        Section ids whose codes overlap with section_code (same rule as
+        _section_codes_overlap), resolved through the cohort/base indexes.
+        """
+        peers = self._student_group_peer_cache.get(section_code)
+        if peers is None:
+            cohort = self._get_cohort_code(section_code)
+            base = self._get_base_section_code(section_code)
+            peers = set(self.cohort_group_sections.get(cohort, ()))
+            peers.update(self.student_group_sections.get(cohort, ()))
+            peers.update(self.cohort_group_sections.get(base, ()))
+            self._student_group_peer_cache[section_code] = peers
+        return peers
+
+    def _count_student_group_overlaps(self, section_ids: Set[int]) -> int:
+        """
+        Number of overlapping section pairs within one (day, slot) bucket.
+        Equivalent to testing every pair with _section_codes_overlap, but each
+        section intersects its peer set with the bucket once instead.
+        """
+        matches = 0
+        for section_id in section_ids:
+            section = self.sections.get(section_id)
+            if not section:
+                continue
+            peers = self._student_group_peer_ids(section.section_code)
+            # Peer sets include the section itself
+            matches += len(peers & section_ids) - (section_id in peers)
+        return matches // 2
+
     def _check_student_group_conflict(
         self,
         section_id: int,
@@ -1683,23 +1779,15 @@ class EnhancedQuantumScheduler:
         """
         new_end = start_slot_id + slot_count
         
-        for other_sid, other_assignments in self.section_assignments.items():
+        for other_sid in self._student_group_peer_ids(section_code):
             if other_sid == section_id:
                 continue
             
-            other_section = self.sections.get(other_sid)
-            if not other_section:
-                continue
-                
-            other_code = other_section.section_code
-            has_overlap = self._section_codes_overlap(section_code, other_code)
-            
-            if has_overlap:
-                for _, sched_day, sched_start, sched_count in other_assignments:
-                    if sched_day == day:
-                        existing_end = sched_start + sched_count
-                        if start_slot_id < existing_end and sched_start < new_end:
-                            return True
+            for _, sched_day, sched_start, sched_count in self.section_assignments.get(other_sid, ()):
+                if sched_day == day:
+                    existing_end = sched_start + sched_count
+                    if start_slot_id < existing_end and sched_start < new_end:
+                        return True
         return False
     
     def _check_section_conflict(
@@ -1786,15 +1874,8 @@ class EnhancedQuantumScheduler:
         occupied_slots: Set[int] = set()
 
         # Build current occupied slots for the same student cohort on this day.
-        for other_id, assignments in self.section_assignments.items():
-            other_section = self.sections.get(other_id)
-            if not other_section:
-                continue
-
-            if not self._section_codes_overlap(section.section_code, other_section.section_code):
-                continue
-
-            for _, sched_day, sched_start, sched_count in assignments:
+        for other_id in self._student_group_peer_ids(section.section_code):
+            for _, sched_day, sched_start, sched_count in self.section_assignments.get(other_id, ()):
                 if sched_day != day:
                     continue
                 for offset in range(sched_count):
@@ -1919,14 +2000,8 @@ class EnhancedQuantumScheduler:
         """Estimate cohort-day compactness (fragmentation + long span) for greedy scoring."""
         occupied_slots: Set[int] = set()
 
-        for other_id, assignments in self.section_assignments.items():
-            other_section = self.sections.get(other_id)
-            if not other_section:
-                continue
-            if not self._section_codes_overlap(section.section_code, other_section.section_code):
-                continue
-
-            for _, sched_day, sched_start, sched_count in assignments:
+        for other_id in self._student_group_peer_ids(section.section_code):
+            for _, sched_day, sched_start, sched_count in self.section_assignments.get(other_id, ()):
                 if sched_day != day:
                     continue
                 for offset in range(sched_count):
@@ -2286,11 +2361,15 @@ class EnhancedQuantumScheduler:
         section_day_slots: Dict[Tuple[str, str], List[int]] = defaultdict(list)  # (cohort_code, day) -> [slot_ids]
         room_day_slots: Dict[Tuple[int, str], List[int]] = defaultdict(list)  # (room_id, day) -> [slot_ids]
         
-        # Pre-cache room types to avoid repeated string operations
-        room_is_lab_cache: Dict[int, bool] = {}
-        for room_id, room in self.rooms.items():
-            room_type_lower = room.room_type.lower() if room.room_type else ''
-            room_is_lab_cache[room_id] = 'lab' in room_type_lower or 'computer' in room_type_lower
+        # Loop invariants for the per-entry checks below (evaluated once per call
+        # instead of once per schedule entry)
+        constraints = self.constraints
+        day_class_start = constraints.day_class_start
+        night_class_end = constraints.night_class_end
+        capacity_factor = 1 + constraints.capacity_tolerance
+        strict_lecture_rooms = constraints.strict_lecture_room_matching
+        strict_lunch = constraints.lunch_mode == 'strict'
+        online_by_day: Dict[str, bool] = {}
         
         # Single pass: Build usage maps and check hard constraints
         for key, slot in self.schedule.items():
@@ -2304,41 +2383,44 @@ class EnhancedQuantumScheduler:
             is_lab_class = section.requires_lab or section.lab_hours > 0
             
             # HARD: Check online day rule (The Ghost Room)
-            if self._is_online_day(day):
+            is_online_day = online_by_day.get(day)
+            if is_online_day is None:
+                is_online_day = online_by_day[day] = self._is_online_day(day)
+            if is_online_day:
                 if room_id is not None and room_id != 0:
                     cost += HARD_CONSTRAINT_PENALTY
                     conflict_detected = True
             
             # HARD: The Midnight Shift
             if slot_obj:
-                if slot_obj.start_minutes < self.constraints.day_class_start:
+                if slot_obj.start_minutes < day_class_start:
                     cost += HARD_CONSTRAINT_PENALTY
                     conflict_detected = True
-                if slot_obj.start_minutes >= self.constraints.night_class_end:
+                if slot_obj.start_minutes >= night_class_end:
                     cost += HARD_CONSTRAINT_PENALTY
                     conflict_detected = True
             
             # HARD: Overcrowding
             if room and section.student_count > 0 and not slot.is_online:
-                max_capacity = room.capacity * (1 + self.constraints.capacity_tolerance)
+                max_capacity = room.capacity * capacity_factor
                 if section.student_count > max_capacity:
                     cost += HARD_CONSTRAINT_PENALTY
                     conflict_detected = True
             
             # HARD: Lab-First Rule and Lecture-in-Lab Rule
             if room and not slot.is_online:
-                is_lab_room = room_is_lab_cache.get(room_id, False)
+                is_lab_room = self.room_is_lab.get(room_id, False)
                 
                 if is_lab_class and not is_lab_room:
                     cost += HARD_CONSTRAINT_PENALTY
                     conflict_detected = True
                 
-                if not is_lab_class and is_lab_room and self.constraints.strict_lecture_room_matching:
+                if not is_lab_class and is_lab_room and strict_lecture_rooms:
                     cost += HARD_CONSTRAINT_PENALTY
                     conflict_detected = True
             
             # HARD: Strict Lunch Break
-            if self.constraints.lunch_mode == 'strict':
+            if strict_lunch:
                 if self._is_during_lunch(slot.start_slot_id, slot.slot_count):
                     cost += HARD_CONSTRAINT_PENALTY
                     conflict_detected = True
@@ -2469,21 +2551,9 @@ class EnhancedQuantumScheduler:
                 student_group_slots[(day, slot_id + offset)].add(slot.section_id)
 
         for (day, slot_id), section_ids in student_group_slots.items():
-            ids = list(section_ids)
-            overlap_conflicts = 0
-
-            for i in range(len(ids)):
-                section_a = self.sections.get(ids[i])
-                if not section_a:
-                    continue
-
-                for j in range(i + 1, len(ids)):
-                    section_b = self.sections.get(ids[j])
-                    if not section_b:
-                        continue
-
-                    if self._section_codes_overlap(section_a.section_code, section_b.section_code):
-                        overlap_conflicts += 1
+            if len(section_ids) < 2:
+                continue
+            overlap_conflicts = self._count_student_group_overlaps(section_ids)
 
             if overlap_conflicts > 0:
                 cost += HARD_CONSTRAINT_PENALTY * overlap_conflicts
@@ -2536,12 +2606,8 @@ class EnhancedQuantumScheduler:
                 if not section or not room or slot.is_online:
                     continue
                 
-                s_col = str(section.college).strip().upper() if section.college else ''
-                r_col = str(room.college).strip().upper() if room.college else ''
-                s_abbr_match = re.search(r'\(([^)]+)\)\s*$', s_col)
-                r_abbr_match = re.search(r'\(([^)]+)\)\s*$', r_col)
-                s_norm = s_abbr_match.group(1).strip().upper() if s_abbr_match else s_col
-                r_norm = r_abbr_match.group(1).strip().upper() if r_abbr_match else r_col
+                s_norm = normalize_college_code(section.college)
+                r_norm = normalize_college_code(room.college)
                 
                 if s_norm and r_norm and r_norm != 'SHARED' and r_norm != s_norm:
                     cost += HARD_CONSTRAINT_PENALTY
@@ -2737,7 +2803,12 @@ class EnhancedQuantumScheduler:
                 continue
             
             # Skip soft penalties for online classes
-            if slot.is_online or self._is_online_day(day):
+            if slot.is_online:
+                continue
+            is_online_day = online_by_day.get(day)
+            if is_online_day is None:
+                is_online_day = online_by_day[day] = self._is_online_day(day)
+            if is_online_day:
                 continue
             
             room = self.rooms.get(room_id)
@@ -2751,10 +2822,8 @@ class EnhancedQuantumScheduler:
                 
                 if required_type != actual_type:
                     # Check for MAJOR mismatch - specialized labs being used for wrong purpose
-                    specialized_tags = ['drafting', 'engineering', 'science', 'chemistry', 'physics', 'biology', 'speech', 'computer', 'mac', 'cisco', 'medical', 'mining']
-                    
-                    is_req_special = any(tag in required_type for tag in specialized_tags)
-                    is_act_special = any(tag in actual_type for tag in specialized_tags)
+                    is_req_special = any(tag in required_type for tag in SPECIALIZED_ROOM_TAGS)
+                    is_act_special = any(tag in actual_type for tag in SPECIALIZED_ROOM_TAGS)
                     
                     is_lecture_class = 'lecture' in required_type or not section.requires_lab
                     
@@ -2904,7 +2973,7 @@ class EnhancedQuantumScheduler:
             lunch_start_slot = None
             lunch_end_slot = None
             
-            for i, slot in enumerate(sorted(self.time_slots_by_id.values(), key=lambda s: s.start_minutes), 1):
+            for i, slot in enumerate(self.time_slots_by_start, 1):
                 if lunch_start_slot is None and slot.start_minutes >= self.constraints.lunch_start_minutes:
                     lunch_start_slot = i
                 if slot.start_minutes < self.constraints.lunch_end_minutes:
@@ -2949,7 +3018,6 @@ class EnhancedQuantumScheduler:
             # Determine if this day's schedule violates preferences
             # 1. Check Shift Preferences (Morning vs Night)
             has_night_class = any(self.time_slots_by_id[s].is_night_class for s in slot_ids if s in self.time_slots_by_id)
-            has_day_class = any(not self.time_slots_by_id[s].is_night_class for s in slot_ids if s in self.time_slots_by_id)
             
             # Helper: Check if slot is morning (start < 12:00)
             has_morning_class = any(self.time_slots_by_id[s].start_minutes < 720 for s in slot_ids if s in self.time_slots_by_id)
@@ -2967,14 +3035,8 @@ class EnhancedQuantumScheduler:
                     cost += self.constraints.SOFT_VSL_SHIFT_MISMATCH
             
             # 2. Employment Type Rules
-            # VSL / Part-time usually prefer Night or Weekends (Saturday)
-            if 'vsl' in employment_type or 'part-time' in employment_type or 'part time' in employment_type:
-                # If they are VSL and scheduled nicely on Saturday or Night, good.
-                # If they are scheduled during regular day hours on weekdays without preference, maybe slight penalty?
-                # Actually, strictly follow "unavailable_days" which is handled by hard constraints elsewhere?
-                # Assuming here we just want to favor their preferred shift.
-                pass
-            
+            # VSL / Part-time shifts are covered by the preference check above and the
+            # hard unavailable_days rule, so only full-time faculty get an extra penalty here.
             # Full-time usually prefer 7am-6pm validation is handled by constraints.day_class_end
             if 'full-time' in employment_type or 'regular' in employment_type:
                 # Generally avoid late night unless preferred
@@ -3402,13 +3464,7 @@ class EnhancedQuantumScheduler:
             tid = getattr(section, 'teacher_id', None)
             if not tid or not self.faculty_profiles or tid not in self.faculty_profiles:
                 return len(active_days_lower)
-            profile = self.faculty_profiles.get(tid)
-            unavailable = {
-                str(d).strip().lower()
-                for d in (getattr(profile, 'unavailable_days', set()) or set())
-                if str(d).strip()
-            }
-            return max(0, len(active_days_lower - unavailable))
+            return max(0, len(active_days_lower - self.faculty_unavailable_days[tid]))
 
         sorted_sections = sorted(
             self.sections.values(),
@@ -3434,11 +3490,8 @@ class EnhancedQuantumScheduler:
             if slots_already_pinned >= total_needed:
                 continue
             
-            compatible_rooms = self.compatible_rooms.get(section.id, [])
-            
             # FIX: Do NOT fallback to all rooms if compatible_rooms is empty.
-            if not compatible_rooms:
-                pass 
+            compatible_rooms = self.compatible_rooms.get(section.id, [])
             
             # Calculate sessions with proper lec/lab separation
             sessions = self._calculate_sessions(section)
@@ -4299,8 +4352,8 @@ class EnhancedQuantumScheduler:
                                 candidates.append((energy, new_room, new_day, new_slot.id, is_online))
                 
                 if candidates:
-                    candidates.sort(key=lambda x: x[0])
-                    _, new_room, new_day, new_slot_id, is_online = candidates[0]
+                    # Only the lowest-energy candidate is used; no need to sort them all
+                    _, new_room, new_day, new_slot_id, is_online = min(candidates, key=lambda x: x[0])
                     
                     if self._allocate_section(section, new_room, new_day, new_slot_id, slot_count, is_online, actual_duration_minutes=actual_mins):
                         self.stats.quantum_tunnels += 1
@@ -4408,7 +4461,7 @@ class EnhancedQuantumScheduler:
                     delta = new_cost - old_cost
                     
                     # Accept or reject (Metropolis criterion)
-                    if delta < 0 or random.random() < math.exp(-delta / max(temperature, 0.01)):
+                    if metropolis_accept(delta, max(temperature, 0.01)):
                         current_cost = new_cost
                         stagnation_count = 0
                         
@@ -4641,19 +4694,8 @@ class EnhancedQuantumScheduler:
 
         student_group_conflicts = 0
         for section_ids in student_slots.values():
-            ids = list(section_ids)
-            for i in range(len(ids)):
-                section_a = self.sections.get(ids[i])
-                if not section_a:
-                    continue
-
-                for j in range(i + 1, len(ids)):
-                    section_b = self.sections.get(ids[j])
-                    if not section_b:
-                        continue
-
-                    if self._section_codes_overlap(section_a.section_code, section_b.section_code):
-                        student_group_conflicts += 1
+            if len(section_ids) > 1:
+                student_group_conflicts += self._count_student_group_overlaps(section_ids)
 
         total_conflicts = teacher_conflicts + student_group_conflicts
         return {
@@ -5043,15 +5085,8 @@ def run_enhanced_scheduler(
         required_features_set = generic_reqs
         
         # Helpers to decide if we should split a section into G1/G2 based on room-specific capacities
-        def _normalize_college_key(value: str) -> str:
-            raw = str(value or '').strip().upper()
-            if not raw:
-                return ''
-            match = re.search(r'\(([^)]+)\)\s*$', raw)
-            return match.group(1).strip().upper() if match else raw
-
         def get_max_compatible_cap(room_type_req, features_req, col):
-            s_col = _normalize_college_key(col)
+            s_col = normalize_college_code(col)
             compatible = []
             req_type_lower = room_type_req.lower()
             
@@ -5064,7 +5099,7 @@ def run_enhanced_scheduler(
                          continue
                 
                 # 2. College check
-                r_col = _normalize_college_key(r.get('college', ''))
+                r_col = normalize_college_code(r.get('college', ''))
                 if s_col and r_col and r_col != 'SHARED' and r_col != s_col:
                     continue
                 
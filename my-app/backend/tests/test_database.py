@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+
+import database
+
+
+def _allocation(room_id, day, teacher_id=None):
+    return {"room_id": room_id, "schedule_day": day, "teacher_id": teacher_id}
+
+
+def test_conflict_index_sees_external_writes_by_default(monkeypatch):
+    rows = [_allocation(1, "monday", 7)]
+
+    async def fake_entries(schedule_id):
+        return list(rows)
+
+    monkeypatch.setattr(database, "get_schedule_entries", fake_entries)
+
+    async def scenario():
+        assert await database.check_conflicts_batch(5, [(2, "monday", 1, None)]) == set()
+        rows.append(_allocation(2, "monday"))  # Written by the frontend, no invalidation
+        return await database.check_conflicts_batch(5, [(2, "monday", 1, None)])
+
+    assert asyncio.run(scenario()) == {(2, "monday", 1, None)}
+
+
+def test_conflict_index_is_reused_within_ttl_until_invalidated(monkeypatch):
+    fetches = []
+
+    async def fake_entries(schedule_id):
+        fetches.append(schedule_id)
+        return [_allocation(1, "monday", 7)]
+
+    monkeypatch.setattr(database, "get_schedule_entries", fake_entries)
+    monkeypatch.setattr(database, "CONFLICT_INDEX_TTL_SECONDS", 30)
+    monkeypatch.setattr(database, "_conflict_indexes", {})
+
+    async def scenario():
+        candidate = (3, "tuesday", 1, 7)
+        await database.check_conflicts_batch(5, [candidate])
+        await database.check_conflicts_batch(5, [candidate])
+        database._invalidate_conflict_index([5])
+        await database.check_conflicts_batch(5, [candidate])
+
+    asyncio.run(scenario())
+    assert fetches == [5, 5]
+
+
+def _counting_cache(ttl_seconds=60):
+    calls = []
+    release = {}
+
+    @database._ttl_cache(ttl_seconds)
+    async def fetch_rows(key):
+        calls.append(key)
+        gate = release.get(key)
+        if gate is not None:
+            await gate.wait()
+        return [{"key": key, "call": len(calls)}]
+
+    return fetch_rows, calls, release
+
+
+def test_ttl_cache_coalesces_concurrent_misses_and_releases_locks():
+    fetch_rows, calls, _ = _counting_cache()
+
+    async def scenario():
+        results = await asyncio.gather(*[fetch_rows("a") for _ in range(5)])
+        assert await fetch_rows("a") == results[0]
+        return results
+
+    results = asyncio.run(scenario())
+    assert calls == ["a"]
+    assert all(rows == [{"key": "a", "call": 1}] for rows in results)
+    assert fetch_rows.cache_info() == {"entries": 1, "locks": 0, "pending": 0}
+
+
+def test_ttl_cache_refreshes_ahead_in_the_background(monkeypatch):
+    fetch_rows, calls, _ = _counting_cache(ttl_seconds=10)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(database.time, "monotonic", lambda: clock["now"])
+
+    async def scenario():
+        await fetch_rows("a")
+        clock["now"] += 9  # Past REFERENCE_CACHE_REFRESH_AHEAD of the TTL
+        stale = await fetch_rows("a")
+        await asyncio.gather(*database._background_refreshes)
+        return stale, await fetch_rows("a")
+
+    stale, fresh = asyncio.run(scenario())
+    assert stale == [{"key": "a", "call": 1}]
+    assert fresh == [{"key": "a", "call": 2}]
+    assert calls == ["a", "a"]
+
+
+def test_ttl_cache_invalidation_only_discards_fetches_for_that_key():
+    fetch_rows, calls, release = _counting_cache()
+
+    async def scenario():
+        release["a"], release["b"] = asyncio.Event(), asyncio.Event()
+        in_flight = [asyncio.create_task(fetch_rows("a")), asyncio.create_task(fetch_rows("b"))]
+        await asyncio.sleep(0)
+        fetch_rows.cache_invalidate("a")  # A write landed while both fetches ran
+        release["a"].set()
+        release["b"].set()
+        await asyncio.gather(*in_flight)
+        release.clear()
+        await fetch_rows("a")
+        await fetch_rows("b")
+
+    asyncio.run(scenario())
+    # "a" is refetched because its in-flight rows predate the write; "b" is cached
+    assert calls == ["a", "b", "a"]
+    assert fetch_rows.cache_info() == {"entries": 2, "locks": 0, "pending": 0}
+
+
+def test_connection_pool_stats_tolerate_unknown_client_internals(monkeypatch):
+    class Opaque:
+        postgrest = object()  # No session/_transport attributes
+
+    monkeypatch.setattr(database, "supabase_async", Opaque())
+    stats = database.get_connection_pool_stats()
+    assert "open_connections" not in stats["http"]
+    assert stats["http"]["max_connections"] == database.SUPABASE_HTTP_LIMITS.max_connections
+
+
+class _FakeTable:
+    """Records PostgREST calls; inserts fail for rows flagged with fail=True"""
+
+    def __init__(self, log, next_id):
+        self.log = log
+        self.next_id = next_id
+
+    def insert(self, rows, **kwargs):
+        return ("insert", rows if isinstance(rows, list) else [rows])
+
+    def delete(self):
+        return self
+
+    def in_(self, column, values):
+        return ("delete", list(values))
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+def _fake_supabase(monkeypatch):
+    log = []
+    next_id = iter(range(1, 10 ** 6))
+
+    async def fake_execute(query):
+        action, rows = query
+        log.append((action, len(rows)))
+        if action == "insert":
+            if any(row.get("fail") for row in rows):
+                raise RuntimeError("chunk failed")
+            return _FakeResponse([{**row, "id": next(next_id)} for row in rows])
+        return _FakeResponse([])
+
+    class Client:
+        def table(self, name):
+            return _FakeTable(log, next_id)
+
+    monkeypatch.setattr(database, "_execute", fake_execute)
+    monkeypatch.setattr(database, "_db", lambda: Client())
+    monkeypatch.setattr(database, "INSERT_CHUNK_SIZE", 2)
+    return log
+
+
+def test_insert_rows_chunks_and_keeps_input_order(monkeypatch):
+    log = _fake_supabase(monkeypatch)
+    rows = [{"n": i} for i in range(5)]
+
+    inserted = asyncio.run(database._insert_rows("rooms", rows))
+
+    assert [row["n"] for row in inserted] == list(range(5))
+    assert log == [("insert", 2), ("insert", 2), ("insert", 1)]
+
+
+def test_insert_rows_deletes_written_chunks_when_one_fails(monkeypatch):
+    log = _fake_supabase(monkeypatch)
+    rows = [{"n": i} for i in range(5)] + [{"n": 5, "fail": True}]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(database._insert_rows("room_allocations", rows))
+
+    # Both healthy chunks settled before the rollback deleted their 4 rows
+    assert sorted(log[:3]) == [("insert", 2), ("insert", 2), ("insert", 2)]
+    assert log[3:] == [("delete", 2), ("delete", 2)]
+
+
+def test_insert_one_raises_when_no_row_comes_back(monkeypatch):
+    async def empty_execute(query):
+        return _FakeResponse([])
+
+    class Client:
+        def table(self, name):
+            return _FakeTable([], None)
+
+    monkeypatch.setattr(database, "_execute", empty_execute)
+    monkeypatch.setattr(database, "_db", lambda: Client())
+
+    with pytest.raises(database.APIError):
+        asyncio.run(database._insert_one("rooms", {"room_code": "R1"}))
+
+
+def test_pooled_client_kwargs_fall_back_when_httpx_client_is_unsupported():
+    from dataclasses import dataclass
+
+    @dataclass
+    class OldOptions:
+        schema: str = "public"
+
+    assert database._pooled_client_kwargs(None, object) == {}
+    assert database._pooled_client_kwargs(OldOptions, object) == {}
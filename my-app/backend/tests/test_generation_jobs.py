@@ -0,0 +1,34 @@
+from fastapi.testclient import TestClient
+
+import main
+
+REQUEST = {"schedule_name": "Test", "semester": "1st", "academic_year": "2026-2027"}
+
+
+class _FakeResult:
+    def model_dump(self):
+        return {"success": True, "schedule_id": 42}
+
+
+def test_background_generation_is_pollable_until_completed(monkeypatch):
+    async def fake_generate(request, job_id):
+        return _FakeResult()
+
+    monkeypatch.setattr(main, "_generate_schedule", fake_generate)
+    client = TestClient(main.app)
+
+    accepted = client.post("/api/schedules/generate", params={"background": "true"}, json=REQUEST)
+    assert accepted.status_code == 202
+    job = client.get(accepted.json()["status_url"]).json()
+
+    assert job["status"] == "completed"
+    assert job["result"] == {"success": True, "schedule_id": 42}
+    assert client.get("/api/schedules/generate/jobs/unknown").status_code == 404
+
+
+def test_background_generation_is_refused_with_several_workers(monkeypatch):
+    monkeypatch.setattr(main, "WEB_CONCURRENCY", 2)
+    response = TestClient(main.app).post(
+        "/api/schedules/generate", params={"background": "true"}, json=REQUEST
+    )
+    assert response.status_code == 503
@@ -0,0 +1,16 @@
+from fastapi.testclient import TestClient
+
+import main
+
+
+def test_queue_status_stream_sends_retry_and_closes_after_max_lifetime(monkeypatch):
+    monkeypatch.setattr(main, "SCHEDULE_QUEUE_STREAM_MAX_SECONDS", 0.3)
+    monkeypatch.setattr(main, "SCHEDULE_QUEUE_STREAM_HEARTBEAT_SECONDS", 0.1)
+
+    with TestClient(main.app).stream("GET", "/api/schedules/generate/queue-status/stream") as response:
+        body = response.read().decode()  # Returns only because the stream ends
+
+    events = [event for event in body.split("\n\n") if event]
+    assert events[0] == f"retry: {main.SCHEDULE_QUEUE_STREAM_RETRY_MS}"
+    assert all(event.startswith("data: ") for event in events[1:])
+    assert len(events) >= 2
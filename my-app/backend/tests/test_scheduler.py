@@ -0,0 +1,163 @@
+import random
+
+import pytest
+
+from scheduler import (
+    QuantumInspiredScheduler, Room, ScheduleSlot, SchedulingConstraints, Section, TimeSlot,
+    _run_multi_start, chain_is_hopeless, run_scheduler
+)
+
+
+def _toy_problem():
+    """30 two-slot sections over 3 teachers and 6 rooms of very different sizes"""
+    time_slots = [TimeSlot(i + 1, f"S{i + 1}", f"{7 + i}:00", f"{8 + i}:00", 60) for i in range(4)]
+    rooms = [
+        Room(i + 1, f"R{i + 1}", f"Room {i + 1}", "B", "Main", capacity, "lecture")
+        for i, capacity in enumerate([30, 60, 90, 150, 220, 300])
+    ]
+    sections = [
+        Section(i + 1, f"SEC{i + 1}", f"C{i}", f"Course {i}", i % 3 + 1, f"T{i % 3}",
+                1, 20 + (i * 7) % 10, "lecture", 120)
+        for i in range(30)
+    ]
+    return sections, rooms, time_slots
+
+
+def _toy_scheduler():
+    return QuantumInspiredScheduler(*_toy_problem(), SchedulingConstraints(max_teacher_hours_per_day=2))
+
+
+def test_chain_is_hopeless_with_positive_best():
+    assert chain_is_hopeless(160.0, 100.0)
+    assert not chain_is_hopeless(140.0, 100.0)
+
+
+def test_chain_is_hopeless_never_abandons_chains_at_or_below_a_negative_best():
+    assert not chain_is_hopeless(-50.0, -40.0)
+    assert not chain_is_hopeless(-40.0, -40.0)
+    assert not chain_is_hopeless(0.0, 0.0)
+    assert not chain_is_hopeless(-30.0, -40.0)  # within 0.5 x |best|
+    assert chain_is_hopeless(-10.0, -40.0)
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_modified_lam_tracks_target_acceptance(seed):
+    random.seed(seed)
+    scheduler = _toy_scheduler()
+    _, stats = scheduler.optimize(
+        max_iterations=20000, initial_temperature=50.0, cooling_schedule="modified_lam"
+    )
+
+    history = stats.acceptance_history
+    n = len(history)
+    plateau = history[n // 4: n * 6 // 10]
+    assert sum(plateau) / len(plateau) == pytest.approx(0.44, abs=0.03)
+    # Decay phase: the rate follows the target down
+    assert history[-1] < 0.15
+    assert stats.final_cost < stats.initial_cost
+
+
+def test_modified_lam_restarts_keep_the_best_solution():
+    random.seed(3)
+    scheduler = _toy_scheduler()
+    _, stats = scheduler.optimize(
+        max_iterations=6000, initial_temperature=50.0,
+        cooling_schedule="modified_lam", lam_restart_iterations=1000
+    )
+
+    assert stats.iterations == 6000
+    assert stats.final_cost <= stats.initial_cost
+    assert scheduler._calculate_cost() == pytest.approx(stats.final_cost)
+
+
+def test_run_scheduler_passes_cooling_schedule_to_optimize(monkeypatch):
+    seen = []
+    optimize = QuantumInspiredScheduler.optimize
+
+    def spy(self, **kwargs):
+        seen.append((kwargs["cooling_schedule"], kwargs["lam_restart_iterations"]))
+        return optimize(self, **kwargs)
+
+    monkeypatch.setattr(QuantumInspiredScheduler, "optimize", spy)
+    sections, rooms, time_slots = _toy_problem()
+    run_scheduler(
+        [{"id": s.id, "teacher_id": s.teacher_id, "student_count": s.student_count, "total_hours": 2,
+          "required_room_type": "lecture"} for s in sections],
+        [{"id": r.id, "capacity": r.capacity, "room_type": "lecture"} for r in rooms],
+        [{"id": t.id, "duration_minutes": 60} for t in time_slots],
+        {"max_iterations": 200, "cooling_schedule": "modified_lam", "lam_restart_iterations": 50}
+    )
+
+    assert seen == [("modified_lam", 50)]
+
+
+def test_multi_start_reports_ensemble_iterations_and_shares_cooling_schedule(monkeypatch):
+    schedules = []
+    optimize = QuantumInspiredScheduler.optimize
+
+    def spy(self, **kwargs):
+        schedules.append(kwargs["cooling_schedule"])
+        return optimize(self, **kwargs)
+
+    monkeypatch.setattr(QuantumInspiredScheduler, "optimize", spy)
+    sections, rooms, time_slots = _toy_problem()
+    stats, _, _, _ = _run_multi_start(
+        sections, rooms, time_slots, SchedulingConstraints(max_teacher_hours_per_day=2),
+        {"max_iterations": 800, "initial_temperature": 50.0, "cooling_schedule": "modified_lam"},
+        restarts=3, workers=1, base_seed=7
+    )
+
+    assert schedules == ["modified_lam"] * 3
+    # Budgets 200, 400 and 800; no chain runs long enough to be abandoned
+    assert stats.iterations == 1400
+
+
+def _full_recompute(scheduler):
+    """Cost and teacher indexes rebuilt from the schedule dict alone"""
+    slot_cost = sum(scheduler._slot_cost(slot) for slot in scheduler.schedule.values())
+    day_counts = {}
+    masks = {}
+    for (_, day, slot_id), slot in scheduler.schedule.items():
+        day_counts[(slot.teacher_id, day)] = day_counts.get((slot.teacher_id, day), 0) + 1
+        if slot.teacher_id:
+            masks[(slot.teacher_id, day)] = masks.get((slot.teacher_id, day), 0) | scheduler.slot_bits[slot_id]
+    overload = sum(scheduler._teacher_overload_penalty(hours) for hours in day_counts.values())
+    return slot_cost, overload, day_counts, masks
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_cost_matches_full_recompute_after_random_moves(seed, monkeypatch):
+    import scheduler as scheduler_module
+
+    random.seed(seed)
+    scheduler = _toy_scheduler()
+    rng = random.Random(seed)
+    checks = []
+
+    def checking_accept(delta, temperature):
+        # Called with the move (or swap) applied, before it is kept or undone
+        slot_cost, overload, day_counts, masks = _full_recompute(scheduler)
+        assert scheduler.slot_cost_total == pytest.approx(slot_cost)
+        assert scheduler.teacher_overload_cost == pytest.approx(overload)
+        assert {k: v for k, v in scheduler.teacher_day_counts.items() if v} == day_counts
+        assert {k: v for k, v in scheduler.teacher_day_masks.items() if v} == masks
+        assert sorted(scheduler.schedule_keys) == sorted(scheduler.schedule)
+        checks.append(delta)
+        return rng.random() < 0.5
+
+    monkeypatch.setattr(scheduler_module, "metropolis_accept", checking_accept)
+    scheduler.optimize(max_iterations=1500, initial_temperature=50.0)
+    assert len(checks) > 100
+
+
+def test_teacher_daily_hours_count_double_booked_entries():
+    scheduler = _toy_scheduler()
+    section = scheduler.sections[1]
+    for room_id in (1, 2):  # Same teacher, same day and slot, two rooms
+        scheduler._place((room_id, "monday", 1), ScheduleSlot(
+            section_id=section.id, room_id=room_id, day_of_week="monday",
+            time_slot_id=1, teacher_id=section.teacher_id
+        ))
+
+    assert scheduler._get_teacher_daily_hours(section.teacher_id, "monday") == 2
+    assert scheduler._check_teacher_conflict(section.teacher_id, "monday", 1)
@@ -0,0 +1,27 @@
+from fastapi.testclient import TestClient
+
+import main
+from database import SECTION_COLUMNS, SECTION_LIST_COLUMNS
+
+
+def _capture_columns(monkeypatch):
+    calls = []
+
+    async def fake_get_all_sections(department=None, columns=SECTION_COLUMNS, course_code=None):
+        calls.append(columns)
+        return []
+
+    monkeypatch.setattr(main, "get_all_sections", fake_get_all_sections)
+    return calls
+
+
+def test_list_sections_defaults_to_full_embeds(monkeypatch):
+    calls = _capture_columns(monkeypatch)
+    assert TestClient(main.app).get("/api/sections").status_code == 200
+    assert calls == [SECTION_COLUMNS]
+
+
+def test_list_sections_summary_is_opt_in(monkeypatch):
+    calls = _capture_columns(monkeypatch)
+    assert TestClient(main.app).get("/api/sections", params={"fields": "summary"}).status_code == 200
+    assert calls == [SECTION_LIST_COLUMNS]
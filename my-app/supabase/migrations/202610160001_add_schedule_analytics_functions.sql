@@ -0,0 +1,45 @@
+-- Server-side aggregates for the backend analytics endpoints
+-- (get_room_utilization / get_teacher_workload), so they read one row per
+-- room or teacher instead of every allocation in the schedule.
+-- Ids are returned as text so callers can match them regardless of column type.
+
+create or replace function public.room_utilization(p_schedule_id bigint)
+returns table (room_id text, used_slots bigint)
+language sql
+stable
+as $$
+  select ra.room_id::text, count(*)
+  from public.room_allocations ra
+  where ra.schedule_id = p_schedule_id
+  group by ra.room_id;
+$$;
+
+create or replace function public.teacher_workload(p_schedule_id bigint)
+returns table (teacher_id text, entry_count bigint, sections_count bigint, days_working text[])
+language sql
+stable
+as $$
+  with entries as (
+    select ra.id, ra.teacher_id, ra.section_id,
+           coalesce(nullif(ra.day_of_week, ''), ra.schedule_day) as day
+    from public.room_allocations ra
+    where ra.schedule_id = p_schedule_id
+  ),
+  first_days as (
+    select e.teacher_id, e.day, min(e.id) as first_id
+    from entries e
+    where e.day is not null
+    group by e.teacher_id, e.day
+  )
+  select e.teacher_id::text,
+         count(*),
+         count(distinct e.section_id),
+         coalesce(
+           (select array_agg(d.day order by d.first_id)
+            from first_days d
+            where d.teacher_id is not distinct from e.teacher_id),
+           '{}'
+         )
+  from entries e
+  group by e.teacher_id;
+$$;
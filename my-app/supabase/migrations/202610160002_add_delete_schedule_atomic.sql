@@ -0,0 +1,13 @@
+-- Deletes a generated schedule and its room allocations in one call and one
+-- transaction (used by the backend's delete_schedule), so a failure cannot
+-- leave allocations without their schedule.
+
+create or replace function public.delete_schedule_atomic(p_schedule_id bigint)
+returns void
+language plpgsql
+as $$
+begin
+  delete from public.room_allocations where schedule_id = p_schedule_id;
+  delete from public.generated_schedules where id = p_schedule_id;
+end;
+$$;
@@ -0,0 +1,11 @@
+-- Composite indexes for the backend's schedule reads and conflict checks.
+-- Both lead with schedule_id, so they also serve the per-schedule allocation
+-- fetch that builds the conflict index and the analytics functions.
+-- room_allocations has no time-slot id column (times live in schedule_time),
+-- so the keys stop at the day.
+
+create index if not exists idx_room_allocations_schedule_room_day
+  on public.room_allocations (schedule_id, room_id, schedule_day);
+
+create index if not exists idx_room_allocations_schedule_teacher_day
+  on public.room_allocations (schedule_id, teacher_id, schedule_day);
@@ -0,0 +1,46 @@
+-- Teacher workload now sums each allocation's real length instead of assuming
+-- 90 minutes per entry: sessions span a variable number of 30-minute slots.
+-- Minutes come from schedule_time ("HH:MM - HH:MM"); rows without a parseable
+-- range count as one 90-minute slot, matching the previous estimate.
+-- The return type changes, so the function has to be dropped first.
+
+drop function if exists public.teacher_workload(bigint);
+
+create or replace function public.teacher_workload(p_schedule_id bigint)
+returns table (teacher_id text, entry_count bigint, total_minutes bigint, sections_count bigint, days_working text[])
+language sql
+stable
+as $$
+  with entries as (
+    select ra.id, ra.teacher_id, ra.section_id,
+           coalesce(nullif(ra.day_of_week, ''), ra.schedule_day) as day,
+           case
+             when ra.schedule_time ~ '^\s*\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}\s*$'
+             then greatest(0, (
+               extract(epoch from (trim(split_part(ra.schedule_time, '-', 2))::time
+                                   - trim(split_part(ra.schedule_time, '-', 1))::time)) / 60
+             )::bigint)
+             else 90
+           end as minutes
+    from public.room_allocations ra
+    where ra.schedule_id = p_schedule_id
+  ),
+  first_days as (
+    select e.teacher_id, e.day, min(e.id) as first_id
+    from entries e
+    where e.day is not null
+    group by e.teacher_id, e.day
+  )
+  select e.teacher_id::text,
+         count(*),
+         sum(e.minutes)::bigint,
+         count(distinct e.section_id),
+         coalesce(
+           (select array_agg(d.day order by d.first_id)
+            from first_days d
+            where d.teacher_id is not distinct from e.teacher_id),
+           '{}'
+         )
+  from entries e
+  group by e.teacher_id;
+$$;
@@ -0,0 +1,51 @@
+-- Everything a database-backed schedule generation reads, in one round-trip:
+-- sections for the term (with their course and teacher embedded, like the
+-- PostgREST "*, courses(*), teachers(*)" select), the room feature requirements
+-- of those courses, rooms, faculty profiles and time slots.
+-- Used by get_scheduler_snapshot in the backend.
+
+create or replace function public.scheduler_snapshot(
+  p_semester text,
+  p_academic_year text,
+  p_department text default null
+)
+returns jsonb
+language sql
+stable
+as $$
+  with term_sections as (
+    select s.*
+    from public.sections s
+    where s.semester = p_semester
+      and s.academic_year = p_academic_year
+      and (p_department is null or s.department = p_department)
+  )
+  select jsonb_build_object(
+    'sections', coalesce((
+      select jsonb_agg(
+        to_jsonb(s)
+        || jsonb_build_object(
+             'courses', (select to_jsonb(c) from public.courses c where c.id = s.course_id),
+             'teachers', (select to_jsonb(t) from public.teachers t where t.id = s.teacher_id)
+           )
+      )
+      from term_sections s
+    ), '[]'::jsonb),
+    'requirements', coalesce((
+      select jsonb_agg(jsonb_build_object(
+        'course_id', r.course_id,
+        'is_mandatory', r.is_mandatory,
+        'notes', r.notes,
+        'feature_tags', jsonb_build_object('tag_name', ft.tag_name)
+      ))
+      from public.subject_room_requirements r
+      join public.feature_tags ft on ft.id = r.feature_tag_id
+      where r.course_id in (select course_id from term_sections)
+    ), '[]'::jsonb),
+    'rooms', coalesce((select jsonb_agg(to_jsonb(r)) from public.rooms r), '[]'::jsonb),
+    'teachers', coalesce((select jsonb_agg(to_jsonb(f)) from public.faculty_profiles f), '[]'::jsonb),
+    'time_slots', coalesce((
+      select jsonb_agg(to_jsonb(ts) order by ts.start_time) from public.time_slots ts
+    ), '[]'::jsonb)
+  );
+$$;
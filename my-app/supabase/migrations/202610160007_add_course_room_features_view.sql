@@ -0,0 +1,72 @@
+-- Room feature requirements per course, already split into lecture / lab
+-- buckets with the same rules as _apply_room_requirements in the backend:
+--   LEC  -> lecture only          LAB -> lab only
+--   BOTH -> lecture and lab       anything else (legacy rows) -> lab, and also
+--   lecture for the basic presentation/comfort features listed below.
+-- A plain view (not materialized) so edits made from the frontend are visible
+-- immediately without refresh triggers; it reads one small indexed table.
+-- scheduler_snapshot attaches these arrays to each section directly.
+
+create or replace view public.course_room_features as
+select r.course_id,
+       array_agg(ft.tag_name order by r.id) as all_features,
+       coalesce(array_agg(ft.tag_name order by r.id) filter (
+         where upper(coalesce(r.notes, '')) in ('LEC', 'BOTH')
+            or (upper(coalesce(r.notes, '')) not in ('LEC', 'BOTH', 'LAB')
+                and ft.tag_name in ('TV_Display', 'Projector', 'Whiteboard', 'Sound_System',
+                                    'Air_Conditioning', 'Accessibility', 'Podium', 'Smart_TV', 'Monitor'))
+       ), '{}') as lec_features,
+       coalesce(array_agg(ft.tag_name order by r.id) filter (
+         where upper(coalesce(r.notes, '')) <> 'LEC'
+       ), '{}') as lab_features
+from public.subject_room_requirements r
+join public.feature_tags ft on ft.id = r.feature_tag_id
+where coalesce(ft.tag_name, '') <> ''
+group by r.course_id;
+
+create or replace function public.scheduler_snapshot(
+  p_semester text,
+  p_academic_year text,
+  p_department text default null
+)
+returns jsonb
+language sql
+stable
+as $$
+  with term_sections as (
+    select s.*
+    from public.sections s
+    where s.semester = p_semester
+      and s.academic_year = p_academic_year
+      and (p_department is null or s.department = p_department)
+  )
+  select jsonb_build_object(
+    'sections', coalesce((
+      select jsonb_agg(
+        to_jsonb(s)
+        || jsonb_build_object(
+             'courses', (
+               select jsonb_build_object('department', c.department, 'college', c.college)
+               from public.courses c
+               where c.id = s.course_id
+             )
+           )
+        || case
+             when f.course_id is null then '{}'::jsonb
+             else jsonb_build_object(
+               'required_features', f.all_features,
+               'lec_required_features', f.lec_features,
+               'lab_required_features', f.lab_features
+             )
+           end
+      )
+      from term_sections s
+      left join public.course_room_features f on f.course_id = s.course_id
+    ), '[]'::jsonb),
+    'rooms', coalesce((select jsonb_agg(to_jsonb(r)) from public.rooms r), '[]'::jsonb),
+    'teachers', coalesce((select jsonb_agg(to_jsonb(f)) from public.faculty_profiles f), '[]'::jsonb),
+    'time_slots', coalesce((
+      select jsonb_agg(to_jsonb(ts) order by ts.start_time) from public.time_slots ts
+    ), '[]'::jsonb)
+  );
+$$;
@@ -0,0 +1,30 @@
+-- Deleting a generated schedule removes its allocations in the same statement.
+-- delete_generated_schedule in the backend relies on this; delete_schedule uses
+-- delete_schedule_atomic, which stays correct either way.
+-- Replaces whatever foreign key currently links room_allocations.schedule_id to
+-- generated_schedules (its name varies between environments). NOT VALID skips
+-- re-checking existing rows, so legacy orphans don't block the migration.
+
+do $$
+declare
+  fk record;
+begin
+  for fk in
+    select con.conname
+    from pg_constraint con
+    join pg_attribute att
+      on att.attrelid = con.conrelid and att.attnum = any (con.conkey)
+    where con.contype = 'f'
+      and con.conrelid = 'public.room_allocations'::regclass
+      and con.confrelid = 'public.generated_schedules'::regclass
+      and att.attname = 'schedule_id'
+  loop
+    execute format('alter table public.room_allocations drop constraint %I', fk.conname);
+  end loop;
+
+  alter table public.room_allocations
+    add constraint room_allocations_schedule_id_fkey
+    foreign key (schedule_id) references public.generated_schedules (id)
+    on delete cascade
+    not valid;
+end $$;